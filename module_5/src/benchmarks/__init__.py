@@ -0,0 +1 @@
+"""Local benchmarking tools for the GradCafe scraping pipeline."""
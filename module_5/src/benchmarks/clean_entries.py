@@ -0,0 +1,526 @@
+"""Measure how ``Cleaner`` scales and which of its field helpers cost the most.
+
+Example::
+
+    python -m benchmarks.clean_entries --entries 10000 100000 1000000 --json clean.json
+
+For each corpus size the suite times every per-field helper (``_parse_status``,
+``_extract_term``, ``_extract_origin``, ``_extract_gpa``, ``_extract_gre``,
+``_extract_gre_aw`` and ``_normalise_degree``) on the inputs
+``normalise_entry`` gives it, bypassing the field caches so the regex work is
+what gets measured. It then times a full ``Cleaner.clean_data`` pass (again on
+a process pool when ``--workers`` is given), starting each pass with empty
+field caches; ``--field-cache-size 0`` turns them off.
+
+The synthetic corpus mixes the metadata badges, comment styles and decision
+strings seen on the survey. The term, origin, GPA and GRE fields are also
+extracted three ways with identical results: ``re.search`` on pattern strings
+(the old ``Cleaner``), the compiled patterns ``Cleaner`` uses now, and one
+lookahead alternation that scans the text once.
+
+``--json`` writes every timing with the commit and Python version, so runs
+can be compared across commits.
+"""
+
+import argparse
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from benchmarks.replay_server import PROGRAMS, UNIVERSITIES
+from homework_sample_code.course_app import clean
+from homework_sample_code.course_app.records import RawEntry
+
+
+COMMENT_TEMPLATES = (
+    "",
+    "",
+    "Got the email this morning!",
+    "GRE: {gre} (V: {verbal}) AW {aw}",
+    "GRE {gre}, {verbal} V, AWA {aw}. Undergrad GPA: {gpa}",
+    "Verbal {verbal}, Analytical Writing {aw}. Funded offer.",
+    "International student, applied for Spring {year} as well.",
+)
+DECISIONS = ("Accepted", "Rejected", "Interview", "Wait listed", "Waitlisted", "Withdrawn")
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Dec")
+
+
+def _status(rng: random.Random) -> str:
+    """Return a decision string such as ``"Accepted on 12 Mar"``.
+
+    :param random.Random rng: Source of randomness.
+    :return: Decision, usually followed by its date.
+    :rtype: str
+    """
+
+    decision = rng.choice(DECISIONS)
+    if rng.random() < 0.1:
+        return decision
+    return f"{decision} on {rng.randint(1, 28)} {rng.choice(MONTHS)}"
+
+
+def generate_raw_entries(count: int, seed: int = 0) -> List[RawEntry]:
+    """Build a reproducible corpus of raw entries shaped like scraper output.
+
+    :param int count: Number of entries to generate.
+    :param int seed: Seed that makes the corpus reproducible.
+    :return: Raw entries with varied metadata and comments.
+    :rtype: list[RawEntry]
+    """
+
+    rng = random.Random(seed)
+    entries: List[RawEntry] = []
+    for index in range(count):
+        program, degree = rng.choice(PROGRAMS)
+        scores = {
+            "gre": rng.randint(300, 340),
+            "verbal": rng.randint(145, 170),
+            "aw": rng.choice(("3.5", "4.0", "4.5", "5", "5.5")),
+            "gpa": f"{rng.uniform(2.8, 4.0):.2f}",
+            "year": rng.choice((2025, 2026)),
+        }
+        badges = [f"{rng.choice(('Fall', 'Spring', 'fall'))} {scores['year']}"]
+        badges.append(rng.choice(("American", "International", "Other")))
+        if rng.random() < 0.7:
+            badges.append(f"GPA {scores['gpa']}")
+        if rng.random() < 0.4:
+            badges.extend((f"GRE {scores['gre']}", f"GRE V {scores['verbal']}"))
+        if rng.random() < 0.2:
+            badges.append(f"GRE AW {scores['aw']}")
+        entries.append(
+            RawEntry(
+                university_raw=rng.choice(UNIVERSITIES),
+                program_raw=f"{program} {degree}" if rng.random() < 0.3 else program,
+                degree_raw="" if rng.random() < 0.3 else degree,
+                status_raw=_status(rng),
+                date_added_raw=f"September {rng.randint(1, 28)}, 2025",
+                url_raw=f"https://www.thegradcafe.com/result/{index}",
+                meta_raw=" | ".join(badges),
+                comments_raw=rng.choice(COMMENT_TEMPLATES).format(**scores),
+            )
+        )
+    return entries
+
+
+TextFields = Tuple[str, str, str, str, str, str]
+
+# Pattern name -> compiled pattern, in the order the fields are reported.
+FIELD_PATTERNS = {
+    # pylint: disable=protected-access
+    "term": clean._TERM_RE,
+    "american": clean._AMERICAN_RE,
+    "international": clean._INTERNATIONAL_RE,
+    "gpa": clean._GPA_RE,
+    "gre": clean._GRE_RE,
+    "verbal": clean._VERBAL_RE,
+    "verbal_suffix": clean._VERBAL_SUFFIX_RE,
+    "aw": clean._AW_RE,
+}
+# Zero-width lookahead, so one ``finditer`` also reports overlapping matches.
+# No two patterns can match at the same position, so each is seen.
+ONE_ALTERNATION = re.compile(
+    "(?=" + "|".join(f"(?P<{name}_hit>{regex.pattern})" for name, regex in FIELD_PATTERNS.items())
+    + ")",
+    re.I,
+)
+
+
+def _entry_text(raw_entry: RawEntry) -> Tuple[str, str]:
+    """Return the cleaned comments and raw metadata the extractors read.
+
+    :param RawEntry raw_entry: Raw entry to read.
+    :return: ``(comments, meta)`` as ``Cleaner.normalise_entry`` prepares them.
+    :rtype: tuple[str, str]
+    """
+
+    # pylint: disable=protected-access
+    comments = clean._clean_text(clean._raw_field(raw_entry, "comments_raw"))
+    return comments, clean._raw_field(raw_entry, "meta_raw")
+
+
+def fields_with_string_patterns(comments: str, meta: str) -> TextFields:
+    """Extract the text fields with ``re.search`` on pattern strings.
+
+    This is how ``Cleaner`` worked before its patterns were compiled at import:
+    every search looks the pattern up in the ``re`` module's cache.
+
+    :param str comments: Cleaned comment text.
+    :param str meta: Raw metadata text.
+    :return: Term, origin, GPA, GRE, GRE V and GRE AW.
+    :rtype: tuple[str, ...]
+    """
+
+    def search(name: str, text: str) -> Optional[re.Match]:
+        return re.search(FIELD_PATTERNS[name].pattern, text, re.I) if text else None
+
+    combined = f"{comments} {meta}".strip()
+    term = search("term", meta)
+    if search("american", meta):
+        origin = "American"
+    else:
+        origin = "International" if search("international", meta) else ""
+    gpa = search("gpa", meta) or search("gpa", combined)
+    gre = search("gre", combined)
+    verbal = search("verbal", combined)
+    suffix = None if verbal else search("verbal_suffix", combined)
+    aw = search("aw", combined)
+    return (
+        f"{term['season'].title()} {term['year']}" if term else "",
+        origin,
+        gpa["gpa"] if gpa else "",
+        gre["gre"] if gre else "",
+        verbal["verbal"] if verbal else (suffix["verbal_suffix"] if suffix else ""),
+        aw["aw"] if aw else "",
+    )
+
+
+def fields_with_compiled_patterns(comments: str, meta: str) -> TextFields:
+    """Extract the text fields with the helpers ``Cleaner`` uses.
+
+    :param str comments: Cleaned comment text.
+    :param str meta: Raw metadata text.
+    :return: Term, origin, GPA, GRE, GRE V and GRE AW.
+    :rtype: tuple[str, ...]
+    """
+
+    # pylint: disable=protected-access
+    combined = f"{comments} {meta}".strip()
+    gre, gre_verbal = clean._extract_gre(combined)
+    return (
+        clean._extract_term(meta),
+        clean._extract_origin(meta),
+        clean._extract_gpa(meta) or clean._extract_gpa(combined),
+        gre,
+        gre_verbal,
+        clean._extract_gre_aw(combined),
+    )
+
+
+def fields_with_one_alternation(comments: str, meta: str) -> TextFields:
+    """Extract the text fields with a single scan of the combined text.
+
+    The first match of each pattern is kept; matches that start inside the
+    metadata part stand in for the searches that only look at ``meta``.
+
+    :param str comments: Cleaned comment text.
+    :param str meta: Raw metadata text.
+    :return: Term, origin, GPA, GRE, GRE V and GRE AW.
+    :rtype: tuple[str, ...]
+    """
+
+    combined = f"{comments} {meta}".strip()
+    meta_start = len(comments) + 1 if comments else 0
+    first: Dict[str, re.Match] = {}
+    first_in_meta: Dict[str, re.Match] = {}
+    for match in ONE_ALTERNATION.finditer(combined):
+        name = match.lastgroup[: -len("_hit")]
+        first.setdefault(name, match)
+        if match.start() >= meta_start:
+            first_in_meta.setdefault(name, match)
+
+    term = first_in_meta.get("term")
+    gpa = first_in_meta.get("gpa") or first.get("gpa")
+    verbal = first.get("verbal") or first.get("verbal_suffix")
+    if "american" in first_in_meta:
+        origin = "American"
+    else:
+        origin = "International" if "international" in first_in_meta else ""
+    return (
+        f"{term['season'].title()} {term['year']}" if term else "",
+        origin,
+        gpa["gpa"] if gpa else "",
+        first["gre"]["gre"] if "gre" in first else "",
+        (verbal["verbal"] or verbal["verbal_suffix"]) if verbal else "",
+        first["aw"]["aw"] if "aw" in first else "",
+    )
+
+
+EXTRACTORS: Dict[str, Callable[[str, str], TextFields]] = {
+    "string patterns": fields_with_string_patterns,
+    "compiled patterns": fields_with_compiled_patterns,
+    "one alternation": fields_with_one_alternation,
+}
+
+
+class CleanTiming(NamedTuple):
+    """Time taken by one cleaning strategy over the whole corpus."""
+
+    strategy: str
+    entries: int
+    seconds: float
+
+    @property
+    def entries_per_second(self) -> float:
+        """Cleaning throughput.
+
+        :return: Entries cleaned per second.
+        :rtype: float
+        """
+
+        return self.entries / self.seconds if self.seconds else 0.0
+
+
+def time_cleaning(
+    strategy: str,
+    extract: Callable[[str, str], TextFields],
+    entries: Sequence[RawEntry],
+    repeat: int = 3,
+) -> CleanTiming:
+    """Extract the text fields of ``entries`` ``repeat`` times; keep the fastest pass.
+
+    :param str strategy: Label used in the report.
+    :param Callable extract: Function mapping ``(comments, meta)`` to the fields.
+    :param Sequence entries: Raw entries to read.
+    :param int repeat: Number of passes over ``entries``.
+    :return: Duration of the fastest pass.
+    :rtype: CleanTiming
+    """
+
+    texts = [_entry_text(entry) for entry in entries]
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        clean.clear_field_cache()
+        started = time.perf_counter()
+        for comments, meta in texts:
+            extract(comments, meta)
+        best = min(best, time.perf_counter() - started)
+    return CleanTiming(strategy, len(entries), best)
+
+
+def time_clean_data(entries: Sequence[RawEntry], repeat: int = 3, workers: int = 1) -> CleanTiming:
+    """Time ``Cleaner.clean_data`` over ``entries``; keep the fastest pass.
+
+    :param Sequence entries: Raw entries to clean.
+    :param int repeat: Number of passes over ``entries``.
+    :param int workers: Worker processes passed to ``clean_data``.
+    :return: Duration of the fastest pass.
+    :rtype: CleanTiming
+    """
+
+    cleaner = clean.Cleaner(entries)
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        clean.clear_field_cache()
+        started = time.perf_counter()
+        cleaner.clean_data(workers, min_parallel_entries=1)
+        best = min(best, time.perf_counter() - started)
+    label = "Cleaner.clean_data" + (f" x{workers}" if workers > 1 else "")
+    return CleanTiming(label, len(entries), best)
+
+
+def helper_calls(entries: Sequence[RawEntry]) -> Dict[str, Tuple[Callable, List[tuple]]]:
+    """Collect the arguments ``normalise_entry`` passes to each field helper.
+
+    Memoized helpers are returned unwrapped, so timing them measures the
+    parsing itself rather than cache lookups.
+
+    :param Sequence entries: Raw entries to read.
+    :return: ``(helper, argument tuples)`` keyed by helper name.
+    :rtype: dict[str, tuple[Callable, list[tuple]]]
+    """
+
+    # pylint: disable=protected-access
+    texts = [_entry_text(entry) for entry in entries]
+    metas = [(meta,) for _, meta in texts]
+    combined = [(f"{comments} {meta}".strip(),) for comments, meta in texts]
+    gpa_fallbacks = [text for text, (meta,) in zip(combined, metas) if not clean._extract_gpa(meta)]
+    helpers = {
+        "_parse_status": (
+            clean._parse_status,
+            [(clean._raw_field(entry, "status_raw"),) for entry in entries],
+        ),
+        "_extract_term": (clean._extract_term, metas),
+        "_extract_origin": (clean._extract_origin, metas),
+        "_extract_gpa": (clean._extract_gpa, metas + gpa_fallbacks),
+        "_extract_gre": (clean._extract_gre, combined),
+        "_extract_gre_aw": (clean._extract_gre_aw, combined),
+        "_normalise_degree": (
+            clean._normalise_degree,
+            [(clean._raw_field(entry, "program_raw"), clean._raw_field(entry, "degree_raw"))
+             for entry in entries],
+        ),
+    }
+    return {
+        name: (getattr(helper, "__wrapped__", helper), calls)
+        for name, (helper, calls) in helpers.items()
+    }
+
+
+def time_helper(
+    name: str,
+    helper: Callable,
+    calls: Sequence[tuple],
+    entries: int,
+    repeat: int = 3,
+) -> CleanTiming:
+    """Call ``helper`` with every argument tuple; keep the fastest pass.
+
+    :param str name: Helper name used in the report.
+    :param Callable helper: Field helper to time.
+    :param Sequence calls: Argument tuples, one or more per entry.
+    :param int entries: Number of entries the calls were collected from.
+    :param int repeat: Number of passes over ``calls``.
+    :return: Duration of the fastest pass.
+    :rtype: CleanTiming
+    """
+
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        for args in calls:
+            helper(*args)
+        best = min(best, time.perf_counter() - started)
+    return CleanTiming(name, entries, best)
+
+
+def run_suite(
+    entries: Sequence[RawEntry],
+    repeat: int = 3,
+    workers: int = 1,
+) -> List[CleanTiming]:
+    """Time the field helpers, the extraction strategies and ``clean_data``.
+
+    :param Sequence entries: Raw entries to clean.
+    :param int repeat: Passes per measurement; the fastest is kept.
+    :param int workers: Also time ``clean_data`` on this many processes.
+    :return: Timings in report order.
+    :rtype: list[CleanTiming]
+    """
+
+    timings = [
+        time_helper(name, helper, calls, len(entries), repeat)
+        for name, (helper, calls) in helper_calls(entries).items()
+    ]
+    timings.extend(
+        time_cleaning(strategy, extract, entries, repeat)
+        for strategy, extract in EXTRACTORS.items()
+    )
+    timings.append(time_clean_data(entries, repeat))
+    if workers > 1:
+        timings.append(time_clean_data(entries, repeat, workers))
+    return timings
+
+
+def _git_commit() -> str:
+    """Return the current commit hash, or ``""`` outside a git checkout.
+
+    :return: Abbreviated commit hash.
+    :rtype: str
+    """
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=False,
+            cwd=Path(__file__).resolve().parent,
+            text=True,
+        )
+    except OSError:
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def results_json(timings: Sequence[CleanTiming], options: argparse.Namespace) -> Dict[str, Any]:
+    """Build the JSON document written by ``--json``.
+
+    :param Sequence timings: Results from :func:`run_suite` for every size.
+    :param argparse.Namespace options: Options the suite ran with.
+    :return: Run metadata plus one result per size and strategy.
+    :rtype: dict
+    """
+
+    return {
+        "benchmark": "clean_entries",
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "seed": options.seed,
+        "repeat": options.repeat,
+        "field_cache_size": options.field_cache_size,
+        "results": [
+            {
+                "strategy": timing.strategy,
+                "entries": timing.entries,
+                "seconds": round(timing.seconds, 6),
+                "entries_per_second": round(timing.entries_per_second, 1),
+                "us_per_entry": round(timing.seconds * 1e6 / max(1, timing.entries), 3),
+            }
+            for timing in timings
+        ],
+    }
+
+
+def format_report(timings: Sequence[CleanTiming]) -> str:
+    """Render cleaning timings as a fixed-width table.
+
+    :param Sequence timings: Results from :func:`time_cleaning`.
+    :return: Table with one line per strategy.
+    :rtype: str
+    """
+
+    lines = [f"{'strategy':<22}{'seconds':>10}{'entries/s':>12}{'us/entry':>10}"]
+    for timing in timings:
+        lines.append(
+            f"{timing.strategy:<22}{timing.seconds:>10.3f}{timing.entries_per_second:>12.0f}"
+            f"{timing.seconds * 1e6 / max(1, timing.entries):>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for the cleaning benchmark.
+
+    :param Sequence argv: Arguments to parse; defaults to ``sys.argv[1:]``.
+    :return: Parsed options.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark cleaning raw entries.")
+    parser.add_argument("--entries", type=int, nargs="+", default=[100_000],
+                        help="corpus sizes to benchmark, e.g. 10000 100000 1000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--field-cache-size", type=int, default=clean.DEFAULT_FIELD_CACHE_SIZE,
+                        help="inputs memoized per field parser (0 disables)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="also time clean_data on this many worker processes")
+    parser.add_argument("--json", help="write results as JSON to this file ('-' for stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> List[CleanTiming]:
+    """Run the cleaning suite for every requested corpus size.
+
+    :param Sequence argv: Command-line arguments; defaults to ``sys.argv[1:]``.
+    :return: Timings for every size, in the order they were printed.
+    :rtype: list[CleanTiming]
+    """
+
+    options = _parse_args(argv)
+    clean.configure_field_cache(options.field_cache_size)
+    report = sys.stderr if options.json == "-" else sys.stdout
+    timings: List[CleanTiming] = []
+    for size in options.entries:
+        entries = generate_raw_entries(size, options.seed)
+        size_timings = run_suite(entries, options.repeat, options.workers)
+        timings.extend(size_timings)
+        print(f"Cleaned {len(entries)} entries, best of {options.repeat} passes.", file=report)
+        print(format_report(size_timings), file=report)
+        print(clean.field_cache_summary(), file=report)
+
+    if options.json:
+        document = json.dumps(results_json(timings, options), indent=2)
+        if options.json == "-":
+            print(document)
+        else:
+            Path(options.json).write_text(document + "\n", encoding="utf-8")
+    return timings
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Measure how long ``Scraper`` takes to parse one survey page.
+
+Example::
+
+    python -m benchmarks.parse_pages --recorded ../tests/data --repeat 20
+
+Each page is parsed ``repeat`` times per backend. The report splits the
+per-page time into building the BeautifulSoup tree and classifying the table
+rows into entries, so changes to either step can be measured on their own.
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from benchmarks.replay_server import load_recorded_pages, render_page
+from homework_sample_code.course_app.scrape import PARSER_BACKENDS, Scraper
+
+
+class ParseTiming(NamedTuple):
+    """Average per-page parse timings for one backend configuration."""
+
+    parser: str
+    table_only: bool
+    pages: int
+    entries: int
+    build_ms: float
+    classify_ms: float
+
+    @property
+    def total_ms(self) -> float:
+        """Average milliseconds to turn one page of HTML into entries.
+
+        :return: Tree-building plus row-classification time.
+        :rtype: float
+        """
+
+        return self.build_ms + self.classify_ms
+
+
+def time_parsing(
+    pages: Sequence[str],
+    parser: str = "html.parser",
+    table_only: bool = False,
+    repeat: int = 5,
+) -> ParseTiming:
+    """Parse every page ``repeat`` times and average the time per page.
+
+    :param Sequence pages: Survey page HTML documents.
+    :param str parser: BeautifulSoup tree builder, one of ``PARSER_BACKENDS``.
+    :param bool table_only: Build only the ``<tbody>`` part of each page.
+    :param int repeat: Number of passes over ``pages``.
+    :return: Average build and classification time per page.
+    :rtype: ParseTiming
+    """
+
+    parse_only = SoupStrainer("tbody") if table_only else None
+    build_seconds = classify_seconds = 0.0
+    parsed = entries = 0
+
+    for _ in range(max(1, repeat)):
+        for html in pages:
+            started = time.perf_counter()
+            soup = BeautifulSoup(html, parser, parse_only=parse_only)
+            built = time.perf_counter()
+            page_entries = Scraper._classify_rows(  # pylint: disable=protected-access
+                Scraper._table_rows(soup)  # pylint: disable=protected-access
+            )
+            classify_seconds += time.perf_counter() - built
+            build_seconds += built - started
+            parsed += 1
+            entries += len(page_entries)
+
+    return ParseTiming(
+        parser=parser,
+        table_only=table_only,
+        pages=parsed,
+        entries=entries,
+        build_ms=build_seconds * 1000 / parsed if parsed else 0.0,
+        classify_ms=classify_seconds * 1000 / parsed if parsed else 0.0,
+    )
+
+
+def format_report(timings: Sequence[ParseTiming]) -> str:
+    """Render parse timings as a fixed-width table.
+
+    :param Sequence timings: Results from :func:`time_parsing`.
+    :return: Table with one line per backend configuration.
+    :rtype: str
+    """
+
+    lines = [f"{'backend':<26}{'build ms':>10}{'classify ms':>13}{'total ms':>10}"]
+    for timing in timings:
+        label = timing.parser + (" (table only)" if timing.table_only else "")
+        lines.append(
+            f"{label:<26}{timing.build_ms:>10.2f}{timing.classify_ms:>13.2f}"
+            f"{timing.total_ms:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for the parse benchmark.
+
+    :param Sequence argv: Arguments to parse; defaults to ``sys.argv[1:]``.
+    :return: Parsed options.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark survey page parsing.")
+    parser.add_argument("--recorded", type=Path, help="directory of saved survey *.html pages")
+    parser.add_argument("--pages", type=int, default=10, help="synthetic pages to generate")
+    parser.add_argument("--rows", type=int, default=20, help="entries per synthetic page")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, action="append",
+                        help="backend to time (repeatable; default: all)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> List[ParseTiming]:
+    """Time every requested backend, with and without table-only parsing.
+
+    :param Sequence argv: Command-line arguments; defaults to ``sys.argv[1:]``.
+    :return: Timings in the order they were printed.
+    :rtype: list[ParseTiming]
+    """
+
+    options = _parse_args(argv)
+    if options.recorded:
+        pages = load_recorded_pages(options.recorded)
+    else:
+        pages = [render_page(page, options.rows) for page in range(1, options.pages + 1)]
+
+    timings = [
+        time_parsing(pages, backend, table_only, options.repeat)
+        for backend in options.parser or PARSER_BACKENDS
+        for table_only in (False, True)
+    ]
+    print(f"Parsed {len(pages)} pages x {options.repeat} passes per backend.")
+    print(format_report(timings))
+    return timings
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+"""Local HTTP stand-in for the GradCafe survey so the scraper can be benchmarked.
+
+The server answers ``/survey/?page=N`` with either synthetic pages or recorded
+HTML files, in the same ``tbody tr`` layout the real site uses. Latency and a
+random error rate can be injected to mimic a slow or overloaded site. Pages
+past ``pages`` come back with an empty table, which is where the scraper stops.
+Like the real site, bodies are gzip-compressed for clients that accept it.
+"""
+
+import argparse
+import gzip
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional, Sequence
+from urllib.parse import parse_qs, urlsplit
+
+
+FIRST_RESULT_ID = 990000
+
+UNIVERSITIES = (
+    "Stanford University",
+    "Massachusetts Institute of Technology",
+    "University of California, Berkeley",
+    "Johns Hopkins University",
+    "Georgetown University",
+    "University of Michigan",
+    "Carnegie Mellon University",
+)
+PROGRAMS = (
+    ("Computer Science", "PhD"),
+    ("Economics", "PhD"),
+    ("Data Science", "Masters"),
+    ("Electrical Engineering", "MS"),
+    ("Public Health", "Masters"),
+    ("Creative Writing", "MFA"),
+)
+STATUSES = (
+    "Accepted on 3 Feb",
+    "Rejected on 12 Mar",
+    "Interview on 9 Jan",
+    "Wait listed on 14 Feb",
+)
+ORIGINS = ("American", "International", "Other")
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Admissions Results | GradCafe</title></head>
+<body>
+  <main>
+    <table class="tw-min-w-full">
+      <thead><tr><th>School</th><th>Program</th><th>Added On</th><th>Decision</th><th></th></tr></thead>
+      <tbody class="tw-divide-y tw-divide-gray-200">{rows}
+      </tbody>
+    </table>
+  </main>
+</body>
+</html>
+"""
+
+MAIN_ROW_TEMPLATE = """
+      <tr>
+        <td><div class="tw-flex"><div class="tw-font-medium tw-text-gray-900">{university}</div></div></td>
+        <td><div class="tw-text-gray-900"><span>{program}</span><svg viewBox="0 0 2 2"></svg><span>{degree}</span></div></td>
+        <td class="tw-hidden md:tw-table-cell">September {day}, 2025</td>
+        <td class="tw-hidden md:tw-table-cell"><div class="tw-inline-flex">{status}</div></td>
+        <td><div class="tw-flex"><a href="/result/{result_id}">See More</a><a href="#">Report</a></div></td>
+      </tr>"""
+
+META_ROW_TEMPLATE = """
+      <tr class="tw-border-none">
+        <td colspan="3"><div class="tw-flex tw-gap-2">{badges}</div></td>
+      </tr>"""
+
+COMMENT_ROW_TEMPLATE = """
+      <tr class="tw-border-none">
+        <td colspan="3"><p class="tw-text-gray-500">{comment}</p></td>
+      </tr>"""
+
+
+def render_page(page: int, rows: int = 20, seed: int = 0) -> str:
+    """Render a synthetic survey page whose result IDs decrease page by page.
+
+    :param int page: 1-based page number.
+    :param int rows: Number of applicant entries on the page.
+    :param int seed: Seed that makes the generated content reproducible.
+    :return: HTML document in the survey's ``tbody tr`` layout.
+    :rtype: str
+    """
+
+    rng = random.Random(seed * 1_000_003 + page)
+    body: List[str] = []
+    for offset in range(rows):
+        program, degree = rng.choice(PROGRAMS)
+        body.append(
+            MAIN_ROW_TEMPLATE.format(
+                university=rng.choice(UNIVERSITIES),
+                program=program,
+                degree=degree,
+                day=rng.randint(1, 28),
+                status=rng.choice(STATUSES),
+                result_id=FIRST_RESULT_ID - (page - 1) * rows - offset,
+            )
+        )
+        badges = [f"Fall {rng.choice((2025, 2026))}", rng.choice(ORIGINS)]
+        if rng.random() < 0.7:
+            badges.append(f"GPA {rng.uniform(2.8, 4.0):.2f}")
+        if rng.random() < 0.4:
+            badges.extend((f"GRE {rng.randint(300, 340)}", f"GRE V {rng.randint(145, 170)}"))
+        body.append(
+            META_ROW_TEMPLATE.format(
+                badges="".join(f'<div class="tw-inline-flex">{badge}</div>' for badge in badges)
+            )
+        )
+        if rng.random() < 0.5:
+            body.append(COMMENT_ROW_TEMPLATE.format(comment=f"Synthetic comment {page}-{offset}."))
+    return PAGE_TEMPLATE.format(rows="".join(body))
+
+
+def load_recorded_pages(directory: Path) -> List[str]:
+    """Read recorded survey pages (``*.html``) from ``directory`` in name order.
+
+    :param Path directory: Folder containing saved survey HTML files.
+    :return: Page bodies in the order they should be served.
+    :rtype: list[str]
+    :raises ValueError: If the directory holds no HTML files.
+    """
+
+    pages = [path.read_text(encoding="utf-8") for path in sorted(directory.glob("*.html"))]
+    if not pages:
+        raise ValueError(f"No recorded *.html pages found in {directory}.")
+    return pages
+
+
+class ReplayServer:  # pylint: disable=too-many-instance-attributes
+    """Threaded HTTP server that replays survey pages with injected faults."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pages: int = 50,
+        rows_per_page: int = 20,
+        *,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        recorded: Optional[Sequence[str]] = None,
+        seed: int = 0,
+        compress: bool = True,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Configure the replayed site.
+
+        :param int pages: Number of pages that contain entries.
+        :param int rows_per_page: Entries per synthetic page.
+        :param float latency: Seconds to wait before answering each request.
+        :param float error_rate: Probability (0-1) of answering with a 503.
+        :param Sequence recorded: Recorded page bodies served in rotation
+            instead of synthetic pages.
+        :param int seed: Seed for page content and error injection.
+        :param bool compress: Gzip bodies when the client accepts gzip.
+        :param str host: Interface to bind.
+        :param int port: Port to bind; ``0`` picks a free port.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.pages = pages
+        self.rows_per_page = rows_per_page
+        self.latency = latency
+        self.error_rate = error_rate
+        self.recorded = list(recorded or [])
+        self.seed = seed
+        self.compress = compress
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """Survey URL to pass to ``Scraper(url=...)``.
+
+        :return: Base URL of the replayed survey.
+        :rtype: str
+        """
+
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/survey/"
+
+    def start(self) -> "ReplayServer":
+        """Serve requests on a background thread.
+
+        :return: The running server.
+        :rtype: ReplayServer
+        """
+
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until :meth:`stop` is called.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the listening socket.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def page_body(self, page: int) -> str:
+        """Return the HTML served for ``page``.
+
+        :param int page: 1-based page number.
+        :return: Survey HTML; an empty table past the last page.
+        :rtype: str
+        """
+
+        if page < 1 or page > self.pages:
+            return PAGE_TEMPLATE.format(rows="")
+        if self.recorded:
+            return self.recorded[(page - 1) % len(self.recorded)]
+        return render_page(page, self.rows_per_page, self.seed)
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            return failed
+
+    def _make_handler(self):
+        server = self
+
+        class SurveyHandler(BaseHTTPRequestHandler):
+            """Answer survey page requests for the enclosing ``ReplayServer``."""
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Serve one survey page, a 404, or an injected 503."""
+
+                if server.latency:
+                    time.sleep(server.latency)
+
+                parts = urlsplit(self.path)
+                if parts.path.rstrip("/") != "/survey":
+                    self._send(404, b"not found")
+                    return
+                if server._should_fail():  # pylint: disable=protected-access
+                    self._send(503, b"unavailable")
+                    return
+
+                try:
+                    page = int(parse_qs(parts.query).get("page", ["1"])[0])
+                except ValueError:
+                    page = 1
+                body = server.page_body(page).encode("utf-8")
+                accepted = self.headers.get("Accept-Encoding", "")
+                if server.compress and "gzip" in accepted:
+                    self._send(200, gzip.compress(body), encoding="gzip")
+                else:
+                    self._send(200, body)
+
+            def _send(self, status: int, body: bytes, encoding: str = "") -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args) -> None:  # pylint: disable=arguments-differ
+                """Keep benchmark output free of per-request access logs."""
+
+        return SurveyHandler
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for a standalone replay server.
+
+    :param Sequence argv: Arguments to parse; defaults to ``sys.argv[1:]``.
+    :return: Parsed options.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="Replay GradCafe survey pages locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=20, help="entries per synthetic page")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 answers")
+    parser.add_argument("--recorded", type=Path, help="directory of saved survey *.html pages")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-compress", dest="compress", action="store_false",
+                        help="never gzip response bodies")
+    return parser.parse_args(argv)
+
+
+def build_server(options: argparse.Namespace, port: Optional[int] = None) -> ReplayServer:
+    """Create a :class:`ReplayServer` from parsed command-line options.
+
+    :param argparse.Namespace options: Options from a replay or benchmark parser.
+    :param int port: Port override; defaults to ``options.port``.
+    :return: Configured, not yet started, server.
+    :rtype: ReplayServer
+    """
+
+    recorded = load_recorded_pages(options.recorded) if options.recorded else None
+    return ReplayServer(
+        options.pages,
+        options.rows,
+        latency=options.latency,
+        error_rate=options.error_rate,
+        recorded=recorded,
+        seed=options.seed,
+        compress=options.compress,
+        host=options.host,
+        port=options.port if port is None else port,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the replay server in the foreground until interrupted.
+
+    :param Sequence argv: Command-line arguments; defaults to ``sys.argv[1:]``.
+    :return: ``None``
+    :rtype: None
+    """
+
+    server = build_server(_parse_args(argv))
+    print(f"Replaying {server.pages} survey pages at {server.url} (Ctrl+C to stop).")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
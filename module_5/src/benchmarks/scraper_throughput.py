@@ -0,0 +1,215 @@
+"""Measure ``Scraper`` throughput against a local replay of the survey.
+
+Example::
+
+    python -m benchmarks.scraper_throughput --pages 100 --latency 0.05 --prefetch 8
+
+The report lists pages and entries per second plus the time spent fetching
+and parsing. Fetch and parse seconds are summed over all threads, so with
+prefetching they can exceed the wall-clock time.
+"""
+
+import argparse
+import contextlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence
+
+from benchmarks.replay_server import build_server
+from homework_sample_code.course_app.fetch import AimdController, RetryPolicy
+from homework_sample_code.course_app.records import RawEntry
+from homework_sample_code.course_app.scrape import PARSER_BACKENDS, Scraper
+
+
+class BenchmarkResult(NamedTuple):
+    """Counters and timings collected from one benchmark run."""
+
+    pages: int
+    entries: int
+    elapsed: float
+    fetch_seconds: float
+    parse_seconds: float
+    retries: int
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    connections: int = 0
+    reused_connections: int = 0
+
+    @property
+    def pages_per_second(self) -> float:
+        """Pages fetched per wall-clock second.
+
+        :return: Page throughput.
+        :rtype: float
+        """
+
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def entries_per_second(self) -> float:
+        """Entries collected per wall-clock second.
+
+        :return: Entry throughput.
+        :rtype: float
+        """
+
+        return self.entries / self.elapsed if self.elapsed else 0.0
+
+
+class TimedScraper(Scraper):
+    """``Scraper`` that accumulates time spent in fetching and parsing."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Accept the same arguments as :class:`Scraper`.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        super().__init__(*args, **kwargs)
+        self.pages_fetched = 0
+        self.fetch_seconds = 0.0
+        self.parse_seconds = 0.0
+        self._timing_lock = threading.Lock()
+
+    def _get_html(self, url: str) -> Optional[str]:
+        started = time.perf_counter()
+        html = super()._get_html(url)
+        elapsed = time.perf_counter() - started
+        with self._timing_lock:
+            self.fetch_seconds += elapsed
+            self.pages_fetched += html is not None
+        return html
+
+    def _extract_raw_data(self, html: str) -> List[RawEntry]:
+        started = time.perf_counter()
+        entries = super()._extract_raw_data(html)
+        elapsed = time.perf_counter() - started
+        with self._timing_lock:
+            self.parse_seconds += elapsed
+        return entries
+
+
+def run_benchmark(url: str, max_entries: int = 30000, **scraper_options) -> BenchmarkResult:
+    """Scrape ``url`` once with a :class:`TimedScraper` and report the timings.
+
+    :param str url: Survey URL, normally a :class:`ReplayServer` address.
+    :param int max_entries: Entry limit passed to the scraper.
+    :param scraper_options: Extra keyword options for :class:`Scraper`.
+    :return: Collected counters and timings.
+    :rtype: BenchmarkResult
+    """
+
+    scraper = TimedScraper(url, max_entries, **scraper_options)
+    started = time.perf_counter()
+    try:
+        entries = sum(1 for _ in scraper.iter_entries())
+    finally:
+        scraper.close()
+    elapsed = time.perf_counter() - started
+    connections, reused = scraper.http.connection_counts()
+
+    return BenchmarkResult(
+        pages=scraper.pages_fetched,
+        entries=entries,
+        elapsed=elapsed,
+        fetch_seconds=scraper.fetch_seconds,
+        parse_seconds=scraper.parse_seconds,
+        retries=scraper.retries,
+        wire_bytes=scraper.http.stats.wire_bytes,
+        decoded_bytes=scraper.http.stats.decoded_bytes,
+        connections=connections,
+        reused_connections=reused,
+    )
+
+
+def format_report(result: BenchmarkResult) -> str:
+    """Render a benchmark result as a short plain-text report.
+
+    :param BenchmarkResult result: Result returned by :func:`run_benchmark`.
+    :return: Multi-line report.
+    :rtype: str
+    """
+
+    return "\n".join(
+        [
+            f"Pages:    {result.pages} in {result.elapsed:.2f}s "
+            f"({result.pages_per_second:.1f} pages/s)",
+            f"Entries:  {result.entries} ({result.entries_per_second:.1f} entries/s)",
+            f"Fetch:    {result.fetch_seconds:.2f}s",
+            f"Parse:    {result.parse_seconds:.2f}s",
+            f"Retries:  {result.retries}",
+            f"Bytes:    {result.wire_bytes} on the wire, {result.decoded_bytes} decoded",
+            f"Conns:    {result.connections} opened, {result.reused_connections} reused",
+        ]
+    )
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for the throughput benchmark.
+
+    :param Sequence argv: Arguments to parse; defaults to ``sys.argv[1:]``.
+    :return: Parsed options.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark Scraper throughput locally.")
+    site = parser.add_argument_group("replayed site")
+    site.add_argument("--url", help="scrape this survey URL instead of a local replay")
+    site.add_argument("--host", default="127.0.0.1")
+    site.add_argument("--port", type=int, default=0)
+    site.add_argument("--pages", type=int, default=50)
+    site.add_argument("--rows", type=int, default=20, help="entries per synthetic page")
+    site.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    site.add_argument("--error-rate", type=float, default=0.0, help="share of 503 answers")
+    site.add_argument("--recorded", type=Path, help="directory of saved survey *.html pages")
+    site.add_argument("--seed", type=int, default=0)
+    site.add_argument("--no-compress", dest="compress", action="store_false",
+                      help="serve uncompressed bodies")
+
+    scraper = parser.add_argument_group("scraper")
+    scraper.add_argument("--max-entries", type=int, default=30000)
+    scraper.add_argument("--prefetch", type=int, default=0)
+    scraper.add_argument("--adaptive", type=int, default=0, metavar="MAX",
+                         help="use AIMD concurrency with this many pages in flight at most")
+    scraper.add_argument("--parser", choices=PARSER_BACKENDS, default="html.parser")
+    scraper.add_argument("--table-only", action="store_true")
+    scraper.add_argument("--retry-delay", type=float, default=0.05,
+                         help="base backoff delay in seconds for retried requests")
+    parser.add_argument("--quiet", action="store_true", help="hide per-page scraper output")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> BenchmarkResult:
+    """Run the benchmark against a local replay server (or ``--url``) and print it.
+
+    :param Sequence argv: Command-line arguments; defaults to ``sys.argv[1:]``.
+    :return: The benchmark result that was printed.
+    :rtype: BenchmarkResult
+    """
+
+    options = _parse_args(argv)
+    scraper_options = {
+        "prefetch": options.prefetch,
+        "parser": options.parser,
+        "table_only": options.table_only,
+        "retry": RetryPolicy(base_delay=options.retry_delay),
+    }
+    if options.adaptive:
+        scraper_options["concurrency"] = AimdController(maximum=options.adaptive)
+
+    with contextlib.ExitStack() as stack:
+        url = options.url or stack.enter_context(build_server(options)).url
+        if options.quiet:
+            devnull = stack.enter_context(open(os.devnull, "w", encoding="utf-8"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        result = run_benchmark(url, options.max_entries, **scraper_options)
+
+    print(format_report(result))
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Compressed, chunked archive of every raw entry the scraper has produced."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Union
+
+from homework_sample_code.course_app.records import RAW_ENTRY_FIELDS, RawEntry
+
+
+ArchivePath = Union[str, Path]
+
+DEFAULT_CHUNK_ENTRIES = 5000
+MANIFEST_NAME = "manifest.json"
+
+
+def read_chunk(path: ArchivePath) -> List[RawEntry]:
+    """Read every raw entry stored in one archive chunk.
+
+    :param str | pathlib.Path path: Gzip-compressed JSON-lines chunk file.
+    :return: Raw entries in the order they were archived.
+    :rtype: list[RawEntry]
+    """
+
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        return [RawEntry(*json.loads(line)) for line in handle if line.strip()]
+
+
+class RawArchive:
+    """Append-only store of raw entries in gzip-compressed JSON-lines chunks.
+
+    Each line holds one entry as a JSON array ordered by ``RAW_ENTRY_FIELDS``.
+    New entries go into the newest chunk until it holds ``chunk_entries``
+    entries; appends add a gzip member to the chunk, so earlier data is never
+    rewritten. ``manifest.json`` lists the chunks and their entry counts.
+    """
+
+    def __init__(self, directory: ArchivePath, chunk_entries: int = DEFAULT_CHUNK_ENTRIES) -> None:
+        """Open (or prepare to create) the archive stored in ``directory``.
+
+        :param str | pathlib.Path directory: Folder holding the chunks and manifest.
+        :param int chunk_entries: Maximum number of entries per chunk.
+        :return: ``None``
+        :rtype: None
+        :raises ValueError: If the archive was written with different raw fields.
+        """
+
+        self.directory = Path(directory)
+        self.chunk_entries = max(1, chunk_entries)
+        self.chunks: List[Dict[str, Union[str, int]]] = []
+
+        manifest = self.directory / MANIFEST_NAME
+        if manifest.exists():
+            state = json.loads(manifest.read_text(encoding="utf-8"))
+            if tuple(state.get("fields", ())) != RAW_ENTRY_FIELDS:
+                raise ValueError(f"{manifest} was written with different raw entry fields.")
+            self.chunks = state.get("chunks", [])
+
+    @property
+    def entry_count(self) -> int:
+        """Total number of archived entries.
+
+        :return: Sum of the entry counts of all chunks.
+        :rtype: int
+        """
+
+        return sum(int(chunk["entries"]) for chunk in self.chunks)
+
+    def chunk_paths(self) -> List[Path]:
+        """Return the chunk files in the order they were written.
+
+        :return: Paths of every chunk listed in the manifest.
+        :rtype: list[pathlib.Path]
+        """
+
+        return [self.directory / str(chunk["file"]) for chunk in self.chunks]
+
+    def append(self, entries: Iterable[Mapping[str, str]]) -> int:
+        """Archive ``entries``, starting new chunks as the newest one fills up.
+
+        :param Iterable entries: Raw entries (``RawEntry`` or dictionaries).
+        :return: Number of entries archived.
+        :rtype: int
+        """
+
+        rows = [
+            json.dumps([entry.get(field, "") for field in RAW_ENTRY_FIELDS], ensure_ascii=False)
+            for entry in entries
+        ]
+        if not rows:
+            return 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        written = 0
+        while written < len(rows):
+            if not self.chunks or int(self.chunks[-1]["entries"]) >= self.chunk_entries:
+                name = f"raw-{len(self.chunks) + 1:06d}.jsonl.gz"
+                self.chunks.append({"file": name, "entries": 0})
+            chunk = self.chunks[-1]
+            room = self.chunk_entries - int(chunk["entries"])
+            batch = rows[written : written + room]
+            with gzip.open(self.directory / str(chunk["file"]), "at", encoding="utf-8",
+                           compresslevel=6) as handle:
+                handle.write("\n".join(batch) + "\n")
+            chunk["entries"] = int(chunk["entries"]) + len(batch)
+            written += len(batch)
+
+        self._save_manifest()
+        return written
+
+    def iter_entries(self) -> Iterator[RawEntry]:
+        """Yield every archived entry, oldest first.
+
+        :return: Iterator over raw entries.
+        :rtype: Iterator[RawEntry]
+        """
+
+        for path in self.chunk_paths():
+            yield from read_chunk(path)
+
+    def _save_manifest(self) -> None:
+        """Write the manifest atomically.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        state = {"fields": list(RAW_ENTRY_FIELDS), "chunks": self.chunks}
+        manifest = self.directory / MANIFEST_NAME
+        temporary = manifest.with_name(manifest.name + ".tmp")
+        temporary.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        os.replace(temporary, manifest)
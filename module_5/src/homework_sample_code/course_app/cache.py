@@ -0,0 +1,348 @@
+"""Persistent caches that let repeated scrapes skip unchanged work."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+
+CachePath = Union[str, Path]
+ParsedRows = List[Tuple[str, ...]]
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump whenever the scraper's parse output changes, so stored parses made by
+# the old code stop matching and pages are parsed again.
+PARSE_FORMAT_VERSION = 1
+
+
+def page_fingerprint(html: str) -> str:
+    """Return a BLAKE2 fingerprint of the results table in ``html``.
+
+    Only the text from the first ``<tbody`` to the last ``</tbody>`` is
+    hashed, so changes elsewhere on the page (ads, timestamps, scripts) do not
+    force a re-parse. Pages without a table body are hashed whole.
+
+    :param str html: Survey page HTML.
+    :return: Hex digest identifying the table content and parse format.
+    :rtype: str
+    """
+
+    start = html.find("<tbody")
+    end = html.rfind("</tbody>")
+    table = html[start : end + len("</tbody>")] if 0 <= start < end else html
+
+    digest = hashlib.blake2b(digest_size=16, person=b"gradcafe-parse")
+    digest.update(str(PARSE_FORMAT_VERSION).encode("ascii"))
+    digest.update(table.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+class CachedResponse(NamedTuple):
+    """Body and validators stored for a previously fetched URL."""
+
+    body: str
+    etag: str
+    last_modified: str
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the request headers that revalidate this response.
+
+        :return: ``If-None-Match``/``If-Modified-Since`` headers when known.
+        :rtype: dict[str, str]
+        """
+
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:  # pylint: disable=too-many-instance-attributes
+    """SQLite-backed HTTP response cache with LRU eviction and hit counters.
+
+    The database is opened lazily on first use and shared between fetch
+    threads, so a single cache can sit behind a prefetching scraper. It also
+    keeps the parsed entries of each page URL under the page's
+    :func:`page_fingerprint`, so a re-downloaded but unchanged page does not
+    have to be parsed again. Response bodies and parsed entries share the
+    ``max_bytes`` budget and are evicted together, least recently used first.
+    """
+
+    def __init__(self, path: CachePath, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Configure the cache location and size cap.
+
+        :param str | pathlib.Path path: SQLite file that stores cached responses.
+        :param int max_bytes: Maximum total size of response bodies and parsed
+            entries kept before evicting the least recently used ones.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.parse_hits = 0
+        self.parse_misses = 0
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the cache database, creating the schema on first use.
+
+        :return: Open SQLite connection shared across threads.
+        :rtype: sqlite3.Connection
+        """
+
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    etag TEXT NOT NULL,
+                    last_modified TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(parsed_pages)")}
+            if columns and "size" not in columns:
+                # Written before parsed entries counted toward max_bytes.
+                self._db.execute("DROP TABLE parsed_pages")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS parsed_pages (
+                    url TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    entries TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._db.commit()
+        return self._db
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for ``url`` and mark it as recently used.
+
+        :param str url: URL previously passed to :meth:`store`.
+        :return: Cached response, or ``None`` when the URL is not cached.
+        :rtype: CachedResponse | None
+        """
+
+        with self._lock:
+            db = self._connection()
+            row = db.execute(
+                "SELECT body, etag, last_modified FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE responses SET last_access = ? WHERE url = ?",
+                (time.time(), url),
+            )
+            db.commit()
+        return CachedResponse(*row)
+
+    def store(self, url: str, body: str, etag: str = "", last_modified: str = "") -> None:
+        """Save ``body`` for ``url`` when the server supplied validators.
+
+        Responses without an ``ETag`` or ``Last-Modified`` header cannot be
+        revalidated, so they are not kept.
+
+        :param str url: URL the body was fetched from.
+        :param str body: Decoded response body.
+        :param str etag: ``ETag`` response header, if any.
+        :param str last_modified: ``Last-Modified`` response header, if any.
+        :return: ``None``
+        :rtype: None
+        """
+
+        if not (etag or last_modified):
+            return
+
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            db = self._connection()
+            db.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (url, body, etag, last_modified, size, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (url, body, etag, last_modified, size, time.time()),
+            )
+            self._evict(db)
+            db.commit()
+
+    def get_parsed(self, url: str, fingerprint: str) -> Optional[ParsedRows]:
+        """Return the entries stored for ``url`` if its fingerprint still matches.
+
+        :param str url: Page URL the entries were parsed from.
+        :param str fingerprint: :func:`page_fingerprint` of the current page.
+        :return: Stored entry tuples, or ``None`` when the page must be parsed.
+        :rtype: list[tuple[str, ...]] | None
+        """
+
+        with self._lock:
+            db = self._connection()
+            row = db.execute(
+                "SELECT entries FROM parsed_pages WHERE url = ? AND fingerprint = ?",
+                (url, fingerprint),
+            ).fetchone()
+            if row is None:
+                self.parse_misses += 1
+                return None
+            self.parse_hits += 1
+            db.execute(
+                "UPDATE parsed_pages SET last_access = ? WHERE url = ?",
+                (time.time(), url),
+            )
+            db.commit()
+        return [tuple(entry) for entry in json.loads(row[0])]
+
+    def store_parsed(self, url: str, fingerprint: str, rows: Sequence[Tuple[str, ...]]) -> None:
+        """Remember the entries parsed from ``url`` under the page's fingerprint.
+
+        :param str url: Page URL the entries were parsed from.
+        :param str fingerprint: :func:`page_fingerprint` of the parsed page.
+        :param Sequence rows: Entry tuples ordered by ``RAW_ENTRY_FIELDS``.
+        :return: ``None``
+        :rtype: None
+        """
+
+        payload = json.dumps(list(rows), ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            db = self._connection()
+            db.execute(
+                """
+                INSERT OR REPLACE INTO parsed_pages
+                    (url, fingerprint, entries, size, last_access)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (url, fingerprint, payload, size, time.time()),
+            )
+            self._evict(db)
+            db.commit()
+
+    @staticmethod
+    def _stored_bytes(db: sqlite3.Connection) -> int:
+        """Sum the sizes of the stored response bodies and parsed entries.
+
+        :param sqlite3.Connection db: Open cache connection (lock held).
+        :return: Number of bytes counted against ``max_bytes``.
+        :rtype: int
+        """
+
+        return db.execute(
+            """
+            SELECT (SELECT COALESCE(SUM(size), 0) FROM responses)
+                 + (SELECT COALESCE(SUM(size), 0) FROM parsed_pages)
+            """
+        ).fetchone()[0]
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        """Delete least recently used responses and parses until under ``max_bytes``.
+
+        :param sqlite3.Connection db: Open cache connection (lock held).
+        :return: ``None``
+        :rtype: None
+        """
+
+        total = self._stored_bytes(db)
+        if total <= self.max_bytes:
+            return
+
+        victims: Dict[str, List[Tuple[str]]] = {"responses": [], "parsed_pages": []}
+        rows = db.execute(
+            """
+            SELECT 'responses', url, size, last_access FROM responses
+            UNION ALL
+            SELECT 'parsed_pages', url, size, last_access FROM parsed_pages
+            ORDER BY last_access
+            """
+        )
+        for table, url, size, _ in rows:
+            if total <= self.max_bytes:
+                break
+            victims[table].append((url,))
+            total -= size
+        db.executemany("DELETE FROM responses WHERE url = ?", victims["responses"])
+        db.executemany("DELETE FROM parsed_pages WHERE url = ?", victims["parsed_pages"])
+
+    def total_bytes(self) -> int:
+        """Return the combined size of all cached bodies and parsed entries.
+
+        :return: Number of bytes currently stored.
+        :rtype: int
+        """
+
+        with self._lock:
+            return self._stored_bytes(self._connection())
+
+    def record_hit(self) -> None:
+        """Count a response served from disk after a ``304 Not Modified``.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """Count a response that had to be downloaded in full.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        with self._lock:
+            self.misses += 1
+
+    def summary(self) -> str:
+        """Describe the hit/miss counters for end-of-scrape reporting.
+
+        :return: Human-readable cache summary line.
+        :rtype: str
+        """
+
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        summary = f"Response cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate)."
+        if self.parse_hits or self.parse_misses:
+            summary += f" Parsed pages: {self.parse_hits} reused, {self.parse_misses} parsed."
+        return summary
+
+    def close(self) -> None:
+        """Close the underlying database connection if it was opened.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,113 @@
+"""Sidecar checkpoints that let long scrapes resume after a failure."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Iterator, List, Mapping, Sequence, Tuple, Union
+
+
+CheckpointPath = Union[str, Path]
+CheckpointState = Tuple[int, List[dict]]
+CheckpointPage = Tuple[int, List[dict]]
+
+
+class ScrapeCheckpoint:
+    """Append-only JSON-lines record of the pages a scrape has completed.
+
+    Each line holds one completed page number and the entries collected from
+    it. Pages are buffered in memory and appended every ``every`` pages, so
+    writing a checkpoint costs time proportional to the new pages only.
+    """
+
+    def __init__(self, path: CheckpointPath, every: int = 10) -> None:
+        """Configure where and how often checkpoints are written.
+
+        :param str | pathlib.Path path: Sidecar file receiving checkpoint lines.
+        :param int every: Number of completed pages buffered between writes.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.path = Path(path)
+        self.every = max(1, every)
+        self._pending: List[str] = []
+
+    def record_page(self, page: int, entries: Sequence[Mapping[str, str]]) -> None:
+        """Buffer a completed page, writing to disk when the buffer is full.
+
+        :param int page: Page number that has been fully processed.
+        :param Sequence entries: Entries collected from that page.
+        :return: ``None``
+        :rtype: None
+        """
+
+        line = json.dumps(
+            {"page": page, "entries": [dict(entry) for entry in entries]},
+            ensure_ascii=False,
+        )
+        self._pending.append(line)
+        if len(self._pending) >= self.every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append any buffered pages to the checkpoint file.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        if not self._pending:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(self._pending) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._pending = []
+
+    def iter_pages(self) -> Iterator[CheckpointPage]:
+        """Yield recorded ``(page, entries)`` pairs one line at a time.
+
+        A truncated trailing line, left by a process killed mid-write, is
+        ignored together with anything after it.
+
+        :return: Iterator over completed pages and their entries.
+        :rtype: Iterator[tuple[int, list[dict]]]
+        """
+
+        if not self.path.exists():
+            return
+
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    return
+                yield record["page"], record["entries"]
+
+    def load(self) -> CheckpointState:
+        """Return the last completed page and every entry collected so far.
+
+        :return: Tuple of the last completed page (``0`` when none) and entries.
+        :rtype: tuple[int, list[dict]]
+        """
+
+        last_page = 0
+        entries: List[dict] = []
+        for last_page, page_entries in self.iter_pages():
+            entries.extend(page_entries)
+        return last_page, entries
+
+    def clear(self) -> None:
+        """Discard buffered pages and remove the checkpoint file.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        self._pending = []
+        self.path.unlink(missing_ok=True)
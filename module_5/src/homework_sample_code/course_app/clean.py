@@ -2,11 +2,65 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Iterable, List, Mapping
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
 
 
 StatusTuple = tuple[str, str]
+ColumnBatch = Dict[str, Union[np.ndarray, List[str]]]
+
+# Cleaned fields in the order ``Cleaner.normalise_entry`` emits them.
+CLEANED_FIELDS = (
+    "program",
+    "university",
+    "comments",
+    "date_added",
+    "url",
+    "status",
+    "status_date",
+    "term",
+    "US/International",
+    "GRE",
+    "GRE V",
+    "GRE AW",
+    "GPA",
+    "Degree",
+    "llm-generated-program",
+    "llm-generated-university",
+    "duplicate_cluster",
+)
+# Columns returned as float arrays by ``to_columns``, with NaN when missing.
+NUMERIC_FIELDS = ("GPA", "GRE", "GRE V", "GRE AW")
+# Columns with few distinct values; ``to_columns`` interns their strings.
+CATEGORICAL_FIELDS = ("program", "university", "status", "term", "US/International", "Degree")
+
+# Entries handed to a worker process at a time by ``Cleaner.clean_data``.
+DEFAULT_CLEAN_CHUNK_SIZE = 2000
+# Below this many entries ``clean_data`` stays serial: starting the worker
+# processes costs more than cleaning the entries on one core.
+MIN_PARALLEL_ENTRIES = 10_000
+# Most recent distinct inputs remembered by each memoized field parser.
+DEFAULT_FIELD_CACHE_SIZE = 4096
+
+# Compiled once at import so cleaning an entry does not go through the
+# ``re`` module's pattern cache for every field.
+_TERM_RE = re.compile(r"(?P<season>Fall|Spring|Summer|Winter)\s*(?P<year>\d{4})", re.I)
+_AMERICAN_RE = re.compile(r"\bAmerican\b", re.I)
+_INTERNATIONAL_RE = re.compile(r"\bInternational\b", re.I)
+_GPA_RE = re.compile(r"GPA\s*[:]*\s*(?P<gpa>[0-9]\.\d{1,2})", re.I)
+_GRE_RE = re.compile(r"\bGRE[:\s]*(?P<gre>[0-9]{3})\b", re.I)
+_VERBAL_RE = re.compile(r"(?:V[:\s]*|Verbal[:\s]*)(?P<verbal>[0-9]{2,3})", re.I)
+_VERBAL_SUFFIX_RE = re.compile(r"\b(?P<verbal_suffix>[0-9]{2,3})\s*V\b", re.I)
+_AW_RE = re.compile(r"(?:AW|AWA|Analytical Writing)[:\s]*(?P<aw>[0-9]\.?\d?)", re.I)
+_WAITLIST_RE = re.compile(r"wait\s*listed", re.I)
+_STATUS_RE = re.compile(r"\b(Accepted|Rejected|Waitlisted|Interview|Withdrawn)\b", re.I)
+_STATUS_DATE_RE = re.compile(r"on\s*([\w\d\s,]+)", re.I)
+_DEGREE_IN_PROGRAM_RE = re.compile(r"(Masters|PhD|MFA|MS|MA)\b", re.I)
 
 
 def _clean_text(value: str) -> str:
@@ -22,6 +76,7 @@ def _clean_text(value: str) -> str:
     return " ".join(value.split()).strip()
 
 
+@functools.lru_cache(maxsize=DEFAULT_FIELD_CACHE_SIZE)
 def _parse_status(status_raw: str) -> StatusTuple:
     """Split status strings into state and optional date components.
 
@@ -37,20 +92,17 @@ def _parse_status(status_raw: str) -> StatusTuple:
     if not status_raw:
         return "", ""
 
-    unified = re.sub(r"wait\s*listed", "Waitlisted", status_raw, flags=re.I)
-    status_match = re.search(
-        r"\b(Accepted|Rejected|Waitlisted|Interview|Withdrawn)\b",
-        unified,
-        re.I,
-    )
+    unified = _WAITLIST_RE.sub("Waitlisted", status_raw)
+    status_match = _STATUS_RE.search(unified)
     status = status_match.group(1).title() if status_match else unified
 
-    date_match = re.search(r"on\s*([\w\d\s,]+)", unified, re.I)
+    date_match = _STATUS_DATE_RE.search(unified)
     status_date = date_match.group(1).strip() if date_match else ""
 
     return status.strip(), status_date
 
 
+@functools.lru_cache(maxsize=DEFAULT_FIELD_CACHE_SIZE)
 def _extract_term(meta_text: str) -> str:
     """Identify the admission term when present.
 
@@ -62,8 +114,8 @@ def _extract_term(meta_text: str) -> str:
     if not meta_text:
         return ""
 
-    match = re.search(r"(Fall|Spring|Summer|Winter)\s*(\d{4})", meta_text, re.I)
-    return f"{match.group(1).title()} {match.group(2)}" if match else ""
+    match = _TERM_RE.search(meta_text)
+    return f"{match['season'].title()} {match['year']}" if match else ""
 
 
 def _extract_origin(meta_text: str) -> str:
@@ -77,9 +129,9 @@ def _extract_origin(meta_text: str) -> str:
     if not meta_text:
         return ""
 
-    if re.search(r"\bAmerican\b", meta_text, re.I):
+    if _AMERICAN_RE.search(meta_text):
         return "American"
-    if re.search(r"\bInternational\b", meta_text, re.I):
+    if _INTERNATIONAL_RE.search(meta_text):
         return "International"
     return ""
 
@@ -95,12 +147,8 @@ def _extract_gpa(text: str) -> str:
     if not text:
         return ""
 
-    match = re.search(r"GPA\s*[:]*\s*([0-9]\.\d{1,2})", text, re.I)
-    if match:
-        return match.group(1)
-
-    match = re.search(r"GPA\s*([0-9]\.\d{1,2})", text, re.I)
-    return match.group(1) if match else ""
+    match = _GPA_RE.search(text)
+    return match["gpa"] if match else ""
 
 
 def _extract_gre(text: str) -> StatusTuple:
@@ -114,19 +162,15 @@ def _extract_gre(text: str) -> StatusTuple:
     if not text:
         return "", ""
 
-    gre_total = ""
-    match = re.search(r"\bGRE[:\s]*([0-9]{3})\b", text, re.I)
-    if match:
-        gre_total = match.group(1)
+    match = _GRE_RE.search(text)
+    gre_total = match["gre"] if match else ""
 
-    gre_verbal = ""
-    match = re.search(r"(?:V[:\s]*|Verbal[:\s]*)([0-9]{2,3})", text, re.I)
+    match = _VERBAL_RE.search(text)
     if match:
-        gre_verbal = match.group(1)
+        gre_verbal = match["verbal"]
     else:
-        match = re.search(r"\b([0-9]{2,3})\s*V\b", text, re.I)
-        if match:
-            gre_verbal = match.group(1)
+        match = _VERBAL_SUFFIX_RE.search(text)
+        gre_verbal = match["verbal_suffix"] if match else ""
 
     return gre_total, gre_verbal
 
@@ -142,10 +186,11 @@ def _extract_gre_aw(text: str) -> str:
     if not text:
         return ""
 
-    match = re.search(r"(?:AW|AWA|Analytical Writing)[:\s]*([0-9]\.?\d?)", text, re.I)
-    return match.group(1) if match else ""
+    match = _AW_RE.search(text)
+    return match["aw"] if match else ""
 
 
+@functools.lru_cache(maxsize=DEFAULT_FIELD_CACHE_SIZE)
 def _normalise_degree(raw_program: str, raw_degree: str) -> str:
     """Return a title-cased degree string using program fallback when needed.
 
@@ -159,17 +204,141 @@ def _normalise_degree(raw_program: str, raw_degree: str) -> str:
     if degree:
         return degree.title()
 
-    match = re.search(r"(Masters|PhD|MFA|MS|MA)\b", raw_program, re.I)
+    match = _DEGREE_IN_PROGRAM_RE.search(raw_program)
     return match.group(1).title() if match else ""
 
 
+def configure_field_cache(maxsize: Optional[int] = DEFAULT_FIELD_CACHE_SIZE) -> None:
+    """Resize the caches of the memoized field parsers, clearing them.
+
+    ``_parse_status``, ``_normalise_degree`` and ``_extract_term`` are pure and
+    see few distinct inputs (status strings repeat across thousands of
+    entries), so each remembers its ``maxsize`` most recently used inputs.
+
+    :param int maxsize: Inputs kept per parser; ``0`` disables memoization and
+        ``None`` removes the bound.
+    :return: ``None``
+    :rtype: None
+    """
+
+    global _parse_status, _normalise_degree, _extract_term  # pylint: disable=global-statement
+    memoize = functools.lru_cache(maxsize=maxsize)
+    _parse_status = memoize(_parse_status.__wrapped__)
+    _normalise_degree = memoize(_normalise_degree.__wrapped__)
+    _extract_term = memoize(_extract_term.__wrapped__)
+
+
+def clear_field_cache() -> None:
+    """Empty the memoized field parsers' caches and reset their counters.
+
+    :return: ``None``
+    :rtype: None
+    """
+
+    for parser in (_parse_status, _normalise_degree, _extract_term):
+        parser.cache_clear()
+
+
+def field_cache_info() -> Dict[str, tuple]:
+    """Return hit, miss and size counters for each memoized field parser.
+
+    Counters cover this process only; entries cleaned by ``clean_data``
+    worker processes are not included.
+
+    :return: ``cache_info()`` named tuple of each parser, keyed by parser name.
+    :rtype: dict[str, tuple]
+    """
+
+    return {
+        parser.__wrapped__.__name__: parser.cache_info()
+        for parser in (_parse_status, _normalise_degree, _extract_term)
+    }
+
+
+def field_cache_summary() -> str:
+    """Summarise the memoized field parsers' hit rate.
+
+    :return: Human-readable summary line.
+    :rtype: str
+    """
+
+    infos = field_cache_info().values()
+    hits = sum(info.hits for info in infos)
+    misses = sum(info.misses for info in infos)
+    total = hits + misses
+    rate = (hits / total * 100) if total else 0.0
+    return f"Field cache: {hits} hits, {misses} misses ({rate:.1f}% hit rate)."
+
+
+def _raw_field(raw_entry: Mapping[str, str], key: str) -> str:
+    """Read one raw field as text, treating missing and ``None`` values as empty.
+
+    :param Mapping raw_entry: Raw entry, either a ``RawEntry`` or a dictionary.
+    :param str key: Raw field name such as ``"status_raw"``.
+    :return: Field value as a string.
+    :rtype: str
+    """
+
+    value = raw_entry.get(key, "")
+    return "" if value is None else str(value)
+
+
+def float_column(values: Sequence[Any]) -> np.ndarray:
+    """Convert numeric strings to a float array, using NaN for missing values.
+
+    :param Sequence values: Column values such as ``"3.80"``, ``""`` or ``None``.
+    :return: ``float64`` array; values that are not numbers become NaN.
+    :rtype: numpy.ndarray
+    """
+
+    text = np.array(["nan" if value in (None, "") else value for value in values], dtype=str)
+    try:
+        return text.astype(np.float64)
+    except ValueError:
+        pass
+
+    column = np.full(len(text), np.nan)
+    for index, value in enumerate(text):
+        try:
+            column[index] = float(value)
+        except ValueError:
+            continue
+    return column
+
+
+def to_columns(records: Sequence[Mapping[str, Any]]) -> ColumnBatch:
+    """Transpose cleaned records into one column per field.
+
+    ``NUMERIC_FIELDS`` become ``float64`` arrays with NaN for missing scores,
+    ``CATEGORICAL_FIELDS`` become lists of interned strings (so repeated
+    values share one object), and the other fields become lists of strings.
+    Missing and ``None`` values become ``""`` in the string columns.
+
+    :param Sequence records: Cleaned entries, e.g. from ``Cleaner.clean_data``.
+    :return: Columns keyed by ``CLEANED_FIELDS``, each ``len(records)`` long.
+    :rtype: dict[str, numpy.ndarray | list[str]]
+    """
+
+    columns: ColumnBatch = {}
+    for field in CLEANED_FIELDS:
+        values = [record.get(field) for record in records]
+        if field in NUMERIC_FIELDS:
+            columns[field] = float_column(values)
+        elif field in CATEGORICAL_FIELDS:
+            columns[field] = [sys.intern(str(value)) if value else "" for value in values]
+        else:
+            columns[field] = ["" if value is None else str(value) for value in values]
+    return columns
+
+
 class Cleaner:
     """Transform raw GradCafe scraper entries into structured applicant data."""
 
     def __init__(self, raw_data: Iterable[Mapping[str, str]]):
         """Initialise the cleaner with raw scraper data.
 
-        :param Iterable raw_data: Sequence of dictionaries produced by the scraper.
+        :param Iterable raw_data: Raw entries (``RawEntry`` or dictionaries)
+            produced by the scraper.
         """
         self.raw_data = list(raw_data)
 
@@ -182,24 +351,19 @@ class Cleaner:
         :rtype: dict
         """
 
-        normalised = {
-            key: ("" if value is None else str(value))
-            for key, value in raw_entry.items()
-        }
-
-        comments = _clean_text(normalised.get("comments_raw", ""))
-        meta = normalised.get("meta_raw", "")
+        comments = _clean_text(_raw_field(raw_entry, "comments_raw"))
+        meta = _raw_field(raw_entry, "meta_raw")
         combined_text = f"{comments} {meta}".strip()
 
-        status, status_date = _parse_status(normalised.get("status_raw", ""))
+        status, status_date = _parse_status(_raw_field(raw_entry, "status_raw"))
         gre_total, gre_verbal = _extract_gre(combined_text)
 
         return {
-            "program": _clean_text(normalised.get("program_raw", "")),
-            "university": _clean_text(normalised.get("university_raw", "")),
+            "program": _clean_text(_raw_field(raw_entry, "program_raw")),
+            "university": _clean_text(_raw_field(raw_entry, "university_raw")),
             "comments": comments,
-            "date_added": _clean_text(normalised.get("date_added_raw", "")),
-            "url": _clean_text(normalised.get("url_raw", "")),
+            "date_added": _clean_text(_raw_field(raw_entry, "date_added_raw")),
+            "url": _clean_text(_raw_field(raw_entry, "url_raw")),
             "status": status,
             "status_date": status_date,
             "term": _extract_term(meta),
@@ -209,18 +373,78 @@ class Cleaner:
             "GRE AW": _extract_gre_aw(combined_text),
             "GPA": _extract_gpa(meta) or _extract_gpa(combined_text),
             "Degree": _normalise_degree(
-                normalised.get("program_raw", ""),
-                normalised.get("degree_raw", ""),
+                _raw_field(raw_entry, "program_raw"),
+                _raw_field(raw_entry, "degree_raw"),
             ),
             "llm-generated-program": "",
             "llm-generated-university": "",
+            "duplicate_cluster": "",
         }
 
-    def clean_data(self) -> List[dict]:
+    def clean_data(
+        self,
+        workers: int = 1,
+        *,
+        chunk_size: int = DEFAULT_CLEAN_CHUNK_SIZE,
+        min_parallel_entries: int = MIN_PARALLEL_ENTRIES,
+    ) -> List[dict]:
         """Normalise raw entries into the application schema.
 
+        With ``workers`` above one and at least ``min_parallel_entries``
+        entries, ``raw_data`` is split into chunks of ``chunk_size`` that are
+        cleaned on a process pool; the results keep the input order.
+
+        :param int workers: Worker processes to use; ``1`` cleans serially.
+        :param int chunk_size: Entries sent to a worker at a time.
+        :param int min_parallel_entries: Smallest input cleaned in parallel.
         :return: List of cleaned applicant dictionaries.
         :rtype: list[dict]
         """
 
-        return [self.normalise_entry(entry) for entry in self.raw_data]
+        if workers <= 1 or len(self.raw_data) < max(1, min_parallel_entries):
+            return _normalise_chunk(self.raw_data)
+
+        chunk_size = max(1, chunk_size)
+        chunks = [
+            self.raw_data[start : start + chunk_size]
+            for start in range(0, len(self.raw_data), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            return [entry for chunk in pool.map(_normalise_chunk, chunks) for entry in chunk]
+
+    def clean_columns(
+        self,
+        workers: int = 1,
+        *,
+        chunk_size: int = DEFAULT_CLEAN_CHUNK_SIZE,
+        min_parallel_entries: int = MIN_PARALLEL_ENTRIES,
+    ) -> ColumnBatch:
+        """Normalise raw entries into a column batch instead of a list of dicts.
+
+        Takes the same options as :meth:`clean_data` and returns its result
+        transposed by :func:`to_columns`: GPA and GRE scores as ``float64``
+        arrays with NaN where missing, categorical fields as interned strings.
+
+        :param int workers: Worker processes to use; ``1`` cleans serially.
+        :param int chunk_size: Entries sent to a worker at a time.
+        :param int min_parallel_entries: Smallest input cleaned in parallel.
+        :return: Columns keyed by ``CLEANED_FIELDS``.
+        :rtype: dict[str, numpy.ndarray | list[str]]
+        """
+
+        return to_columns(
+            self.clean_data(
+                workers, chunk_size=chunk_size, min_parallel_entries=min_parallel_entries
+            )
+        )
+
+
+def _normalise_chunk(raw_entries: Sequence[Mapping[str, str]]) -> List[dict]:
+    """Clean a run of raw entries; runs in a worker process in ``clean_data``.
+
+    :param Sequence raw_entries: Raw entries to clean.
+    :return: Cleaned entries in input order.
+    :rtype: list[dict]
+    """
+
+    return [Cleaner.normalise_entry(entry) for entry in raw_entries]
@@ -0,0 +1,322 @@
+"""Find near-duplicate applicant records (spam and repeat submissions) with MinHash and LSH."""
+
+from __future__ import annotations
+
+import functools
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Sequence, Tuple
+
+import numpy as np
+
+
+DEFAULT_NUM_HASHES = 128
+DEFAULT_BANDS = 32
+DEFAULT_THRESHOLD = 0.8
+SHINGLE_SIZE = 5
+# Features (roughly one per comment byte) shingled together in one batch.
+FEATURE_BATCH = 2_000_000
+# Largest (num_hashes x features) uint64 array hashed at once.
+HASH_BATCH_BYTES = 64 * 1024 * 1024
+# Records whose comment is shorter than this are not compared: without a
+# comment, distinct applicants to the same program share every key field.
+MIN_COMMENT_CHARS = 20
+# Fields signed together with the comment, so the same comment posted for
+# different decisions or programs resembles, but does not equal, a repeat.
+KEY_FIELDS = ("university", "program", "Degree", "status", "term", "US/International",
+              "GPA", "GRE")
+CLUSTER_FIELD = "duplicate_cluster"
+
+_SHINGLE_WEIGHTS = np.array([257**power for power in range(SHINGLE_SIZE)], dtype=np.uint64)
+
+
+@functools.lru_cache(maxsize=4096)
+def _field_feature(field: str, value: str) -> int:
+    """Hash one ``field=value`` pair; key fields repeat across many records.
+
+    :param str field: Key field name.
+    :param str value: Lower-cased field value.
+    :return: 32-bit feature hash.
+    :rtype: int
+    """
+
+    return zlib.crc32(f"{field}={value}".encode("utf-8"))
+
+
+def batch_features(records: Sequence[Mapping[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the hashed features each record is signed on.
+
+    The lower-cased, whitespace-collapsed comment contributes a hash of every
+    ``SHINGLE_SIZE``-byte window; each key field contributes one
+    ``field=value`` feature, so the comment decides most of the similarity.
+    All comments of the batch are shingled in one pass over their
+    concatenated bytes, dropping the windows that span two comments. A
+    feature may repeat within a record, which does not change its minimums.
+
+    :param Sequence records: Cleaned applicant records.
+    :return: The features of all records, grouped by record, and the offset
+        at which each record's features start.
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+
+    comments = [" ".join(str(record.get("comments") or "").lower().split()).encode("utf-8")
+                for record in records]
+    lengths = np.array([len(comment) for comment in comments], dtype=np.int64)
+    data = np.frombuffer(b"".join(comments), dtype=np.uint8)
+    owners = np.repeat(np.arange(len(records)), lengths)[: max(len(data) - SHINGLE_SIZE + 1, 0)]
+    if len(owners):
+        shingles = np.zeros(len(owners), dtype=np.uint64)
+        for offset, weight in enumerate(_SHINGLE_WEIGHTS):
+            shingles += data[offset : offset + len(owners)] * weight
+        shingles &= np.uint64(0xFFFFFFFF)
+        ends = np.cumsum(lengths)
+        inside = np.arange(len(owners)) + SHINGLE_SIZE <= ends[owners]
+        shingles, owners = shingles[inside], owners[inside]
+    else:
+        shingles = np.empty(0, dtype=np.uint64)
+
+    fields = np.array(
+        [[_field_feature(field, str(record.get(field) or "").lower()) for field in KEY_FIELDS]
+         for record in records],
+        dtype=np.uint64,
+    ).reshape(len(records), len(KEY_FIELDS))
+    order = np.argsort(
+        np.concatenate([np.repeat(np.arange(len(records)), len(KEY_FIELDS)), owners]),
+        kind="stable",
+    )
+    features = np.concatenate([fields.ravel(), shingles])[order]
+    counts = np.bincount(owners, minlength=len(records)) + len(KEY_FIELDS)
+    return features, np.cumsum(counts) - counts
+
+
+def _record_batches(
+    records: Sequence[Mapping[str, Any]],
+    indexes: Sequence[int],
+) -> Iterator[List[int]]:
+    """Split ``indexes`` into batches of at most about ``FEATURE_BATCH`` features.
+
+    A record contributes at most one shingle per comment byte plus one
+    feature per key field; a single record larger than the budget forms a
+    batch of its own.
+
+    :param Sequence records: Cleaned applicant records.
+    :param Sequence indexes: Positions of the records to sign, in order.
+    :return: Iterator over consecutive batches of record positions.
+    :rtype: Iterator[list[int]]
+    """
+
+    batch: List[int] = []
+    features = 0
+    for index in indexes:
+        size = len(str(records[index].get("comments") or "")) + len(KEY_FIELDS)
+        if batch and features + size > FEATURE_BATCH:
+            yield batch
+            batch, features = [], 0
+        batch.append(index)
+        features += size
+    if batch:
+        yield batch
+
+
+def _candidate_pairs(band: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pair every record with the first record sharing its signature band.
+
+    :param numpy.ndarray band: ``(records, rows)`` slice of the signatures.
+    :return: Row positions of the bucket leaders and of the records paired
+        with them, as two arrays of equal length.
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+
+    keys = np.ascontiguousarray(band).view(np.dtype((np.void, band.dtype.itemsize * band.shape[1])))
+    _, inverse, counts = np.unique(keys.ravel(), return_inverse=True, return_counts=True)
+    members = np.argsort(inverse.ravel(), kind="stable")
+    starts = np.cumsum(counts) - counts
+    leaders = members[np.repeat(starts, counts)]
+    paired = leaders != members
+    return leaders[paired], members[paired]
+
+
+class DuplicateDetector:  # pylint: disable=too-many-instance-attributes
+    """Group records whose comments and key fields are nearly identical.
+
+    Each record with a comment of at least ``min_comment_chars`` characters
+    gets a MinHash signature of ``num_hashes`` values over the byte shingles
+    of its comment plus one feature per key field (:func:`batch_features`).
+    Signatures are split into ``bands``; records that agree on a whole band
+    land in the same bucket, so only bucket members are compared instead of
+    every pair. A candidate joins its bucket's first record when their
+    signatures agree in at least ``threshold`` of the positions (the
+    estimated Jaccard similarity), and clusters are closed transitively.
+    """
+
+    def __init__(
+        self,
+        num_hashes: int = DEFAULT_NUM_HASHES,
+        bands: int = DEFAULT_BANDS,
+        threshold: float = DEFAULT_THRESHOLD,
+        *,
+        min_comment_chars: int = MIN_COMMENT_CHARS,
+        seed: int = 0,
+    ) -> None:
+        """Draw the hash functions and reset the counters.
+
+        :param int num_hashes: Signature length; must be a multiple of ``bands``.
+        :param int bands: Number of LSH bands.
+        :param float threshold: Minimum estimated similarity of a duplicate.
+        :param int min_comment_chars: Shortest comment a record is compared on.
+        :param int seed: Seed for the hash functions, so labels are reproducible.
+        :return: ``None``
+        :rtype: None
+        :raises ValueError: If ``num_hashes`` is not a multiple of ``bands``.
+        """
+
+        if bands <= 0 or num_hashes % bands:
+            raise ValueError(f"num_hashes ({num_hashes}) must be a multiple of bands ({bands}).")
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: ((a * x + b) mod 2**64) >> 32 with odd ``a``.
+        self._multipliers = rng.integers(1, 2**63, size=num_hashes, dtype=np.uint64) | np.uint64(1)
+        self._offsets = rng.integers(0, 2**63, size=num_hashes, dtype=np.uint64)
+        self.num_hashes = num_hashes
+        self.bands = bands
+        self.threshold = threshold
+        self.min_comment_chars = min_comment_chars
+        self.signed = 0
+        self.compared = 0
+        self.clusters = 0
+        self.flagged = 0
+
+    def signatures(self, records: Sequence[Mapping[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the MinHash signatures of the records long enough to compare.
+
+        Records are shingled in batches of about ``FEATURE_BATCH`` features
+        (:func:`batch_features`) and signed by :meth:`_min_hashes`.
+
+        :param Sequence records: Cleaned applicant records.
+        :return: Indexes of the signed records, and their signatures as a
+            ``(len(indexes), num_hashes)`` ``uint32`` array.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        indexes = [
+            index for index, record in enumerate(records)
+            if len(str(record.get("comments") or "").strip()) >= self.min_comment_chars
+        ]
+        batches = [np.empty((0, self.num_hashes), dtype=np.uint32)]
+        for batch in _record_batches(records, indexes):
+            batches.append(self._min_hashes(*batch_features([records[index] for index in batch])))
+        self.signed += len(indexes)
+        return np.array(indexes, dtype=np.int64), np.concatenate(batches)
+
+    def _min_hashes(self, features: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """Sign one batch of records from their grouped features.
+
+        Features go through every hash function in chunks of at most
+        ``HASH_BATCH_BYTES``, written into one reused buffer.
+        ``np.minimum.reduceat`` takes each record's minimums within a chunk,
+        and records spanning two chunks keep the smaller of both.
+
+        :param numpy.ndarray features: Features grouped by record, as
+            returned by :func:`batch_features`.
+        :param numpy.ndarray offsets: Start of each record's features.
+        :return: ``(len(offsets), num_hashes)`` ``uint32`` signatures.
+        :rtype: numpy.ndarray
+        """
+
+        owners = np.repeat(np.arange(len(offsets)), np.diff(np.append(offsets, len(features))))
+        minimums = np.full((len(offsets), self.num_hashes), 0xFFFFFFFF, dtype=np.uint64)
+        step = max(1, HASH_BATCH_BYTES // (self.num_hashes * 8))
+        buffer = np.empty((min(step, len(features)), self.num_hashes), dtype=np.uint64)
+        for start in range(0, len(features), step):
+            chunk_owners = owners[start : start + step]
+            starts = np.flatnonzero(np.diff(chunk_owners, prepend=-1))
+            hashed = buffer[: len(chunk_owners)]
+            np.multiply.outer(features[start : start + step], self._multipliers, out=hashed)
+            hashed += self._offsets
+            hashed >>= np.uint64(32)
+            owned = chunk_owners[starts]
+            minimums[owned] = np.minimum(minimums[owned], np.minimum.reduceat(hashed, starts))
+        return minimums.astype(np.uint32)
+
+    def find_clusters(self, records: Sequence[Mapping[str, Any]]) -> List[List[int]]:
+        """Group the indexes of near-duplicate records.
+
+        :param Sequence records: Cleaned applicant records.
+        :return: Clusters of two or more record indexes, each sorted, ordered
+            by their first index.
+        :rtype: list[list[int]]
+        """
+
+        indexes, signatures = self.signatures(records)
+        parent = list(range(len(indexes)))
+
+        def root(position: int) -> int:
+            while parent[position] != position:
+                parent[position] = parent[parent[position]]
+                position = parent[position]
+            return position
+
+        for leader, member in self._similar_pairs(signatures):
+            parent[root(member)] = root(leader)
+
+        grouped: Dict[int, List[int]] = defaultdict(list)
+        for position, index in enumerate(indexes.tolist()):
+            grouped[root(position)].append(index)
+        clusters = sorted(cluster for cluster in grouped.values() if len(cluster) > 1)
+        self.clusters += len(clusters)
+        self.flagged += sum(len(cluster) for cluster in clusters)
+        return clusters
+
+    def _similar_pairs(self, signatures: np.ndarray) -> Iterator[Tuple[int, int]]:
+        """Yield the candidate pairs whose signatures meet ``threshold``.
+
+        :param numpy.ndarray signatures: Signatures from :meth:`signatures`.
+        :return: Iterator over ``(leader, member)`` signature row positions.
+        :rtype: Iterator[tuple[int, int]]
+        """
+
+        rows = self.num_hashes // self.bands
+        for band in range(self.bands if len(signatures) else 0):
+            leaders, members = _candidate_pairs(signatures[:, band * rows : (band + 1) * rows])
+            self.compared += len(members)
+            agreement = np.count_nonzero(signatures[members] == signatures[leaders], axis=1)
+            similar = agreement >= self.threshold * self.num_hashes
+            yield from zip(leaders[similar].tolist(), members[similar].tolist())
+
+    def label_records(self, records: Sequence[MutableMapping[str, Any]]) -> int:
+        """Set ``duplicate_cluster`` on every record, in place.
+
+        Records in a cluster get the URL of the cluster's first record with a
+        URL (the earliest one in ``records``); records without a URL and
+        records outside any cluster get ``""``.
+
+        :param Sequence records: Cleaned applicant records.
+        :return: Number of records whose label changed.
+        :rtype: int
+        """
+
+        labels = [""] * len(records)
+        for members in self.find_clusters(records):
+            urls = [records[index].get("url") or "" for index in members]
+            label = next((url for url in urls if url), "")
+            for index, url in zip(members, urls):
+                if url:
+                    labels[index] = label
+
+        changed = 0
+        for record, label in zip(records, labels):
+            if CLUSTER_FIELD not in record or record[CLUSTER_FIELD] != label:
+                record[CLUSTER_FIELD] = label
+                changed += 1
+        return changed
+
+    def summary(self) -> str:
+        """Describe how many records were compared and flagged.
+
+        :return: One-line duplicate detection summary.
+        :rtype: str
+        """
+
+        return (
+            f"Duplicates: {self.flagged} records in {self.clusters} clusters "
+            f"({self.signed} signed, {self.compared} candidate pairs compared)."
+        )
@@ -0,0 +1,259 @@
+"""Fill in applicant metadata missing from the survey list from result detail pages."""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Tuple
+
+from bs4 import BeautifulSoup
+
+from homework_sample_code.course_app.cache import PARSE_FORMAT_VERSION
+from homework_sample_code.course_app.records import RawEntry
+
+
+DEFAULT_DETAIL_WORKERS = 4
+DEFAULT_DETAIL_BUDGET = 200
+
+# Result pages do not change once posted, so their parsed fields are stored in
+# the response cache under a fixed fingerprint instead of one of the page HTML.
+DETAIL_FINGERPRINT = f"detail-v{PARSE_FORMAT_VERSION}"
+
+# Detail-page labels and how their values are written into ``meta_raw`` so the
+# Cleaner's existing term/origin/GPA/GRE patterns pick them up unchanged.
+_DETAIL_FIELDS = (
+    (re.compile(r"season|term", re.I), "{}"),
+    (re.compile(r"country of origin", re.I), "{}"),
+    (re.compile(r"\bgpa\b", re.I), "GPA {}"),
+    (re.compile(r"gre general", re.I), "GRE {}"),
+    (re.compile(r"gre verbal", re.I), "Verbal {}"),
+    (re.compile(r"analytical writing", re.I), "AW {}"),
+)
+_NOTES_LABEL = re.compile(r"^notes?$", re.I)
+_EMPTY_VALUES = {"", "0", "0.0", "0.00", "n/a", "none"}
+
+DetailFields = Tuple[str, str]
+
+
+def needs_details(entry: RawEntry) -> bool:
+    """Return whether ``entry`` lacks the metadata row that carries GPA, GRE and term.
+
+    :param RawEntry entry: Raw entry parsed from a survey page.
+    :return: ``True`` when ``meta_raw`` is blank and a result URL is known.
+    :rtype: bool
+    """
+
+    return not (entry.get("meta_raw") or "").strip() and "/result/" in (entry.get("url_raw") or "")
+
+
+def parse_detail_page(html: str) -> DetailFields:
+    """Extract metadata and notes from a ``/result/<id>`` detail page.
+
+    Detail pages list their fields as ``<dt>`` label / ``<dd>`` value pairs.
+    Recognised fields are joined in the ``" | "`` layout of the survey's
+    metadata rows; zero and ``n/a`` placeholders are dropped.
+
+    :param str html: Detail page HTML.
+    :return: Tuple of metadata text and notes, either possibly ``""``.
+    :rtype: tuple[str, str]
+    """
+
+    soup = BeautifulSoup(html, "html.parser")
+    parts: List[str] = []
+    notes = ""
+    for label_tag in soup.find_all("dt"):
+        value_tag = label_tag.find_next_sibling("dd")
+        if value_tag is None:
+            continue
+        label = label_tag.get_text(" ", strip=True).rstrip(":")
+        value = value_tag.get_text(" ", strip=True)
+        if value.lower() in _EMPTY_VALUES:
+            continue
+        if _NOTES_LABEL.match(label):
+            notes = value
+            continue
+        for pattern, template in _DETAIL_FIELDS:
+            if pattern.search(label):
+                parts.append(template.format(value))
+                break
+    return " | ".join(parts), notes
+
+
+class DetailEnricher:  # pylint: disable=too-many-instance-attributes
+    """Fetch result detail pages for entries whose survey row had no metadata.
+
+    Detail pages are requested on a bounded thread pool through the scraper's
+    HTTP session, cache and retry policy while the crawl keeps streaming
+    entries. The fields parsed from every detail page are kept in the
+    response cache, so a page fetched by an earlier run is never requested
+    again, even when the server sent no validators for its body. Each URL is
+    looked up at most once per run, and at most ``budget`` pages are fetched
+    over the network.
+    """
+
+    def __init__(
+        self,
+        scraper,
+        *,
+        max_workers: int = DEFAULT_DETAIL_WORKERS,
+        budget: int = DEFAULT_DETAIL_BUDGET,
+        window: Optional[int] = None,
+    ) -> None:
+        """Bind the enricher to the scraper whose entries it completes.
+
+        :param Scraper scraper: Scraper that supplies the HTTP session, cache
+            and retry policy; its connection pool is grown by ``max_workers``.
+        :param int max_workers: Maximum number of detail pages fetched at once.
+        :param int budget: Maximum number of detail pages fetched over the
+            network in this run; ``0`` only uses cached pages.
+        :param int window: Maximum number of entries held back while their
+            detail pages load; defaults to eight per worker.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.scraper = scraper
+        self.max_workers = max(1, max_workers)
+        self.budget = max(0, budget)
+        self.window = max(1, window or self.max_workers * 8)
+        self.fetched = 0
+        self.cached = 0
+        self.enriched = 0
+        self.skipped = 0
+        self._seen: Set[str] = set()
+        scraper.http.reserve(scraper.http.max_connections + self.max_workers)
+
+    def iter_enriched(self, entries: Iterable[RawEntry]) -> Iterator[RawEntry]:
+        """Yield ``entries`` in order, completing those that lack metadata.
+
+        Detail requests start as soon as an entry arrives, so they overlap
+        with the crawl; an entry is only held back until its own detail page
+        has loaded or ``window`` later entries have arrived.
+
+        :param Iterable entries: Raw entries, typically from
+            :meth:`Scraper.iter_entries`.
+        :return: Iterator over the same entries, enriched in place.
+        :rtype: Iterator[RawEntry]
+        """
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="gradcafe-detail",
+        )
+        pending: Deque[Tuple[RawEntry, Optional[Future]]] = deque()
+        try:
+            for entry in entries:
+                pending.append((entry, self._lookup(entry, pool)))
+                while pending and (len(pending) > self.window or self._ready(pending[0])):
+                    yield self._complete(*pending.popleft())
+            while pending:
+                yield self._complete(*pending.popleft())
+        finally:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def summary(self) -> str:
+        """Describe how many entries were completed and where their pages came from.
+
+        :return: One-line enrichment summary.
+        :rtype: str
+        """
+
+        return (
+            f"Detail pages: enriched {self.enriched} entries "
+            f"({self.fetched} fetched, {self.cached} cached, "
+            f"{self.skipped} over the budget of {self.budget})."
+        )
+
+    def _lookup(self, entry: RawEntry, pool: ThreadPoolExecutor) -> Optional[Future]:
+        """Start loading the detail page for ``entry`` if it needs one.
+
+        :param RawEntry entry: Entry to inspect.
+        :param ThreadPoolExecutor pool: Pool that runs network fetches.
+        :return: Future resolving to the detail fields, or ``None`` when the
+            entry is left as it is.
+        :rtype: concurrent.futures.Future | None
+        """
+
+        url = entry.get("url_raw")
+        if not needs_details(entry) or url in self._seen:
+            return None
+        self._seen.add(url)
+
+        cache = self.scraper.cache
+        if cache is not None:
+            stored = cache.get_parsed(url, DETAIL_FINGERPRINT)
+            cached = cache.get(url) if stored is None else None
+            if stored is not None or cached is not None:
+                self.cached += 1
+                future: Future = Future()
+                future.set_result(tuple(stored[0]) if stored else self._parse(url, cached.body))
+                return future
+
+        if self.fetched >= self.budget:
+            self.skipped += 1
+            return None
+        self.fetched += 1
+        return pool.submit(self._fetch, url)
+
+    def _fetch(self, url: str) -> Optional[DetailFields]:
+        """Download and parse one detail page.
+
+        :param str url: ``/result/<id>`` page URL.
+        :return: Parsed detail fields, or ``None`` when the fetch failed.
+        :rtype: tuple[str, str] | None
+        """
+
+        html = self.scraper.fetch_html(url)
+        return self._parse(url, html) if html else None
+
+    def _parse(self, url: str, html: str) -> DetailFields:
+        """Parse a detail page and store its fields for later runs.
+
+        :param str url: ``/result/<id>`` page URL.
+        :param str html: Detail page HTML.
+        :return: Tuple of metadata text and notes.
+        :rtype: tuple[str, str]
+        """
+
+        fields = parse_detail_page(html)
+        if self.scraper.cache is not None:
+            self.scraper.cache.store_parsed(url, DETAIL_FINGERPRINT, [fields])
+        return fields
+
+    @staticmethod
+    def _ready(item: Tuple[RawEntry, Optional[Future]]) -> bool:
+        """Return whether a pending entry can be yielded without waiting.
+
+        :param tuple item: Entry and its detail future, if any.
+        :return: ``True`` when there is nothing left to wait for.
+        :rtype: bool
+        """
+
+        future = item[1]
+        return future is None or future.done()
+
+    def _complete(self, entry: RawEntry, future: Optional[Future]) -> RawEntry:
+        """Copy the detail-page fields into ``entry`` once its page has loaded.
+
+        :param RawEntry entry: Entry waiting for its detail page.
+        :param Future future: Future resolving to the detail fields, or ``None``.
+        :return: ``entry``, updated in place.
+        :rtype: RawEntry
+        """
+
+        fields = future.result() if future is not None else None
+        if not fields:
+            return entry
+
+        meta, notes = fields
+        if meta:
+            entry["meta_raw"] = meta
+        if notes and not entry.get("comments_raw"):
+            entry["comments_raw"] = notes
+        if meta or notes:
+            self.enriched += 1
+        return entry
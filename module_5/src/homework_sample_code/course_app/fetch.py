@@ -0,0 +1,335 @@
+"""Retry and concurrency policies for the scraper's fetch layer."""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, FrozenSet, Mapping, Optional, Tuple
+
+import urllib3
+
+
+RETRYABLE_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Redirects are still followed inside urllib3; every other retry belongs to
+# RetryPolicy so failures are never retried twice or without backoff.
+MAX_REDIRECTS = 5
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Convert a ``Retry-After`` header into a delay in seconds.
+
+    :param str value: Header value, either delta-seconds or an HTTP date.
+    :param float now: Current UNIX time used for HTTP dates; defaults to ``time.time()``.
+    :return: Non-negative delay in seconds, or ``None`` when absent or invalid.
+    :rtype: float | None
+    """
+
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        return None
+
+    current = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - current)
+
+
+class RetryPolicy:  # pylint: disable=too-few-public-methods
+    """Exponential backoff with full jitter for transient fetch failures."""
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Configure how often and how patiently failed requests are retried.
+
+        :param int max_attempts: Total attempts per URL, including the first.
+        :param float base_delay: Backoff ceiling in seconds for the first retry.
+        :param float max_delay: Upper bound for any single wait, including
+            waits requested through ``Retry-After``.
+        :param random.Random rng: Random source for jitter; mainly for tests.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng or random.Random()
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Return how long to wait before retry number ``attempt`` (0-based).
+
+        A server-supplied ``Retry-After`` wins over the jittered backoff.
+
+        :param int attempt: Number of failed attempts so far, minus one.
+        :param float retry_after: Delay requested by the server, if any.
+        :return: Seconds to sleep before the next attempt.
+        :rtype: float
+        """
+
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return self._rng.uniform(0, ceiling)
+
+
+class AimdController:  # pylint: disable=too-many-instance-attributes
+    """Additive-increase/multiplicative-decrease limit on requests in flight.
+
+    The limit grows by one after a full window of fast responses and is cut
+    by ``decrease`` when the server throttles (429/5xx) or the connection
+    fails. Cuts are spaced by ``cooldown`` seconds so that a burst of failures
+    from the same window only counts once.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 16,
+        *,
+        latency_target: float = 2.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Configure the concurrency bounds and congestion signals.
+
+        :param int initial: Starting number of requests allowed in flight.
+        :param int minimum: Lowest limit the controller backs off to.
+        :param int maximum: Highest limit the controller widens to.
+        :param float latency_target: Response time in seconds under which the
+            site is considered healthy.
+        :param float decrease: Factor applied to the limit on throttling.
+        :param float cooldown: Minimum seconds between two decreases.
+        :param Callable clock: Monotonic clock; mainly for tests.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.latency_target = latency_target
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = min(self.maximum, max(self.minimum, initial))
+        self._healthy = 0
+        self._last_decrease: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight.
+
+        :return: Concurrency limit between ``minimum`` and ``maximum``.
+        :rtype: int
+        """
+
+        return self._limit
+
+    def record_success(self, latency: float) -> None:
+        """Feed back a completed request and widen the limit when healthy.
+
+        :param float latency: Seconds the request took.
+        :return: ``None``
+        :rtype: None
+        """
+
+        with self._lock:
+            if latency > self.latency_target:
+                self._healthy = 0
+                return
+            self._healthy += 1
+            if self._healthy >= self._limit and self._limit < self.maximum:
+                self._limit += 1
+                self._healthy = 0
+
+    def record_throttle(self) -> None:
+        """Feed back a throttled or failed request and shrink the limit.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._healthy = 0
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            self._limit = max(self.minimum, math.floor(self._limit * self.decrease))
+            self._last_decrease = now
+
+
+def _format_bytes(size: int) -> str:
+    """Render a byte count with a binary unit suffix.
+
+    :param int size: Number of bytes.
+    :return: Human-readable size such as ``"1.5 MiB"``.
+    :rtype: str
+    """
+
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+@dataclass
+class TransferStats:
+    """Running totals kept by :class:`HttpSession`."""
+
+    requests: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    # Connections opened and requests sent by per-host pools already closed.
+    closed_connections: int = 0
+    closed_requests: int = 0
+
+
+class HttpSession:
+    """Keep-alive HTTP client that negotiates compression and counts bytes.
+
+    Wraps a :class:`urllib3.PoolManager` whose per-host pool holds one
+    connection per request allowed in flight and blocks instead of opening
+    throw-away connections beyond that. urllib3's own retries are switched
+    off apart from following redirects, leaving :class:`RetryPolicy` as the
+    only retry layer. Every request advertises gzip/deflate support; response
+    bodies are decoded transparently while both the bytes received and the
+    decoded bytes are tallied.
+    """
+
+    def __init__(self, max_connections: int = 1, *, compress: bool = True) -> None:
+        """Size the connection pool and choose the default request headers.
+
+        :param int max_connections: Keep-alive connections kept per host;
+            should match the number of requests in flight.
+        :param bool compress: Send ``Accept-Encoding: gzip, deflate``.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.max_connections = max(1, max_connections)
+        self.headers = {"Accept-Encoding": ACCEPT_ENCODING} if compress else {}
+        self.pool = urllib3.PoolManager(
+            maxsize=self.max_connections,
+            block=True,
+            retries=urllib3.Retry(
+                total=None, connect=0, read=0, status=0, other=0, redirect=MAX_REDIRECTS
+            ),
+        )
+        self.stats = TransferStats()
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> urllib3.BaseHTTPResponse:
+        """Send a request and record how many body bytes it transferred.
+
+        :param str method: HTTP method.
+        :param str url: Absolute URL.
+        :param Mapping headers: Extra headers, overriding the session defaults.
+        :return: Response with a fully read, decoded body.
+        :rtype: urllib3.BaseHTTPResponse
+        """
+
+        merged = {**self.headers, **(headers or {})}
+        response = self.pool.request(method, url, headers=merged)
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.wire_bytes += response.tell()
+            self.stats.decoded_bytes += len(response.data)
+        return response
+
+    def reserve(self, connections: int) -> None:
+        """Grow the per-host pool so ``connections`` requests can run at once.
+
+        Pools already open were sized for fewer connections, so they are
+        closed and reopened lazily with the new size.
+
+        :param int connections: Keep-alive connections needed per host.
+        :return: ``None``
+        :rtype: None
+        """
+
+        if connections <= self.max_connections:
+            return
+        self.clear()
+        self.max_connections = connections
+        self.pool.connection_pool_kw["maxsize"] = connections
+
+    def _pool_counts(self) -> Tuple[int, int]:
+        """Sum connections opened and requests sent by the open per-host pools.
+
+        :return: Tuple of connections opened and requests sent.
+        :rtype: tuple[int, int]
+        """
+
+        opened, requests = self.stats.closed_connections, self.stats.closed_requests
+        for key in list(self.pool.pools.keys()):
+            pool = self.pool.pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                requests += pool.num_requests
+        return opened, requests
+
+    def connection_counts(self) -> Tuple[int, int]:
+        """Return how many connections were opened and how many requests reused one.
+
+        :return: Tuple of connections opened and requests served on a reused
+            keep-alive connection.
+        :rtype: tuple[int, int]
+        """
+
+        opened, requests = self._pool_counts()
+        return opened, max(0, requests - opened)
+
+    def summary(self) -> str:
+        """Describe the bytes moved and connection reuse so far.
+
+        :return: One-line transfer report.
+        :rtype: str
+        """
+
+        opened, reused = self.connection_counts()
+        stats = self.stats
+        saved = 1 - stats.wire_bytes / stats.decoded_bytes if stats.decoded_bytes else 0.0
+        return (
+            f"Transfer: {_format_bytes(stats.wire_bytes)} on the wire, "
+            f"{_format_bytes(stats.decoded_bytes)} decoded ({saved:.0%} saved by compression); "
+            f"{stats.requests} requests over {opened} connections ({reused} reused)."
+        )
+
+    def clear(self) -> None:
+        """Close every pooled connection, keeping their counts for :meth:`summary`.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.stats.closed_connections, self.stats.closed_requests = self._pool_counts()
+        self.pool.clear()
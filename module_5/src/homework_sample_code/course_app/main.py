@@ -2,10 +2,28 @@
 
 from __future__ import annotations
 
+import argparse
 import json
+import os
 import sys
+import tempfile
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Iterable, List, Mapping
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 try:
     from homework_sample_code.course_app.utils import ensure_src_on_path, import_module
@@ -17,13 +35,40 @@ ensure_src_on_path()
 
 scrape_module = import_module("homework_sample_code.course_app.scrape")
 clean_module = import_module("homework_sample_code.course_app.clean")
+cache_module = import_module("homework_sample_code.course_app.cache")
+checkpoint_module = import_module("homework_sample_code.course_app.checkpoint")
+fetch_module = import_module("homework_sample_code.course_app.fetch")
+watermark_module = import_module("homework_sample_code.course_app.watermark")
+enrich_module = import_module("homework_sample_code.course_app.enrich")
+archive_module = import_module("homework_sample_code.course_app.archive")
+validate_module = import_module("homework_sample_code.course_app.validate")
+dedup_module = import_module("homework_sample_code.course_app.dedup")
 
 Scraper = scrape_module.Scraper
 Cleaner = clean_module.Cleaner
+ResponseCache = cache_module.ResponseCache
+ScrapeCheckpoint = checkpoint_module.ScrapeCheckpoint
+AimdController = fetch_module.AimdController
+ResultWatermark = watermark_module.ResultWatermark
+DetailEnricher = enrich_module.DetailEnricher
+RawArchive = archive_module.RawArchive
+ScoreValidator = validate_module.ScoreValidator
+DuplicateDetector = dedup_module.DuplicateDetector
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_FILE = PROJECT_ROOT / "llm_extend_applicant_data.json"
+CACHE_FILE = PROJECT_ROOT / ".gradcafe_response_cache.sqlite3"
+CHECKPOINT_FILE = PROJECT_ROOT / "scrape_checkpoint.jsonl"
+WATERMARK_FILE = PROJECT_ROOT / "scrape_watermark.json"
+ARCHIVE_DIR = PROJECT_ROOT / "raw_archive"
+CLEAN_BATCH_SIZE = 500
+MAX_PAGES_IN_FLIGHT = 8
+# Filled in by the LLM post-processing step, not by ``Cleaner``; reprocessing
+# must keep the stored values.
+LLM_FIELDS = ("llm-generated-program", "llm-generated-university")
+# Cluster labels are assigned by :func:`dedup` over the whole dataset.
+PRESERVED_FIELDS = LLM_FIELDS + (dedup_module.CLUSTER_FIELD,)
 
 
 def save_data(data: List[Mapping[str, str]], filename: Path = DATA_FILE) -> None:
@@ -54,46 +99,400 @@ def load_data(filename: Path = DATA_FILE) -> List[Mapping[str, str]]:
         return json.load(json_file)
 
 
-def _merge_entries(
-    existing_entries: Iterable[Mapping[str, str]],
-    new_entries: Iterable[Mapping[str, str]],
-) -> List[Mapping[str, str]]:
-    """Combine the existing dataset with freshly cleaned entries.
+def _format_array_item(entry: Mapping[str, str]) -> bytes:
+    """Render ``entry`` exactly as ``json.dump(..., indent=4)`` lays out array items.
 
-    :param Iterable existing_entries: Iterable of previously stored applicants.
-    :param Iterable new_entries: Iterable containing the latest scraped applicants.
-    :return: Concatenated list of applicant dictionaries.
-    :rtype: list[Mapping[str, str]]
+    :param Mapping entry: Applicant mapping to serialise.
+    :return: UTF-8 encoded, indented JSON object.
+    :rtype: bytes
     """
 
-    return list(existing_entries) + list(new_entries)
+    rendered = json.dumps(entry, indent=4, ensure_ascii=False)
+    return textwrap.indent(rendered, "    ").encode("utf-8")
 
 
-def main(max_entries: int = 30000) -> None:
-    """Scrape, clean, and merge the latest GradCafe entries into the dataset.
+def _last_non_space(handle: BinaryIO, end: int) -> Tuple[int, bytes]:
+    """Find the last non-whitespace byte located before offset ``end``.
 
-    :param int max_entries: Maximum number of new records to scrape in this run.
-    :return: ``None``
-    :rtype: None
+    :param BinaryIO handle: Seekable binary file handle.
+    :param int end: Offset to search backwards from.
+    :return: Offset and value of the byte, or ``(-1, b"")`` when none exists.
+    :rtype: tuple[int, bytes]
+    """
+
+    position = end
+    while position > 0:
+        start = max(0, position - 4096)
+        handle.seek(start)
+        stripped = handle.read(position - start).rstrip()
+        if stripped:
+            return start + len(stripped) - 1, stripped[-1:]
+        position = start
+    return -1, b""
+
+
+def append_data(entries: Iterable[Mapping[str, str]], filename: Path = DATA_FILE) -> int:
+    """Append applicant entries to the JSON array stored in ``filename``.
+
+    New entries are streamed into the file in place, so neither the stored
+    dataset nor the incoming entries need to be held in memory. The result
+    is laid out exactly as :func:`save_data` would write the merged list.
+
+    :param Iterable entries: Applicant mappings to append, in order.
+    :param pathlib.Path filename: JSON file holding the applicant array.
+    :return: Number of entries appended.
+    :rtype: int
+    :raises ValueError: If ``filename`` does not contain a JSON array.
+    """
+
+    pending = iter(entries)
+    first = next(pending, None)
+    if first is None:
+        return 0
+
+    filename = Path(filename)
+    if not filename.exists() or filename.stat().st_size == 0:
+        filename.write_text("[]", encoding="utf-8")
+
+    appended = 0
+    with filename.open("r+b") as handle:
+        closing_at, closing = _last_non_space(handle, handle.seek(0, 2))
+        if closing != b"]":
+            raise ValueError(f"{filename} does not contain a JSON array.")
+        previous_at, previous = _last_non_space(handle, closing_at)
+
+        handle.seek(previous_at + 1)
+        handle.truncate()
+        separator = b",\n" if previous != b"[" else b"\n"
+        for entry in chain([first], pending):
+            handle.write(separator + _format_array_item(entry))
+            separator = b",\n"
+            appended += 1
+        handle.write(b"\n]")
+
+    print(f"STATUS: Appended {appended} entries to {filename}")
+    return appended
+
+
+def _load_existing_urls() -> Tuple[int, Set[str]]:
+    """Return the stored entry count and the URLs already in the dataset.
+
+    The full dataset is only held while the URL set is built.
+
+    :return: Tuple of stored entry count and set of known result URLs.
+    :rtype: tuple[int, set[str]]
     """
 
     existing_cleaned = load_data()
     existing_urls = {entry.get("url", "") for entry in existing_cleaned if entry.get("url")}
+    return len(existing_cleaned), existing_urls
+
+
+def _batched(items: Iterable[Mapping[str, str]], size: int) -> Iterator[List[Mapping[str, str]]]:
+    """Group ``items`` into lists of at most ``size`` elements.
+
+    :param Iterable items: Items to group.
+    :param int size: Maximum batch length.
+    :return: Iterator over consecutive batches.
+    :rtype: Iterator[list]
+    """
+
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _refreshed_entries(
+    scraper: Scraper,
+    queries: Sequence[str],
+    existing_urls: Set[str],
+) -> Iterator[Mapping[str, str]]:
+    """Yield new entries from the ``?q=`` feeds of ``queries``, without repeats.
+
+    An applicant can show up in several feeds (for example under both their
+    university and their program), so each result URL is yielded once.
+
+    :param Scraper scraper: Scraper whose settings the query feeds share.
+    :param Sequence queries: University or program names to refresh.
+    :param set existing_urls: URLs already in the dataset.
+    :return: Iterator over unique raw entries.
+    :rtype: Iterator[Mapping[str, str]]
+    """
+
+    yielded: Set[str] = set()
+    for entries in scraper.refresh_queries(queries, existing_urls).values():
+        for entry in entries:
+            if entry["url_raw"] not in yielded:
+                yielded.add(entry["url_raw"])
+                yield entry
+
+
+def main(  # pylint: disable=too-many-locals,too-many-statements
+    max_entries: int = 30000,
+    resume: bool = False,
+    queries: Optional[Sequence[str]] = None,
+    detail_budget: int = enrich_module.DEFAULT_DETAIL_BUDGET,
+    on_appended: Optional[Callable[[Iterable[Mapping[str, str]]], object]] = None,
+) -> int:
+    """Scrape, clean, and merge the latest GradCafe entries into the dataset.
+
+    Entries are archived raw in ``ARCHIVE_DIR`` and cleaned in batches as
+    they are scraped (out-of-range GPA and GRE scores are blanked by
+    ``ScoreValidator``), spooled to a temporary file, then appended to the
+    dataset in place, so memory use does not grow with the size of the
+    scrape. Completed pages are checkpointed to
+    ``CHECKPOINT_FILE`` while scraping; the checkpoint is removed once the
+    dataset has been updated.
+
+    Known entries are recognised by the result-ID watermark in
+    ``WATERMARK_FILE``. Only the first run, before a watermark exists, loads
+    the dataset to collect its URLs and seed the watermark.
 
-    print(f"Loaded {len(existing_cleaned)} existing entries.")
+    With ``queries``, only the ``?q=`` feeds of those universities or programs
+    are refreshed, concurrently. Their entries are recorded in the watermark
+    without moving it, and no checkpoint is written.
 
-    scraper = Scraper(max_entries=max_entries)
-    raw_entries = scraper.scrape_data(existing_urls=existing_urls)
-    print(f"Scraped {len(raw_entries)} NEW raw entries.")
+    Entries whose survey row had no metadata are completed from their result
+    detail pages, fetched alongside the crawl; at most ``detail_budget`` of
+    those pages are downloaded per run.
 
-    cleaner = Cleaner(raw_data=raw_entries)
-    cleaned_entries = cleaner.clean_data()
-    print(f"Cleaned {len(cleaned_entries)} NEW entries.")
+    :param int max_entries: Maximum number of new records to scrape in this
+        run (per query when refreshing).
+    :param bool resume: Continue an interrupted scrape from its checkpoint.
+    :param Sequence queries: Optional universities or programs to refresh
+        instead of crawling the global feed.
+    :param int detail_budget: Maximum number of result detail pages fetched
+        over the network; ``0`` only uses detail pages already cached.
+    :param Callable on_appended: Optional callback that receives the newly
+        appended entries (streamed from the spool) once the dataset is
+        updated, e.g. to insert them into the database.
+    :return: Number of entries appended to the dataset.
+    :rtype: int
+    """
+
+    watermark = ResultWatermark(WATERMARK_FILE)
+    if watermark.is_set:
+        existing_count, existing_urls = watermark.entry_count, set()
+        print(f"Resuming after result {watermark.max_id} ({existing_count} existing entries).")
+    else:
+        existing_count, existing_urls = _load_existing_urls()
+        watermark.advance(existing_urls)
+        print(f"Loaded {existing_count} existing entries.")
+
+    checkpoint = None if queries else ScrapeCheckpoint(CHECKPOINT_FILE)
+    if checkpoint is not None and not resume:
+        checkpoint.clear()
+
+    scraper = Scraper(
+        max_entries=max_entries,
+        cache=ResponseCache(CACHE_FILE),
+        checkpoint=checkpoint,
+        concurrency=AimdController(maximum=MAX_PAGES_IN_FLIGHT),
+        watermark=watermark,
+    )
+    enricher = DetailEnricher(scraper, budget=detail_budget)
+    archive = RawArchive(ARCHIVE_DIR)
+    validator = ScoreValidator()
+
+    raw_count = cleaned_count = 0
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+        try:
+            if queries:
+                raw_entries = _refreshed_entries(scraper, queries, existing_urls)
+            else:
+                raw_entries = scraper.iter_entries(existing_urls=existing_urls, resume=resume)
+            for batch in _batched(enricher.iter_enriched(raw_entries), CLEAN_BATCH_SIZE):
+                raw_count += len(batch)
+                archive.append(batch)
+                cleaned = Cleaner(raw_data=batch).clean_data()
+                validator.validate_records(cleaned)
+                for entry in cleaned:
+                    spool.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    cleaned_count += 1
+            scraper.print_summary()
+            print(enricher.summary())
+        finally:
+            scraper.close()
+        print(f"Scraped {raw_count} NEW raw entries.")
+        print(f"Cleaned {cleaned_count} NEW entries.")
+        print(clean_module.field_cache_summary())
+        print(validator.summary())
+
+        spool.seek(0)
+        appended = append_data(json.loads(line) for line in spool)
+
+        spool.seek(0)
+        stored_urls = (json.loads(line).get("url", "") for line in spool)
+        if queries:
+            watermark.mark_seen(stored_urls)
+        else:
+            watermark.advance(stored_urls)
+        watermark.save(existing_count + appended)
+        # The entries are stored now; replaying them on --resume would duplicate them.
+        if checkpoint is not None:
+            checkpoint.clear()
+
+        if on_appended is not None and appended:
+            spool.seek(0)
+            on_appended(json.loads(line) for line in spool)
+
+    print(f"Total entries after merge: {existing_count + appended}")
+    return appended
+
+
+def _clean_archive_chunk(path: Path) -> List[dict]:
+    """Clean every raw entry stored in one archive chunk.
+
+    Runs in a worker process during :func:`reprocess`.
+
+    :param pathlib.Path path: Archive chunk file.
+    :return: Cleaned entries in archive order.
+    :rtype: list[dict]
+    """
+
+    return Cleaner(raw_data=archive_module.read_chunk(path)).clean_data()
+
+
+def reprocess(workers: Optional[int] = None) -> int:
+    """Re-clean the raw archive and update the dataset records that changed.
+
+    Archive chunks are cleaned in parallel on a process pool. Each stored
+    record whose URL is in the archive is compared with its re-cleaned form
+    (keeping ``PRESERVED_FIELDS``), and the dataset is rewritten only if at least
+    one record changed. When a URL was archived more than once, its latest
+    raw entry wins. Re-cleaned scores go through the same range checks as
+    newly scraped ones.
+
+    :param int workers: Worker processes to use; defaults to the CPU count,
+        and ``1`` cleans on the calling process.
+    :return: Number of dataset records that changed.
+    :rtype: int
+    """
+
+    paths = RawArchive(ARCHIVE_DIR).chunk_paths()
+    if not paths:
+        print(f"No raw archive found in {ARCHIVE_DIR}.")
+        return 0
+
+    workers = min(len(paths), workers or os.cpu_count() or 1)
+    cleaned: Dict[str, dict] = {}
+    if workers <= 1:
+        chunks: Iterable[List[dict]] = map(_clean_archive_chunk, paths)
+        cleaned = {entry["url"]: entry for chunk in chunks for entry in chunk if entry["url"]}
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in pool.map(_clean_archive_chunk, paths):
+                cleaned.update((entry["url"], entry) for entry in chunk if entry["url"])
+
+    validator = ScoreValidator()
+    validator.validate_records(list(cleaned.values()))
+    print(validator.summary())
+
+    dataset = load_data()
+    changed = 0
+    for index, stored in enumerate(dataset):
+        fresh = cleaned.get(stored.get("url", ""))
+        if fresh is None:
+            continue
+        recleaned = {key: value for key, value in fresh.items() if key not in PRESERVED_FIELDS}
+        updated = {**stored, **recleaned}
+        if updated != stored:
+            dataset[index] = updated
+            changed += 1
+
+    print(f"Reprocessed {len(cleaned)} archived entries with {workers} workers.")
+    if changed:
+        save_data(dataset)
+    print(f"Updated {changed} of {len(dataset)} stored entries.")
+    return changed
+
+
+def dedup() -> int:
+    """Label the near-duplicate records of the dataset.
+
+    Every stored record gets a ``duplicate_cluster`` value: the URL of the
+    earliest record of its cluster of near-identical submissions (spam or
+    repeat posts), or ``""``. The dataset is rewritten only if a label
+    changed.
+
+    :return: Number of dataset records whose label changed.
+    :rtype: int
+    """
+
+    dataset = load_data()
+    detector = DuplicateDetector()
+    changed = detector.label_records(dataset)
+    print(detector.summary())
+    if changed:
+        save_data(dataset)
+    print(f"Updated {changed} of {len(dataset)} stored entries.")
+    return changed
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for a manual scrape run.
+
+    :param Sequence argv: Arguments to parse; defaults to ``sys.argv[1:]``.
+    :return: Parsed options with ``max_entries``, ``resume``, ``refresh``,
+        ``reprocess``, ``dedup``, ``workers`` and ``detail_budget`` attributes.
+    :rtype: argparse.Namespace
+    """
 
-    combined = _merge_entries(existing_cleaned, cleaned_entries)
-    save_data(combined)
-    print(f"Total entries after merge: {len(combined)}")
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--max-entries",
+        type=int,
+        default=30000,
+        help="maximum number of new records to scrape (default: 30000)",
+    )
+    parser.add_argument(
+        "--detail-budget",
+        type=int,
+        default=enrich_module.DEFAULT_DETAIL_BUDGET,
+        help="maximum number of result detail pages to download for entries "
+        f"missing metadata (default: {enrich_module.DEFAULT_DETAIL_BUDGET})",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue an interrupted scrape from its checkpoint file",
+    )
+    mode.add_argument(
+        "--refresh",
+        action="append",
+        metavar="QUERY",
+        help="refresh only the ?q= feed for this university or program (repeatable)",
+    )
+    mode.add_argument(
+        "--reprocess",
+        action="store_true",
+        help="re-clean the raw archive and update changed records instead of scraping",
+    )
+    mode.add_argument(
+        "--dedup",
+        action="store_true",
+        help="flag near-duplicate records in the dataset instead of scraping",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes for --reprocess (default: CPU count)",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":  # pragma: no cover - manual execution entry point
-    main()
+    options = _parse_args()
+    if options.reprocess:
+        reprocess(options.workers)
+    elif options.dedup:
+        dedup()
+    else:
+        main(
+            max_entries=options.max_entries,
+            resume=options.resume,
+            queries=options.refresh,
+            detail_budget=options.detail_budget,
+        )
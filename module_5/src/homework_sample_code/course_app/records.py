@@ -0,0 +1,124 @@
+"""Compact record types shared by the scraping and cleaning pipeline."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Iterator, Tuple
+
+
+RAW_ENTRY_FIELDS = (
+    "university_raw",
+    "program_raw",
+    "degree_raw",
+    "date_added_raw",
+    "status_raw",
+    "url_raw",
+    "meta_raw",
+    "comments_raw",
+)
+
+_RAW_ENTRY_FIELD_SET = frozenset(RAW_ENTRY_FIELDS)
+
+
+class RawEntry(Mapping):  # pylint: disable=too-many-instance-attributes
+    """One scraped applicant row stored in ``__slots__`` instead of a dict.
+
+    A ``RawEntry`` takes roughly a quarter of the memory of the equivalent
+    eight-key dictionary. It remains a read-only :class:`~collections.abc.Mapping`
+    keyed by ``RAW_ENTRY_FIELDS`` (with item assignment for those keys), so
+    code written against the old dictionaries keeps working, and it compares
+    equal to a dict holding the same fields.
+    """
+
+    __slots__ = RAW_ENTRY_FIELDS
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        university_raw: str = "",
+        program_raw: str = "",
+        degree_raw: str = "",
+        date_added_raw: str = "",
+        status_raw: str = "",
+        url_raw: str = "",
+        meta_raw: str = "",
+        comments_raw: str = "",
+    ) -> None:
+        """Store the raw text captured for each column of a survey row.
+
+        :param str university_raw: University cell text.
+        :param str program_raw: Program name from the second column.
+        :param str degree_raw: Degree text from the second column.
+        :param str date_added_raw: Date the entry was added.
+        :param str status_raw: Decision status text.
+        :param str url_raw: Absolute result URL.
+        :param str meta_raw: Metadata row text (term, origin, scores).
+        :param str comments_raw: Applicant comment text.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.university_raw = university_raw
+        self.program_raw = program_raw
+        self.degree_raw = degree_raw
+        self.date_added_raw = date_added_raw
+        self.status_raw = status_raw
+        self.url_raw = url_raw
+        self.meta_raw = meta_raw
+        self.comments_raw = comments_raw
+
+    @classmethod
+    def from_mapping(cls, values: Mapping) -> "RawEntry":
+        """Build an entry from a mapping such as a legacy raw-entry dict.
+
+        :param Mapping values: Mapping keyed by ``RAW_ENTRY_FIELDS``; missing
+            keys default to ``""``.
+        :return: New raw entry.
+        :rtype: RawEntry
+        """
+
+        return cls(*(values.get(field, "") for field in RAW_ENTRY_FIELDS))
+
+    def as_tuple(self) -> Tuple[str, ...]:
+        """Return the field values ordered by ``RAW_ENTRY_FIELDS``.
+
+        :return: Plain tuple of the entry's values.
+        :rtype: tuple[str, ...]
+        """
+
+        return tuple(getattr(self, field) for field in RAW_ENTRY_FIELDS)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for ``key`` or ``default`` when it is not a field.
+
+        :param str key: Field name.
+        :param Any default: Value returned for unknown keys.
+        :return: Field value or ``default``.
+        :rtype: Any
+        """
+
+        if key in _RAW_ENTRY_FIELD_SET:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> str:
+        if key not in _RAW_ENTRY_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        if key not in _RAW_ENTRY_FIELD_SET:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RAW_ENTRY_FIELDS)
+
+    def __len__(self) -> int:
+        return len(RAW_ENTRY_FIELDS)
+
+    def __reduce__(self):
+        return (RawEntry, self.as_tuple())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in RAW_ENTRY_FIELDS)
+        return f"RawEntry({fields})"
@@ -3,33 +3,117 @@
 from __future__ import annotations
 
 import re
-from typing import List, Optional, Sequence, Tuple
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 
 import urllib3
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from homework_sample_code.course_app.cache import ResponseCache, page_fingerprint
+from homework_sample_code.course_app.checkpoint import ScrapeCheckpoint
+from homework_sample_code.course_app.fetch import (
+    RETRYABLE_STATUSES,
+    AimdController,
+    HttpSession,
+    RetryPolicy,
+    parse_retry_after,
+)
+from homework_sample_code.course_app.records import RAW_ENTRY_FIELDS, RawEntry
+from homework_sample_code.course_app.watermark import ResultWatermark
 
 
 ResultRow = Tuple[str, str]
+PageResult = Tuple[int, Optional[str]]
+ParsedPage = Tuple[int, Optional[List[RawEntry]]]
+EntryTuple = Tuple[str, ...]
+
+PARSER_BACKENDS = ("html.parser", "lxml")
+
+_METADATA_PATTERN = re.compile(r"(Fall|Spring)\s*\d{4}|GPA\s*\d|American|International", re.I)
+_EXPECT_MAIN, _EXPECT_METADATA, _EXPECT_COMMENT = range(3)
+
+DEFAULT_REFRESH_WORKERS = 4
 
+_WORKER_STATE: Dict[str, "Scraper"] = {}
 
-class Scraper:
+
+class Scraper:  # pylint: disable=too-many-instance-attributes
     """Stateful helper that crawls GradCafe survey result pages."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         url: str = "https://www.thegradcafe.com/survey/",
         max_entries: int = 30000,
+        *,
+        prefetch: int = 0,
+        parse_workers: int = 0,
+        cache: Optional[ResponseCache] = None,
+        parser: str = "html.parser",
+        table_only: bool = False,
+        checkpoint: Optional[ScrapeCheckpoint] = None,
+        retry: Optional[RetryPolicy] = None,
+        concurrency: Optional[AimdController] = None,
+        watermark: Optional[ResultWatermark] = None,
+        query: Optional[str] = None,
+        http: Optional[HttpSession] = None,
     ) -> None:
         """Configure a scraper instance for GradCafe survey pages.
 
         :param str url: Base survey URL that exposes paginated results.
         :param int max_entries: Maximum number of rows to collect per scrape.
+        :param int prefetch: Number of upcoming pages to keep in flight on a
+            thread pool; ``0`` or ``1`` fetches pages one at a time.
+        :param int parse_workers: Number of worker processes that parse page
+            HTML; ``0`` parses on the calling thread.
+        :param ResponseCache cache: Optional on-disk response cache used for
+            conditional GETs and to reuse the parse of pages whose results
+            table has not changed.
+        :param str parser: BeautifulSoup tree builder, one of
+            ``PARSER_BACKENDS``.
+        :param bool table_only: Restrict parsing to ``<tbody>`` elements so
+            only the results table is materialised.
+        :param ScrapeCheckpoint checkpoint: Optional sidecar that records
+            completed pages so an interrupted scrape can resume.
+        :param RetryPolicy retry: Backoff policy for transient failures;
+            defaults to :class:`RetryPolicy` with its standard settings.
+        :param AimdController concurrency: Optional controller that adapts the
+            number of pages in flight to how the site responds; overrides
+            ``prefetch`` as the prefetch window.
+        :param ResultWatermark watermark: Optional record of ingested result
+            IDs; entries it has seen are skipped and the scrape stops at the
+            first result older than its tolerance window.
+        :param str query: Optional search term; pages are then taken from
+            the ``?q=`` feed for that university or program.
+        :param HttpSession http: Optional session to share with another
+            scraper; by default a new one sized for the pages in flight is
+            opened.
         :return: ``None``
         :rtype: None
+        :raises ValueError: If ``parser`` is not a supported backend.
         """
 
+        if parser not in PARSER_BACKENDS:
+            raise ValueError(
+                f"Unsupported parser backend {parser!r}; expected one of {PARSER_BACKENDS}."
+            )
+
         self.base = url
-        self.http = urllib3.PoolManager()
+        self.prefetch = max(0, prefetch)
+        self.parse_workers = max(0, parse_workers)
+        self.cache = cache
+        self.parser = parser
+        self.table_only = table_only
+        self.checkpoint = checkpoint
+        self.retry = retry or RetryPolicy()
+        self.concurrency = concurrency
+        self.watermark = watermark
+        self.query = query
+        self.retries = 0
+        self._max_in_flight = max(self.prefetch, concurrency.maximum if concurrency else 0)
+        self.http = http or HttpSession(max_connections=self._max_in_flight)
         self.max_entries = max_entries
 
     def close(self) -> None:
@@ -40,163 +124,615 @@ class Scraper:
         """
 
         self.http.clear()
+        if self.cache is not None:
+            self.cache.close()
 
-    def scrape_data(self, existing_urls: Optional[Sequence[str]] = None) -> List[dict]:
+    def print_summary(self) -> None:
+        """Print response-cache and transfer statistics for the run so far.
+
+        :return: ``None``
+        :rtype: None
+        """
+
+        if self.cache is not None:
+            print(self.cache.summary())
+        if isinstance(self.http, HttpSession):
+            print(self.http.summary())
+
+    def scrape_data(
+        self,
+        existing_urls: Optional[Sequence[str]] = None,
+        resume: bool = False,
+    ) -> List[RawEntry]:
         """Iteratively download survey pages and return unseen applicant rows.
 
         :param Sequence existing_urls: URLs that have already been processed.
+        :param bool resume: Continue after the last page stored in the
+            configured checkpoint instead of starting from page one.
         :return: List of newly discovered applicant entries.
-        :rtype: list[dict]
+        :rtype: list[RawEntry]
         """
 
-        existing = set(existing_urls or [])
-        new_entries: List[dict] = []
-        page = 1
-        stop_scraping = False
+        new_entries = list(self.iter_entries(existing_urls, resume=resume))
+
+        print(f"Finished scraping. Collected {len(new_entries)} NEW raw entries.")
+        self.print_summary()
+        print("")
+        return new_entries
+
+    def iter_entries(
+        self,
+        existing_urls: Optional[Sequence[str]] = None,
+        resume: bool = False,
+    ) -> Iterator[RawEntry]:
+        """Yield unseen applicant rows page by page.
+
+        Stops under the same rules as :meth:`scrape_data` (a previously-seen
+        URL or a result older than the watermark's tolerance window, an empty
+        or failed page, or ``max_entries``) but only holds the
+        current page in memory, so callers can process entries as they arrive.
+        When resuming, entries replayed from the checkpoint are skipped on the
+        pages fetched afterwards, since new submissions shift older results
+        onto later pages between runs.
 
-        while len(new_entries) < self.max_entries and not stop_scraping:
-            page_url = f"{self.base}?page={page}"
-            collected = len(new_entries)
+        :param Sequence existing_urls: URLs that have already been processed.
+        :param bool resume: Replay entries stored in the configured checkpoint,
+            then continue after its last recorded page.
+        :return: Iterator over newly discovered applicant entries.
+        :rtype: Iterator[RawEntry]
+        """
+
+        existing = set(existing_urls or [])
+        remaining = self.max_entries
+        replayed: set = set()
+        last_page = 0
+        if resume and self.checkpoint is not None:
+            for last_page, page_entries in self.checkpoint.iter_pages():
+                resumed = [
+                    RawEntry.from_mapping(entry) for entry in page_entries[: max(0, remaining)]
+                ]
+                replayed.update(entry["url_raw"] for entry in resumed)
+                remaining -= len(resumed)
+                yield from resumed
             print(
-                f"Scraping page {page}: {page_url} "
-                f"(collected {collected}/{self.max_entries})"
+                f"Resuming from page {last_page + 1} after "
+                f"{self.max_entries - remaining} checkpointed entries."
             )
 
-            html = self._get_html(page_url)
-            if not html:
-                print("No HTML returned for URL, stopping.")
-                break
+        if remaining <= 0:
+            return
+
+        pages = self._iter_parsed_pages(last_page + 1)
+        try:
+            for page, page_entries in pages:
+                print(
+                    f"Scraping page {page}: {self._page_url(page)} "
+                    f"(collected {self.max_entries - remaining}/{self.max_entries})"
+                )
+
+                if page_entries is None:
+                    print("No HTML returned for URL, stopping.")
+                    return
+
+                if not page_entries:
+                    print("No entries parsed on this page, stopping.")
+                    return
+
+                fresh, seen = self._unseen_entries(
+                    page_entries, existing, remaining, self.watermark, replayed
+                )
+                if self.checkpoint is not None:
+                    self.checkpoint.record_page(page, fresh)
+                remaining -= len(fresh)
+                yield from fresh
+
+                if seen:
+                    print("Encountered previously-seen entry. Stopping scrape.")
+                    return
+                if remaining <= 0:
+                    return
+        finally:
+            pages.close()
+            if self.checkpoint is not None:
+                self.checkpoint.flush()
+
+    def scrape_page(self, page: int) -> Optional[List[RawEntry]]:
+        """Fetch and parse a single survey page.
+
+        :param int page: Page number within the paginated survey feed.
+        :return: Raw entries on the page, or ``None`` when it could not be fetched.
+        :rtype: list[RawEntry] | None
+        """
 
-            page_entries = self._extract_raw_data(html)
-            if not page_entries:
-                print("No entries parsed on this page, stopping.")
+        url = self._page_url(page)
+        html = self._get_html(url)
+        if not html:
+            return None
+        return self._parse_html(url, html)
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch any GradCafe page through this scraper's session, cache and retries.
+
+        Safe to call from several threads, like the page prefetcher does.
+
+        :param str url: Fully-qualified URL, such as a ``/result/<id>`` page.
+        :return: HTML payload as a string, or ``None`` on failure.
+        :rtype: str | None
+        """
+
+        return self._get_html(url)
+
+    def refresh_queries(
+        self,
+        queries: Iterable[str],
+        existing_urls: Optional[Sequence[str]] = None,
+        max_workers: int = DEFAULT_REFRESH_WORKERS,
+    ) -> Dict[str, List[RawEntry]]:
+        """Crawl the ``?q=`` feed of each query concurrently.
+
+        Every feed is read page by page on its own worker and stops on its own
+        at a previously-seen URL (or the watermark), an empty page, or
+        ``max_entries``. Workers share this scraper's HTTP session, cache and
+        retry policy.
+
+        :param Iterable queries: University or program names to refresh.
+        :param Sequence existing_urls: URLs that have already been processed.
+        :param int max_workers: Maximum number of feeds crawled at once.
+        :return: New entries per query, in the order the queries were given.
+        :rtype: dict[str, list[RawEntry]]
+        """
+
+        unique_queries = list(dict.fromkeys(query for query in queries if query))
+        if not unique_queries:
+            return {}
+
+        existing = set(existing_urls or [])
+        workers = max(1, min(max_workers, len(unique_queries)))
+        self.http.reserve(workers)
+        feeds = [self._query_feed(query) for query in unique_queries]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(list, feed.iter_entries(existing)) for feed in feeds]
+            results = {query: future.result() for query, future in zip(unique_queries, futures)}
+
+        self.retries += sum(feed.retries for feed in feeds)
+        for query, entries in results.items():
+            print(f"Refreshed {query!r}: {len(entries)} NEW raw entries.")
+        return results
+
+    def _query_feed(self, query: str) -> "Scraper":
+        """Return a sequential scraper for one ``?q=`` feed sharing this one's resources.
+
+        :param str query: Search term for the feed.
+        :return: Scraper bound to the query feed.
+        :rtype: Scraper
+        """
+
+        return Scraper(
+            self.base,
+            self.max_entries,
+            cache=self.cache,
+            parser=self.parser,
+            table_only=self.table_only,
+            retry=self.retry,
+            watermark=self.watermark,
+            query=query,
+            http=self.http,
+        )
+
+    @staticmethod
+    def _unseen_entries(
+        page_entries: Sequence[RawEntry],
+        existing: set,
+        limit: int,
+        watermark: Optional[ResultWatermark] = None,
+        skipped: Optional[set] = None,
+    ) -> Tuple[List[RawEntry], bool]:
+        """Return the leading unseen entries of one page, at most ``limit`` of them.
+
+        :param Sequence page_entries: Entries parsed from a single page.
+        :param set existing: URLs that mark the end of the unseen entries.
+        :param int limit: Maximum number of entries to return.
+        :param ResultWatermark watermark: Optional watermark; IDs below its
+            tolerance window end the unseen entries and IDs it recorded inside
+            the window are skipped.
+        :param set skipped: URLs to pass over without ending the unseen entries,
+            such as those already replayed from a checkpoint.
+        :return: Tuple of unseen entries and whether a seen URL was encountered.
+        :rtype: tuple[list[RawEntry], bool]
+        """
+
+        fresh: List[RawEntry] = []
+        for entry in page_entries:
+            url = entry["url_raw"]
+            if url in existing or (watermark is not None and watermark.is_below(url)):
+                return fresh, True
+            if skipped and url in skipped:
+                continue
+            if watermark is not None and watermark.has_seen(url):
+                continue
+            fresh.append(entry)
+            if len(fresh) >= limit:
                 break
+        return fresh, False
 
-            for entry in page_entries:
-                if entry["url_raw"] in existing:
-                    print("Encountered previously-seen entry. Stopping scrape.")
-                    stop_scraping = True
-                    break
-                new_entries.append(entry)
-                if len(new_entries) >= self.max_entries:
+    def _page_url(self, page: int) -> str:
+        """Build the survey URL for the 1-based ``page`` number.
+
+        :param int page: Page number within the paginated survey feed.
+        :return: Fully-qualified URL for the requested page.
+        :rtype: str
+        """
+
+        if self.query:
+            return f"{self.base}?{urlencode({'q': self.query, 'page': page})}"
+        return f"{self.base}?page={page}"
+
+    def _iter_pages(self, start_page: int = 1) -> Iterator[PageResult]:
+        """Yield ``(page, html)`` pairs in page order, prefetching when enabled.
+
+        With ``prefetch`` greater than one, up to ``prefetch`` upcoming pages
+        are requested concurrently on a bounded thread pool that shares
+        :attr:`http`. When a concurrency controller is configured, its current
+        limit sets the window instead. Pages are still yielded strictly in
+        order, and closing the generator cancels any requests that have not
+        started yet.
+
+        :param int start_page: First page number to fetch.
+        :return: Iterator over page numbers and their HTML (``None`` on failure).
+        :rtype: Iterator[tuple[int, str | None]]
+        """
+
+        if self._max_in_flight <= 1:
+            page = start_page
+            while True:
+                yield page, self._get_html(self._page_url(page))
+                page += 1
+
+        pool = ThreadPoolExecutor(
+            max_workers=self._max_in_flight,
+            thread_name_prefix="gradcafe-fetch",
+        )
+        pending: Deque = deque()
+        next_page = start_page
+        try:
+            while True:
+                window = self.concurrency.limit if self.concurrency else self.prefetch
+                while len(pending) < max(1, window):
+                    future = pool.submit(self._get_html, self._page_url(next_page))
+                    pending.append((next_page, future))
+                    next_page += 1
+
+                page, future = pending.popleft()
+                yield page, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_parsed_pages(self, start_page: int = 1) -> Iterator[ParsedPage]:
+        """Yield ``(page, entries)`` pairs in page order.
+
+        ``entries`` is ``None`` when the page could not be fetched, after which
+        the iterator ends. With ``parse_workers`` set, raw HTML is handed to a
+        process pool so that parsing runs on other cores while this thread
+        keeps fetching. With a response cache, pages whose results table
+        matches a stored fingerprint are not parsed at all.
+
+        :param int start_page: First page number to fetch.
+        :return: Iterator over page numbers and their parsed entries.
+        :rtype: Iterator[tuple[int, list[RawEntry] | None]]
+        """
+
+        pages = self._iter_pages(start_page)
+        if self.parse_workers <= 0:
+            try:
+                for page, html in pages:
+                    if not html:
+                        yield page, None
+                        return
+                    yield page, self._parse_html(self._page_url(page), html)
+            finally:
+                pages.close()
+            return
+
+        pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            initializer=_init_parse_worker,
+            initargs=(self.parser, self.table_only),
+        )
+        pending: Deque = deque()
+        failed_page: Optional[int] = None
+        try:
+            for page, html in pages:
+                if not html:
+                    failed_page = page
                     break
+                pending.append((page, *self._submit_parse(pool, page, html)))
+                if len(pending) > self.parse_workers:
+                    yield self._finish_parse(*pending.popleft())
+
+            while pending:
+                yield self._finish_parse(*pending.popleft())
+
+            if failed_page is not None:
+                yield failed_page, None
+        finally:
+            pages.close()
+            for *_, future in pending:
+                future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _parse_html(self, url: str, html: str) -> List[RawEntry]:
+        """Parse ``html`` unless the cache holds a parse of an identical table.
+
+        :param str url: URL the page was fetched from.
+        :param str html: Raw HTML of the survey page.
+        :return: Raw entries on the page.
+        :rtype: list[RawEntry]
+        """
 
-            page += 1
+        fingerprint, stored = self._stored_parse(url, html)
+        if stored is not None:
+            return entries_from_tuples(stored)
+        entries = self._extract_raw_data(html)
+        if fingerprint:
+            self.cache.store_parsed(url, fingerprint, entries_to_tuples(entries))
+        return entries
+
+    def _stored_parse(self, url: str, html: str) -> Tuple[str, Optional[List[EntryTuple]]]:
+        """Look up a stored parse of ``url`` whose table matches ``html``.
+
+        :param str url: URL the page was fetched from.
+        :param str html: Raw HTML of the survey page.
+        :return: The page fingerprint (``""`` without a cache) and the stored
+            entry tuples, or ``None`` when the page has to be parsed.
+        :rtype: tuple[str, list[tuple[str, ...]] | None]
+        """
 
-        print(f"Finished scraping. Collected {len(new_entries)} NEW raw entries.")
-        print("")
-        return new_entries
+        if self.cache is None:
+            return "", None
+        fingerprint = page_fingerprint(html)
+        return fingerprint, self.cache.get_parsed(url, fingerprint)
+
+    def _submit_parse(
+        self,
+        pool: ProcessPoolExecutor,
+        page: int,
+        html: str,
+    ) -> Tuple[str, str, bool, Future]:
+        """Hand ``html`` to the parser pool unless a stored parse still matches.
+
+        :param ProcessPoolExecutor pool: Parser worker pool.
+        :param int page: Page number.
+        :param str html: Raw HTML of the survey page.
+        :return: Page URL, fingerprint, whether the page is being parsed, and
+            a future resolving to its entry tuples.
+        :rtype: tuple[str, str, bool, concurrent.futures.Future]
+        """
+
+        url = self._page_url(page)
+        fingerprint, stored = self._stored_parse(url, html)
+        if stored is None:
+            return url, fingerprint, True, pool.submit(parse_page, html)
+        future: Future = Future()
+        future.set_result(stored)
+        return url, fingerprint, False, future
+
+    def _finish_parse(  # pylint: disable=too-many-arguments
+        self,
+        page: int,
+        url: str,
+        fingerprint: str,
+        parsed: bool,
+        future: Future,
+    ) -> ParsedPage:
+        """Collect a page from the parser pool, storing fresh parses in the cache.
+
+        :param int page: Page number.
+        :param str url: URL the page was fetched from.
+        :param str fingerprint: Page fingerprint, ``""`` without a cache.
+        :param bool parsed: Whether ``future`` ran the parser rather than
+            holding a stored parse.
+        :param Future future: Future resolving to entry tuples.
+        :return: Page number and its raw entries.
+        :rtype: tuple[int, list[RawEntry]]
+        """
+
+        rows = future.result()
+        if parsed and fingerprint:
+            self.cache.store_parsed(url, fingerprint, rows)
+        return page, entries_from_tuples(rows)
 
     def _get_html(self, url: str) -> Optional[str]:
         """Retrieve the raw HTML for a given paginated survey URL.
 
+        When a response cache is configured, the request carries the cached
+        validators and a ``304 Not Modified`` answer is served from disk.
+
         :param str url: Fully-qualified URL to fetch.
         :return: HTML payload as a string, or ``None`` on failure.
         :rtype: str | None
         """
 
-        response = self.http.request("GET", url)
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = cached.conditional_headers() if cached is not None else {}
+
+        response = self._request(url, headers)
+        if response is None:
+            return None
+        if response.status == 304 and cached is not None:
+            self.cache.record_hit()
+            return cached.body
         if response.status != 200:
             return None
-        return response.data.decode("utf-8")
 
-    def _extract_raw_data(self, html: str) -> List[dict]:
-        """Parse a survey page into raw applicant dictionaries.
+        html = response.data.decode("utf-8")
+        if self.cache is not None:
+            self.cache.record_miss()
+            self.cache.store(
+                url,
+                html,
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+            )
+        return html
 
-        :param str html: Raw HTML returned by the survey page.
-        :return: List of dictionaries representing applicant entries.
-        :rtype: list[dict]
-        """
+    def _request(self, url: str, headers: Dict[str, str]):
+        """Issue a GET for ``url``, retrying throttled and failed attempts.
 
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.select("tbody tr")
-        if not rows:
-            return []
+        Connection errors and ``RETRYABLE_STATUSES`` responses are retried
+        after a jittered exponential backoff, or after the server's
+        ``Retry-After`` delay when one is given. Outcomes are reported to the
+        concurrency controller, if any.
+
+        :param str url: Fully-qualified URL to fetch.
+        :param dict headers: Extra request headers.
+        :return: Final response, or ``None`` when every attempt failed.
+        :rtype: urllib3.BaseHTTPResponse | None
+        """
 
-        parsed_entries: List[dict] = []
-        index = 0
-        total_rows = len(rows)
+        for attempt in range(self.retry.max_attempts):
+            started = time.monotonic()
+            retry_after = None
+            try:
+                response = self.http.request("GET", url, headers=headers or None)
+            except urllib3.exceptions.HTTPError as error:
+                reason = f"{type(error).__name__}: {error}"
+            else:
+                if response.status not in RETRYABLE_STATUSES:
+                    if self.concurrency is not None:
+                        self.concurrency.record_success(time.monotonic() - started)
+                    return response
+                reason = f"HTTP {response.status}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if self.concurrency is not None:
+                self.concurrency.record_throttle()
+            if attempt + 1 >= self.retry.max_attempts:
+                break
 
-        while index < total_rows:
-            entry, consumed = self._parse_entry(rows, index)
-            index += consumed
-            if entry is not None:
-                parsed_entries.append(entry)
+            delay = self.retry.delay(attempt, retry_after)
+            self.retries += 1
+            print(f"Retrying {url} in {delay:.1f}s after {reason}.")
+            time.sleep(delay)
 
-        return parsed_entries
+        print(f"Giving up on {url} after {self.retry.max_attempts} attempts ({reason}).")
+        return None
 
-    def _parse_entry(self, rows: Sequence, start_index: int) -> Tuple[Optional[dict], int]:
-        """Parse rows starting at ``start_index`` into an entry and consumed count.
+    def _extract_raw_data(self, html: str) -> List[RawEntry]:
+        """Parse a survey page into raw applicant entries.
 
-        :param Sequence rows: Sequence of table rows from the survey page.
-        :param int start_index: Index of the row to interpret as the main entry.
-        :return: Tuple of parsed entry dict (or ``None``) and rows consumed.
-        :rtype: tuple[dict | None, int]
+        :param str html: Raw HTML returned by the survey page.
+        :return: List of raw entries representing applicants.
+        :rtype: list[RawEntry]
         """
 
-        row = rows[start_index]
-        main_entry = self._parse_main_row(row)
-        if main_entry is None:
-            return None, 1
+        parse_only = SoupStrainer("tbody") if self.table_only else None
+        soup = BeautifulSoup(html, self.parser, parse_only=parse_only)
+        return self._classify_rows(self._table_rows(soup))
 
-        consumed = 1
-        total_rows = len(rows)
-        next_index = start_index + consumed
+    @staticmethod
+    def _table_rows(soup) -> List:
+        """Return every ``<tr>`` inside a ``<tbody>``, in document order.
 
-        if next_index < total_rows:
-            metadata, used = self._extract_metadata(rows[next_index])
-            if metadata:
-                main_entry["meta_raw"] = metadata
-                consumed += used
-                next_index += used
+        Matches ``soup.select("tbody tr")`` without going through the CSS
+        selector engine; nested ``<tbody>`` elements are covered by their
+        outermost ancestor so no row is returned twice.
 
-        if next_index < total_rows:
-            comments, used = self._extract_comments(rows[next_index])
-            if comments:
-                main_entry["comments_raw"] = comments
-                consumed += used
+        :param bs4.BeautifulSoup soup: Parsed survey page.
+        :return: Table body rows.
+        :rtype: list[bs4.element.Tag]
+        """
 
-        return main_entry, consumed
+        return [
+            row
+            for body in soup.find_all("tbody")
+            if body.find_parent("tbody") is None
+            for row in body.find_all("tr")
+        ]
 
     @staticmethod
-    def _parse_main_row(row) -> Optional[dict]:
-        """Derive the base entry information from the primary row.
-
-        :param bs4.element.Tag row: Table row containing the primary entry data.
-        :return: Parsed entry dictionary or ``None`` when the row is not valid.
-        :rtype: dict | None
+    def _classify_rows(rows: Sequence) -> List[RawEntry]:
+        """Label each row as main, metadata or comment in a single pass.
+
+        The row right after a main row is its metadata when its text mentions
+        a term, GPA or applicant origin. The next row (or the row right after
+        the main row, when there was no metadata) is its comment when its
+        first ``<p>`` holds text. Every other row starts a new entry if it
+        looks like a main row and is skipped otherwise.
+
+        :param Sequence rows: Table rows from the survey page, in order.
+        :return: Raw entries assembled from the rows.
+        :rtype: list[RawEntry]
         """
 
-        if not Scraper._has_university_cell(row):
-            return None
-
-        cells = row.find_all("td")
-        program, degree = Scraper._parse_program_and_degree(cells)
-
-        return {
-            "university_raw": Scraper._cell_text(cells, 0),
-            "program_raw": program,
-            "degree_raw": degree,
-            "date_added_raw": Scraper._cell_text(cells, 2),
-            "status_raw": Scraper._cell_text(cells, 3),
-            "url_raw": Scraper._extract_result_url(row),
-            "meta_raw": "",
-            "comments_raw": "",
-        }
+        entries: List[RawEntry] = []
+        current: Optional[RawEntry] = None
+        expecting = _EXPECT_MAIN
+
+        for row in rows:
+            if expecting == _EXPECT_METADATA:
+                expecting = _EXPECT_COMMENT
+                meta_text = row.get_text(" | ", strip=True)
+                if _METADATA_PATTERN.search(meta_text):
+                    current.meta_raw = meta_text
+                    continue
+
+            if expecting == _EXPECT_COMMENT:
+                expecting = _EXPECT_MAIN
+                paragraph = row.find("p")
+                comments = paragraph.get_text(" ", strip=True) if paragraph else ""
+                if comments:
+                    current.comments_raw = comments
+                    continue
+
+            current = Scraper._parse_main_row(row)
+            if current is not None:
+                entries.append(current)
+                expecting = _EXPECT_METADATA
+
+        return entries
 
     @staticmethod
-    def _has_university_cell(row) -> bool:
-        """Return whether the row looks like a main applicant entry.
+    def _parse_main_row(row) -> Optional[RawEntry]:
+        """Derive the base entry from a row, or ``None`` if it is not a main row.
 
-        :param bs4.element.Tag row: Candidate table row from the survey.
-        :return: ``True`` when the row contains university information.
-        :rtype: bool
+        One walk over the row's tags collects its cells and result link and
+        checks for a ``.tw-font-medium`` university marker inside a cell.
+
+        :param bs4.element.Tag row: Table row that may hold the primary entry data.
+        :return: Parsed entry or ``None`` when the row is not valid.
+        :rtype: RawEntry | None
         """
 
-        if row.select_one("td .tw-font-medium"):
-            return True
-        first_td = row.select_one("td")
-        return bool(first_td and first_td.get_text(strip=True))
+        cells = []
+        link = None
+        has_university = False
+        for tag in row.find_all(True):
+            if tag.name == "td":
+                cells.append(tag)
+            elif tag.name == "a" and link is None and tag.get("href") is not None:
+                link = tag
+            if (
+                not has_university
+                and "tw-font-medium" in tag.get("class", ())
+                and tag.find_parent("td") is not None
+            ):
+                has_university = True
+
+        if not has_university and not (cells and cells[0].get_text(strip=True)):
+            return None
+
+        program, degree = Scraper._parse_program_and_degree(cells)
+
+        return RawEntry(
+            university_raw=Scraper._cell_text(cells, 0),
+            program_raw=program,
+            degree_raw=degree,
+            date_added_raw=Scraper._cell_text(cells, 2),
+            status_raw=Scraper._cell_text(cells, 3),
+            url_raw=Scraper._result_url(link),
+        )
 
     @staticmethod
     def _cell_text(cells: Sequence, index: int) -> str:
@@ -226,7 +762,7 @@ class Scraper:
             return program, degree
 
         column = cells[1]
-        spans = column.select("span")
+        spans = column.find_all("span")
         if spans:
             program = spans[0].get_text(strip=True)
             if len(spans) >= 2:
@@ -256,16 +792,15 @@ class Scraper:
         return ""
 
     @staticmethod
-    def _extract_result_url(row) -> str:
-        """Return the absolute result URL if present in the row.
+    def _result_url(anchor) -> str:
+        """Return the absolute result URL for the row's first link.
 
-        :param bs4.element.Tag row: Table row that may contain a result link.
+        :param bs4.element.Tag anchor: First ``<a href>`` in the row, or ``None``.
         :return: Absolute result URL or ``""`` when not found.
         :rtype: str
         """
 
-        anchor = row.find("a", href=True)
-        if not anchor:
+        if anchor is None:
             return ""
         href = anchor["href"]
         if href.startswith("http"):
@@ -274,30 +809,51 @@ class Scraper:
             return f"https://www.thegradcafe.com{href}"
         return ""
 
-    @staticmethod
-    def _extract_metadata(row) -> Tuple[str, int]:
-        """Return metadata text and rows consumed when the row contains stats.
 
-        :param bs4.element.Tag row: Table row potentially holding metadata.
-        :return: Tuple of metadata text and number of rows consumed.
-        :rtype: tuple[str, int]
-        """
+def entries_to_tuples(entries: Sequence[RawEntry]) -> List[EntryTuple]:
+    """Flatten raw entries into tuples ordered by ``RAW_ENTRY_FIELDS``.
 
-        meta_text = row.get_text(" | ", strip=True)
-        if re.search(r"(Fall|Spring)\s*\d{4}|GPA\s*\d|American|International", meta_text, re.I):
-            return meta_text, 1
-        return "", 0
+    :param Sequence entries: Raw entries (or legacy dictionaries) from the scraper.
+    :return: Plain tuples that are cheap to pickle between processes.
+    :rtype: list[tuple[str, ...]]
+    """
 
-    @staticmethod
-    def _extract_comments(row) -> Tuple[str, int]:
-        """Return comment text and consumption flag.
+    return [tuple(entry[field] for field in RAW_ENTRY_FIELDS) for entry in entries]
 
-        :param bs4.element.Tag row: Table row possibly containing comments.
-        :return: Tuple of comment text and rows consumed.
-        :rtype: tuple[str, int]
-        """
 
-        paragraph = row.find("p")
-        if paragraph and paragraph.get_text(strip=True):
-            return paragraph.get_text(" ", strip=True), 1
-        return "", 0
+def entries_from_tuples(rows: Sequence[EntryTuple]) -> List[RawEntry]:
+    """Rebuild raw entries from tuples made by :func:`entries_to_tuples`.
+
+    :param Sequence rows: Tuples ordered by ``RAW_ENTRY_FIELDS``.
+    :return: Raw entries.
+    :rtype: list[RawEntry]
+    """
+
+    return [RawEntry(*row) for row in rows]
+
+
+def _init_parse_worker(parser: str = "html.parser", table_only: bool = False) -> None:
+    """Create the parse-only scraper used by a parser worker process.
+
+    :param str parser: BeautifulSoup tree builder for the worker.
+    :param bool table_only: Whether the worker parses only ``<tbody>`` elements.
+    :return: ``None``
+    :rtype: None
+    """
+
+    _WORKER_STATE["scraper"] = Scraper(max_entries=0, parser=parser, table_only=table_only)
+
+
+def parse_page(html: str) -> List[EntryTuple]:
+    """Parse one survey page inside a parser worker process.
+
+    :param str html: Raw HTML of a survey page.
+    :return: Parsed entries as plain tuples ordered by ``RAW_ENTRY_FIELDS``.
+    :rtype: list[tuple[str, ...]]
+    """
+
+    scraper = _WORKER_STATE.get("scraper")
+    if scraper is None:
+        _init_parse_worker()
+        scraper = _WORKER_STATE["scraper"]
+    return entries_to_tuples(scraper._extract_raw_data(html))  # pylint: disable=protected-access
@@ -0,0 +1,126 @@
+"""Range checks for the numeric scores of cleaned applicant records."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, MutableMapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from homework_sample_code.course_app.clean import float_column
+
+
+class ValidationRule(NamedTuple):
+    """Inclusive range (and optional step) a numeric field must respect."""
+
+    name: str
+    field: str
+    minimum: float
+    maximum: float
+    step: Optional[float] = None
+
+
+# GRE scores use the 130-170 section scale (260-340 total) introduced in 2011;
+# analytical writing is scored 0-6 in half points.
+VALIDATION_RULES = (
+    ValidationRule("gpa_range", "GPA", 0.0, 4.3),
+    ValidationRule("gre_range", "GRE", 260.0, 340.0),
+    ValidationRule("gre_verbal_range", "GRE V", 130.0, 170.0),
+    ValidationRule("gre_aw_range", "GRE AW", 0.0, 6.0, step=0.5),
+)
+
+
+def find_violations(
+    columns: Mapping[str, np.ndarray],
+    rules: Sequence[ValidationRule] = VALIDATION_RULES,
+) -> Dict[str, np.ndarray]:
+    """Flag the values that break each rule.
+
+    Missing values (NaN) never break a rule.
+
+    :param Mapping columns: Float arrays keyed by field, e.g. from ``clean.to_columns``.
+    :param Sequence rules: Rules to check; fields absent from ``columns`` are skipped.
+    :return: Boolean mask per rule name, ``True`` where the value is invalid.
+    :rtype: dict[str, numpy.ndarray]
+    """
+
+    violations: Dict[str, np.ndarray] = {}
+    for rule in rules:
+        if rule.field not in columns:
+            continue
+        values = np.asarray(columns[rule.field], dtype=np.float64)
+        invalid = (values < rule.minimum) | (values > rule.maximum)
+        if rule.step:
+            with np.errstate(invalid="ignore"):
+                invalid |= np.fmod(values, rule.step) != 0
+        violations[rule.name] = invalid & ~np.isnan(values)
+    return violations
+
+
+class ScoreValidator:
+    """Null out impossible GPA and GRE values and count them per rule."""
+
+    def __init__(self, rules: Sequence[ValidationRule] = VALIDATION_RULES) -> None:
+        """Prepare a validator with empty counters.
+
+        :param Sequence rules: Rules to enforce.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.rules = tuple(rules)
+        self.checked = 0
+        self.violations: Dict[str, int] = {rule.name: 0 for rule in self.rules}
+
+    def validate_columns(self, columns: MutableMapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Replace invalid values in ``columns`` with NaN, in place.
+
+        :param MutableMapping columns: Float arrays keyed by field.
+        :return: Boolean mask per rule name, ``True`` where a value was nulled.
+        :rtype: dict[str, numpy.ndarray]
+        """
+
+        violations = find_violations(columns, self.rules)
+        fields = {rule.name: rule.field for rule in self.rules}
+        for name, invalid in violations.items():
+            self.violations[name] += int(np.count_nonzero(invalid))
+            column = np.asarray(columns[fields[name]], dtype=np.float64)
+            column[invalid] = np.nan
+            columns[fields[name]] = column
+        self.checked += max((len(mask) for mask in violations.values()), default=0)
+        return violations
+
+    def validate_records(self, records: List[MutableMapping[str, object]]) -> int:
+        """Blank the invalid scores of cleaned records, in place.
+
+        The checks run on float arrays built from the records; only the
+        records with an invalid value are touched afterwards.
+
+        :param list records: Cleaned entries such as ``Cleaner.clean_data`` returns.
+        :return: Number of values blanked.
+        :rtype: int
+        """
+
+        columns = {rule.field: float_column([record.get(rule.field) for record in records])
+                   for rule in self.rules}
+        violations = self.validate_columns(columns)
+
+        blanked = 0
+        for rule in self.rules:
+            for index in np.flatnonzero(violations[rule.name]):
+                records[index][rule.field] = ""
+                blanked += 1
+        return blanked
+
+    def summary(self) -> str:
+        """Describe how many values were nulled by each rule.
+
+        :return: One-line validation summary.
+        :rtype: str
+        """
+
+        total = sum(self.violations.values())
+        details = ", ".join(f"{name} {count}" for name, count in self.violations.items() if count)
+        return (
+            f"Validation: checked {self.checked} entries, nulled {total} out-of-range values"
+            + (f" ({details})." if details else ".")
+        )
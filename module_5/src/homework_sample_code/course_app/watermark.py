@@ -0,0 +1,162 @@
+"""Result-ID watermark that lets incremental scrapes skip the full dataset."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Optional, Set, Union
+
+
+WatermarkPath = Union[str, Path]
+
+DEFAULT_TOLERANCE = 100
+
+_RESULT_ID_PATTERN = re.compile(r"/result/(\d+)")
+
+
+def result_id(url: str) -> Optional[int]:
+    """Return the numeric GradCafe result ID embedded in ``url``.
+
+    :param str url: Result URL such as ``https://www.thegradcafe.com/result/935454``.
+    :return: Result ID, or ``None`` when the URL carries none.
+    :rtype: int | None
+    """
+
+    match = _RESULT_ID_PATTERN.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+class ResultWatermark:
+    """Highest ingested result ID plus the IDs seen just below it.
+
+    GradCafe result IDs grow monotonically and the survey lists newest first,
+    so everything older than the watermark has already been ingested. Entries
+    can be published slightly out of order, so IDs within ``tolerance`` of the
+    watermark are checked one by one against the recently ingested IDs instead
+    of being treated as old.
+    """
+
+    def __init__(self, path: WatermarkPath, tolerance: int = DEFAULT_TOLERANCE) -> None:
+        """Load the watermark stored at ``path``, if any.
+
+        :param str | pathlib.Path path: JSON file holding the watermark.
+        :param int tolerance: Number of IDs below the watermark that may still
+            hold late inserts.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.path = Path(path)
+        self.tolerance = max(0, tolerance)
+        self.max_id: Optional[int] = None
+        self.entry_count = 0
+        self._recent: Set[int] = set()
+
+        if self.path.exists():
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+            self.max_id = state.get("max_id")
+            self.entry_count = state.get("entry_count", 0)
+            self._recent = set(state.get("recent", []))
+
+    @property
+    def is_set(self) -> bool:
+        """Whether any result ID has been recorded yet.
+
+        :return: ``True`` once the watermark holds a result ID.
+        :rtype: bool
+        """
+
+        return self.max_id is not None
+
+    @property
+    def floor(self) -> Optional[int]:
+        """Lowest result ID that may still be a late insert.
+
+        :return: ``max_id - tolerance``, or ``None`` while the watermark is unset.
+        :rtype: int | None
+        """
+
+        return None if self.max_id is None else self.max_id - self.tolerance
+
+    def is_below(self, url: str) -> bool:
+        """Return whether ``url`` is older than the tolerance window.
+
+        :param str url: Result URL from the survey.
+        :return: ``True`` when the scrape has reached already-ingested history.
+        :rtype: bool
+        """
+
+        identifier = result_id(url)
+        floor = self.floor
+        return identifier is not None and floor is not None and identifier < floor
+
+    def has_seen(self, url: str) -> bool:
+        """Return whether ``url`` was ingested, judged by its result ID alone.
+
+        :param str url: Result URL from the survey.
+        :return: ``True`` for IDs below the window or recorded inside it.
+        :rtype: bool
+        """
+
+        return self.is_below(url) or result_id(url) in self._recent
+
+    def advance(self, urls: Iterable[str]) -> None:
+        """Record newly ingested result URLs.
+
+        Call this only after the entries are stored; moving the watermark
+        while a scrape is still running would end that scrape early.
+
+        :param Iterable urls: URLs of the ingested entries.
+        :return: ``None``
+        :rtype: None
+        """
+
+        for url in urls:
+            identifier = result_id(url)
+            if identifier is None:
+                continue
+            self._recent.add(identifier)
+            if self.max_id is None or identifier > self.max_id:
+                self.max_id = identifier
+
+    def mark_seen(self, urls: Iterable[str]) -> None:
+        """Record ingested result URLs without moving the watermark.
+
+        Used for entries collected out of feed order, such as a targeted
+        ``?q=`` refresh: raising ``max_id`` to their IDs would make the next
+        full crawl stop before the older entries it has not ingested yet.
+
+        :param Iterable urls: URLs of the ingested entries.
+        :return: ``None``
+        :rtype: None
+        """
+
+        for url in urls:
+            identifier = result_id(url)
+            if identifier is not None:
+                self._recent.add(identifier)
+
+    def save(self, entry_count: int) -> None:
+        """Write the watermark atomically, keeping only IDs inside the window.
+
+        :param int entry_count: Total number of entries in the dataset.
+        :return: ``None``
+        :rtype: None
+        """
+
+        floor = self.floor
+        if floor is not None:
+            self._recent = {identifier for identifier in self._recent if identifier >= floor}
+        self.entry_count = entry_count
+
+        state = {
+            "max_id": self.max_id,
+            "entry_count": entry_count,
+            "recent": sorted(self._recent, reverse=True),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(temporary, self.path)
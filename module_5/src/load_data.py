@@ -3,7 +3,7 @@
 import json
 from datetime import datetime, date
 from pathlib import Path
-from typing import Any, Mapping, Optional, Tuple, Union, cast
+from typing import Any, Iterable, Mapping, Optional, Tuple, Union, cast
 
 from psycopg import Connection, OperationalError, errors, sql
 from psycopg.conninfo import conninfo_to_dict
@@ -35,6 +35,7 @@ INSERT_COLUMNS = [
     "degree",
     "llm_generated_program",
     "llm_generated_university",
+    "duplicate_cluster",
 ]
 INSERT_COLUMNS_SQL = sql.SQL(", ").join(sql.Identifier(name) for name in INSERT_COLUMNS)
 PLACEHOLDERS_SQL = sql.SQL(", ").join(sql.Placeholder() for _ in INSERT_COLUMNS)
@@ -129,6 +130,7 @@ def _build_applicant_row(applicant: Mapping[str, Any]) -> Tuple[Any, ...]:
         applicant.get("Degree"),
         _llm_text(applicant.get("llm-generated-program")),
         _llm_text(applicant.get("llm-generated-university")),
+        applicant.get("duplicate_cluster") or None,
     )
 
 
@@ -209,6 +211,9 @@ def setup_database(database_url: str) -> None:
 def setup_table(database_url: str) -> None:
     """Ensure the ``applicants`` table exists inside ``gradcafe``.
 
+    Tables created before near-duplicate detection gain the
+    ``duplicate_cluster`` column.
+
     :param str database_url: Connection string targeting the ``gradcafe`` database.
     :return: ``None``
     :rtype: None
@@ -238,8 +243,10 @@ def setup_table(database_url: str) -> None:
             gre_aw FLOAT,
             degree TEXT,
             llm_generated_program TEXT,
-            llm_generated_university TEXT
+            llm_generated_university TEXT,
+            duplicate_cluster TEXT
         );
+        ALTER TABLE {table} ADD COLUMN IF NOT EXISTS duplicate_cluster TEXT;
         """
     ).format(table=APPLICANTS_TABLE)
     with managed_connection(db_connection) as connection_ctx:
@@ -282,6 +289,38 @@ def load_json_to_db(json_path: JsonPath, database_url: str) -> None:
     print("JSON data loaded from scratch into empty applicants table.")
 
 
+def insert_applicants(applicants: Iterable[Mapping[str, Any]], database_url: str) -> int:
+    """Append cleaned applicant records to the ``applicants`` table.
+
+    Unlike :func:`load_json_to_db`, existing rows are kept, so only newly
+    scraped entries need to be written.
+
+    :param Iterable applicants: Cleaned applicant mappings to insert.
+    :param str database_url: Connection string targeting the ``gradcafe`` database.
+    :return: Number of rows inserted.
+    :rtype: int
+    """
+
+    raw_connection: Optional[Connection] = create_connection(database_url)
+
+    if raw_connection is None:
+        return 0
+
+    db_connection = cast(Connection, raw_connection)
+    inserted = 0
+
+    with managed_connection(db_connection) as connection_ctx:
+        with managed_cursor(connection_ctx) as cursor:
+            for applicant in applicants:
+                cursor.execute(INSERT_APPLICANT, _build_applicant_row(applicant))
+                inserted += 1
+
+        _commit_if_available(connection_ctx)
+
+    print(f"Inserted {inserted} new applicants.")
+    return inserted
+
+
 def load_data() -> None:
     """Run the full data-loading pipeline for the admissions dataset.
 
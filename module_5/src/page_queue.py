@@ -0,0 +1,440 @@
+"""Postgres-backed page work queue for scraping GradCafe across many workers.
+
+Pages are claimed in small batches with ``FOR UPDATE SKIP LOCKED`` so that any
+number of worker processes, on any number of hosts, scrape disjoint pages. A
+claim is a lease: if a worker dies, its pages become claimable again once the
+lease expires.
+
+The survey is newest-first, so results drift to later pages while a backfill
+runs and the same result can be scraped from two different pages. Raw entries
+are therefore unique by ``url_raw``: the first copy stored is kept and later
+copies are dropped.
+"""
+
+import argparse
+import os
+import socket
+from typing import Any, List, Mapping, Optional, Sequence
+
+from psycopg import Connection, sql
+
+from homework_sample_code.course_app.records import RAW_ENTRY_FIELDS
+from homework_sample_code.course_app.scrape import Scraper
+from homework_sample_code.course_app.utils import (
+    DEFAULT_DB_CONFIG,
+    connect,
+    managed_connection,
+    managed_cursor,
+)
+
+
+PAGE_QUEUE_TABLE = sql.Identifier("page_queue")
+RAW_ENTRIES_TABLE = sql.Identifier("raw_entries")
+
+STATUS_PENDING = sql.Literal("pending")
+STATUS_LEASED = sql.Literal("leased")
+STATUS_DONE = sql.Literal("done")
+STATUS_FAILED = sql.Literal("failed")
+
+DEFAULT_BATCH_SIZE = 5
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 5
+
+CREATE_PAGE_QUEUE = sql.SQL(
+    """
+    CREATE TABLE IF NOT EXISTS {table} (
+        page INTEGER PRIMARY KEY,
+        status TEXT NOT NULL DEFAULT {pending},
+        worker_id TEXT,
+        lease_expires_at TIMESTAMPTZ,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        completed_at TIMESTAMPTZ
+    );
+    """
+).format(table=PAGE_QUEUE_TABLE, pending=STATUS_PENDING)
+
+CREATE_PAGE_QUEUE_INDEX = sql.SQL(
+    "CREATE INDEX IF NOT EXISTS {index} ON {table} (status, lease_expires_at)"
+).format(index=sql.Identifier("page_queue_claim_idx"), table=PAGE_QUEUE_TABLE)
+
+CREATE_RAW_ENTRIES = sql.SQL(
+    """
+    CREATE TABLE IF NOT EXISTS {table} (
+        page INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        {columns},
+        scraped_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        PRIMARY KEY (page, position)
+    );
+    """
+).format(
+    table=RAW_ENTRIES_TABLE,
+    columns=sql.SQL(", ").join(
+        sql.SQL("{} TEXT").format(sql.Identifier(field)) for field in RAW_ENTRY_FIELDS
+    ),
+)
+
+ENQUEUE_PAGES = sql.SQL(
+    """
+    INSERT INTO {table} (page)
+    SELECT generate_series({first}, {last})
+    ON CONFLICT (page) DO NOTHING
+    """
+).format(table=PAGE_QUEUE_TABLE, first=sql.Placeholder(), last=sql.Placeholder())
+
+CLAIM_PAGES = sql.SQL(
+    """
+    UPDATE {table}
+    SET status = {leased},
+        worker_id = {worker},
+        lease_expires_at = now() + make_interval(secs => {lease}),
+        attempts = attempts + 1
+    WHERE page IN (
+        SELECT page
+        FROM {table}
+        WHERE status = {pending}
+           OR (status = {leased} AND lease_expires_at < now() AND attempts < {max_attempts})
+        ORDER BY page
+        LIMIT {batch}
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING page
+    """
+).format(
+    table=PAGE_QUEUE_TABLE,
+    leased=STATUS_LEASED,
+    pending=STATUS_PENDING,
+    worker=sql.Placeholder(),
+    lease=sql.Placeholder(),
+    max_attempts=sql.Placeholder(),
+    batch=sql.Placeholder(),
+)
+
+# A page whose worker died (e.g. crashed on it) before releasing it is only
+# noticed when its lease expires; give up on it once its claims are used up.
+FAIL_EXPIRED_PAGES = sql.SQL(
+    """
+    UPDATE {table}
+    SET status = {failed}, lease_expires_at = NULL
+    WHERE status = {leased} AND lease_expires_at < now() AND attempts >= {max_attempts}
+    """
+).format(
+    table=PAGE_QUEUE_TABLE,
+    failed=STATUS_FAILED,
+    leased=STATUS_LEASED,
+    max_attempts=sql.Placeholder(),
+)
+
+MARK_PAGE_DONE = sql.SQL(
+    """
+    UPDATE {table}
+    SET status = {done}, completed_at = now(), lease_expires_at = NULL
+    WHERE page = {page} AND worker_id = {worker} AND status = {leased}
+    RETURNING page
+    """
+).format(
+    table=PAGE_QUEUE_TABLE,
+    done=STATUS_DONE,
+    leased=STATUS_LEASED,
+    page=sql.Placeholder(),
+    worker=sql.Placeholder(),
+)
+
+RELEASE_PAGE = sql.SQL(
+    """
+    UPDATE {table}
+    SET status = CASE WHEN attempts >= {max_attempts} THEN {failed} ELSE {pending} END,
+        lease_expires_at = NULL
+    WHERE page = {page} AND worker_id = {worker} AND status = {leased}
+    """
+).format(
+    table=PAGE_QUEUE_TABLE,
+    failed=STATUS_FAILED,
+    pending=STATUS_PENDING,
+    leased=STATUS_LEASED,
+    max_attempts=sql.Placeholder(),
+    page=sql.Placeholder(),
+    worker=sql.Placeholder(),
+)
+
+DELETE_PAGE_ENTRIES = sql.SQL("DELETE FROM {table} WHERE page = {page}").format(
+    table=RAW_ENTRIES_TABLE,
+    page=sql.Placeholder(),
+)
+
+# Partial so that entries without a result link never collide with each other.
+CREATE_RAW_ENTRIES_URL_INDEX = sql.SQL(
+    "CREATE UNIQUE INDEX IF NOT EXISTS {index} ON {table} (url_raw) WHERE url_raw <> ''"
+).format(index=sql.Identifier("raw_entries_url_raw_key"), table=RAW_ENTRIES_TABLE)
+
+INSERT_RAW_ENTRY = sql.SQL(
+    """
+    INSERT INTO {table} ({columns}) VALUES ({values})
+    ON CONFLICT (url_raw) WHERE url_raw <> '' DO NOTHING
+    """
+).format(
+    table=RAW_ENTRIES_TABLE,
+    columns=sql.SQL(", ").join(
+        sql.Identifier(name) for name in ("page", "position", *RAW_ENTRY_FIELDS)
+    ),
+    values=sql.SQL(", ").join(sql.Placeholder() for _ in range(len(RAW_ENTRY_FIELDS) + 2)),
+)
+
+
+def _commit(connection: Connection) -> None:
+    """Commit the pending transaction when supported by the connection.
+
+    :param Connection connection: Psycopg connection that may expose ``commit``.
+    :return: ``None``
+    :rtype: None
+    """
+
+    commit = getattr(connection, "commit", None)
+    if callable(commit):
+        commit()
+
+
+def _rollback(connection: Connection) -> None:
+    """Roll back the pending transaction when supported by the connection.
+
+    :param Connection connection: Psycopg connection that may expose ``rollback``.
+    :return: ``None``
+    :rtype: None
+    """
+
+    rollback = getattr(connection, "rollback", None)
+    if callable(rollback):
+        rollback()
+
+
+def default_worker_id() -> str:
+    """Return an identifier that is unique per worker process and host.
+
+    :return: ``"<hostname>:<pid>"`` string.
+    :rtype: str
+    """
+
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def setup_page_queue(connection: Connection) -> None:
+    """Create the ``page_queue`` and ``raw_entries`` tables if needed.
+
+    :param Connection connection: Open connection to the ``gradcafe`` database.
+    :return: ``None``
+    :rtype: None
+    """
+
+    with managed_cursor(connection) as cursor:
+        cursor.execute(CREATE_PAGE_QUEUE)
+        cursor.execute(CREATE_PAGE_QUEUE_INDEX)
+        cursor.execute(CREATE_RAW_ENTRIES)
+        cursor.execute(CREATE_RAW_ENTRIES_URL_INDEX)
+    _commit(connection)
+
+
+def enqueue_pages(connection: Connection, first_page: int, last_page: int) -> None:
+    """Add pages ``first_page`` through ``last_page`` to the queue.
+
+    Pages that are already queued keep their current state.
+
+    :param Connection connection: Open connection to the ``gradcafe`` database.
+    :param int first_page: First page number to enqueue.
+    :param int last_page: Last page number to enqueue (inclusive).
+    :return: ``None``
+    :rtype: None
+    """
+
+    with managed_cursor(connection) as cursor:
+        cursor.execute(ENQUEUE_PAGES, (first_page, last_page))
+    _commit(connection)
+
+
+def claim_pages(
+    connection: Connection,
+    worker_id: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> List[int]:
+    """Lease up to ``batch_size`` pending or expired pages for ``worker_id``.
+
+    Expired pages that have used up ``max_attempts`` claims are marked
+    ``failed`` instead of being claimed again.
+
+    :param Connection connection: Open connection to the ``gradcafe`` database.
+    :param str worker_id: Identifier recorded as the lease holder.
+    :param int batch_size: Maximum number of pages to claim.
+    :param int lease_seconds: Seconds before an unfinished claim expires.
+    :param int max_attempts: Claims allowed before a page is given up on.
+    :return: Claimed page numbers in ascending order.
+    :rtype: list[int]
+    """
+
+    with managed_cursor(connection) as cursor:
+        cursor.execute(FAIL_EXPIRED_PAGES, (max_attempts,))
+        cursor.execute(CLAIM_PAGES, (worker_id, lease_seconds, max_attempts, batch_size))
+        pages = sorted(row[0] for row in cursor.fetchall())
+    _commit(connection)
+    return pages
+
+
+def complete_page(
+    connection: Connection,
+    page: int,
+    worker_id: str,
+    entries: Sequence[Mapping[str, Any]],
+) -> bool:
+    """Store the raw entries of ``page`` and mark it done in one transaction.
+
+    Entries from an earlier, abandoned attempt at the same page are replaced,
+    and entries already stored from another page (after results drifted
+    between pages) are skipped. Nothing is written when the lease has passed
+    to another worker.
+
+    :param Connection connection: Open connection to the ``gradcafe`` database.
+    :param int page: Page number that was scraped.
+    :param str worker_id: Identifier of the worker holding the lease.
+    :param Sequence entries: Raw entries parsed from the page.
+    :return: ``True`` when the page was recorded, ``False`` if the lease was lost.
+    :rtype: bool
+    """
+
+    with managed_cursor(connection) as cursor:
+        cursor.execute(MARK_PAGE_DONE, (page, worker_id))
+        if not cursor.fetchall():
+            _rollback(connection)
+            return False
+
+        cursor.execute(DELETE_PAGE_ENTRIES, (page,))
+        for position, entry in enumerate(entries):
+            row = tuple(entry[field] for field in RAW_ENTRY_FIELDS)
+            cursor.execute(INSERT_RAW_ENTRY, (page, position, *row))
+    _commit(connection)
+    return True
+
+
+def release_page(
+    connection: Connection,
+    page: int,
+    worker_id: str,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> None:
+    """Return a page that could not be scraped to the queue.
+
+    Pages that have used up ``max_attempts`` claims are marked ``failed``.
+
+    :param Connection connection: Open connection to the ``gradcafe`` database.
+    :param int page: Page number that failed.
+    :param str worker_id: Identifier of the worker holding the lease.
+    :param int max_attempts: Claims allowed before the page is given up on.
+    :return: ``None``
+    :rtype: None
+    """
+
+    with managed_cursor(connection) as cursor:
+        cursor.execute(RELEASE_PAGE, (max_attempts, page, worker_id))
+    _commit(connection)
+
+
+def run_worker(  # pylint: disable=too-many-arguments
+    connection: Connection,
+    scraper: Scraper,
+    worker_id: Optional[str] = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> int:
+    """Claim and scrape pages until the queue has nothing left to lease.
+
+    :param Connection connection: Open connection to the ``gradcafe`` database.
+    :param Scraper scraper: Scraper used to fetch and parse each page.
+    :param str worker_id: Lease holder identifier; defaults to host and PID.
+    :param int batch_size: Pages claimed per round trip.
+    :param int lease_seconds: Seconds before an unfinished claim expires.
+    :param int max_attempts: Claims allowed before a page is marked failed.
+    :return: Number of pages this worker completed.
+    :rtype: int
+    """
+
+    worker_id = worker_id or default_worker_id()
+    completed = 0
+
+    while pages := claim_pages(connection, worker_id, batch_size, lease_seconds, max_attempts):
+        for page in pages:
+            entries = scraper.scrape_page(page)
+            if entries is None:
+                print(f"[{worker_id}] Page {page} failed; releasing it.")
+                release_page(connection, page, worker_id, max_attempts)
+                continue
+
+            if complete_page(connection, page, worker_id, entries):
+                completed += 1
+                print(f"[{worker_id}] Page {page}: stored {len(entries)} raw entries.")
+            else:
+                print(f"[{worker_id}] Lease on page {page} expired; result discarded.")
+
+    print(f"[{worker_id}] Queue drained after completing {completed} pages.")
+    return completed
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for queue administration and workers.
+
+    :param Sequence argv: Arguments to parse; defaults to ``sys.argv[1:]``.
+    :return: Parsed options including the selected ``command``.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="GradCafe distributed page queue.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("setup", help="create the page_queue and raw_entries tables")
+
+    enqueue = commands.add_parser("enqueue", help="queue a range of survey pages")
+    enqueue.add_argument("first_page", type=int)
+    enqueue.add_argument("last_page", type=int)
+
+    work = commands.add_parser("work", help="scrape queued pages until none are left")
+    work.add_argument("--worker-id", default=None)
+    work.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    work.add_argument("--lease-seconds", type=int, default=DEFAULT_LEASE_SECONDS)
+    work.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run a queue command against the configured ``DATABASE_URL``.
+
+    :param Sequence argv: Command-line arguments; defaults to ``sys.argv[1:]``.
+    :return: ``None``
+    :rtype: None
+    """
+
+    options = _parse_args(argv)
+    connection = connect(database_url=DEFAULT_DB_CONFIG["database_url"])
+
+    with managed_connection(connection) as connection_ctx:
+        if options.command == "setup":
+            setup_page_queue(connection_ctx)
+        elif options.command == "enqueue":
+            enqueue_pages(connection_ctx, options.first_page, options.last_page)
+        else:
+            scraper = Scraper()
+            try:
+                run_worker(
+                    connection_ctx,
+                    scraper,
+                    options.worker_id,
+                    batch_size=options.batch_size,
+                    lease_seconds=options.lease_seconds,
+                    max_attempts=options.max_attempts,
+                )
+            finally:
+                scraper.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""Long-running daemon that keeps the applicants table fresh.
+
+Example::
+
+    python watch.py --min-interval 60 --max-interval 1800
+
+The daemon polls page 1 of the survey. Whenever it lists entries the
+result-ID watermark has not seen, an incremental scrape, clean and load runs
+and only the new rows are inserted into the database. The polling interval
+follows the observed arrival rate of new entries: it shortens while entries
+keep coming and stretches out, up to ``--max-interval``, while the survey is
+quiet. Page 1 is requested with the cached validators, so an idle poll is
+usually a ``304 Not Modified``.
+"""
+
+import argparse
+import time
+from typing import Callable, Optional, Sequence, Tuple
+
+from homework_sample_code.course_app import main as pipeline
+from homework_sample_code.course_app.cache import ResponseCache
+from homework_sample_code.course_app.scrape import Scraper
+from homework_sample_code.course_app.utils import DEFAULT_DB_CONFIG
+from homework_sample_code.course_app.watermark import ResultWatermark
+from load_data import insert_applicants, setup_table
+
+
+DEFAULT_MIN_INTERVAL = 60.0
+DEFAULT_MAX_INTERVAL = 1800.0
+DEFAULT_TARGET_ENTRIES = 10.0
+DEFAULT_SMOOTHING = 0.3
+
+
+class AdaptiveInterval:  # pylint: disable=too-few-public-methods
+    """Polling interval derived from a smoothed estimate of new entries per second.
+
+    Each poll reports how many new entries appeared since the previous one.
+    The interval is set so that about ``target_entries`` new entries are
+    expected per poll, clamped to ``[minimum, maximum]``. Quiet polls decay the
+    rate estimate, so the interval grows geometrically while nothing happens.
+    """
+
+    def __init__(
+        self,
+        minimum: float = DEFAULT_MIN_INTERVAL,
+        maximum: float = DEFAULT_MAX_INTERVAL,
+        *,
+        target_entries: float = DEFAULT_TARGET_ENTRIES,
+        smoothing: float = DEFAULT_SMOOTHING,
+    ) -> None:
+        """Configure the interval bounds and how quickly the rate estimate moves.
+
+        :param float minimum: Shortest allowed interval in seconds.
+        :param float maximum: Longest allowed interval in seconds.
+        :param float target_entries: New entries each poll should find on average.
+        :param float smoothing: Weight of the latest observation in the
+            exponentially weighted rate, between ``0`` and ``1``.
+        :return: ``None``
+        :rtype: None
+        """
+
+        self.minimum = max(0.0, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.target_entries = max(1e-9, target_entries)
+        self.smoothing = min(1.0, max(0.0, smoothing))
+        self.rate: Optional[float] = None
+        self.seconds = self.minimum
+
+    def observe(self, new_entries: int, elapsed: float) -> float:
+        """Fold one poll into the rate estimate and return the next interval.
+
+        :param int new_entries: New entries found since the previous poll.
+        :param float elapsed: Seconds since the previous poll.
+        :return: Seconds to wait before the next poll.
+        :rtype: float
+        """
+
+        sample = max(0, new_entries) / max(elapsed, 1e-9)
+        if self.rate is None:
+            self.rate = sample
+        else:
+            self.rate = self.smoothing * sample + (1 - self.smoothing) * self.rate
+
+        if self.rate <= 0:
+            self.seconds = self.maximum
+        else:
+            self.seconds = self.target_entries / self.rate
+        self.seconds = min(self.maximum, max(self.minimum, self.seconds))
+        return self.seconds
+
+
+def count_new_entries(scraper: Scraper, watermark: ResultWatermark) -> Optional[int]:
+    """Return how many entries on page 1 the watermark has not seen.
+
+    :param Scraper scraper: Scraper used to fetch page 1.
+    :param ResultWatermark watermark: Current watermark of ingested results.
+    :return: Number of unseen entries, or ``None`` when page 1 could not be
+        fetched.
+    :rtype: int | None
+    """
+
+    entries = scraper.scrape_page(1)
+    if entries is None:
+        return None
+    return sum(1 for entry in entries if not watermark.has_seen(entry["url_raw"]))
+
+
+def run_pipeline(database_url: str, max_entries: int = 30000) -> int:
+    """Scrape, clean and append new entries, then insert them into the database.
+
+    :param str database_url: Connection string targeting the ``gradcafe`` database.
+    :param int max_entries: Maximum number of new records to scrape.
+    :return: Number of entries appended to the dataset.
+    :rtype: int
+    """
+
+    return pipeline.main(
+        max_entries=max_entries,
+        on_appended=lambda entries: insert_applicants(entries, database_url),
+    )
+
+
+def _run_cycle(
+    probe: Callable[[], Optional[int]],
+    refresh: Callable[[], int],
+) -> Tuple[Optional[int], int]:
+    """Probe page 1 once and run ``refresh`` when it reports new entries.
+
+    Exceptions are reported and the cycle counts as failed, so one bad poll
+    or refresh does not stop the daemon.
+
+    :param Callable probe: Returns the number of new entries on page 1, or
+        ``None`` when the poll failed.
+    :param Callable refresh: Runs the incremental pipeline and returns the
+        number of entries it stored.
+    :return: Tuple of new entries found (``None`` when the cycle failed) and
+        entries stored.
+    :rtype: tuple[int | None, int]
+    """
+
+    try:
+        new_entries = probe()
+        if not new_entries:
+            return new_entries, 0
+        appended = refresh()
+        return max(new_entries, appended), appended
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        print(f"Watch cycle failed: {type(error).__name__}: {error}")
+        return None, 0
+
+
+def watch(  # pylint: disable=too-many-arguments
+    probe: Callable[[], Optional[int]],
+    refresh: Callable[[], int],
+    interval: AdaptiveInterval,
+    *,
+    max_polls: Optional[int] = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> int:
+    """Poll with ``probe`` and run ``refresh`` whenever it reports new entries.
+
+    A cycle whose probe fails, or whose probe or refresh raises, is reported
+    and skipped: the interval is left as it was and the daemon keeps polling.
+
+    :param Callable probe: Returns the number of new entries on page 1, or
+        ``None`` when the poll failed.
+    :param Callable refresh: Runs the incremental pipeline and returns the
+        number of entries it stored.
+    :param AdaptiveInterval interval: Interval policy updated after every poll.
+    :param int max_polls: Stop after this many polls; runs forever by default.
+    :param Callable sleep: Function used to wait between polls; mainly for tests.
+    :param Callable clock: Monotonic clock; mainly for tests.
+    :return: Total number of entries stored while watching.
+    :rtype: int
+    """
+
+    stored = polls = 0
+    last_poll = clock() - interval.seconds
+    while max_polls is None or polls < max_polls:
+        now = clock()
+        found, appended = _run_cycle(probe, refresh)
+        polls += 1
+        stored += appended
+
+        if found is None:
+            # A failed cycle says nothing about the arrival rate.
+            seconds = interval.seconds
+            state = "poll failed"
+        else:
+            seconds = interval.observe(found, now - last_poll)
+            last_poll = now
+            state = f"{found} new"
+        print(f"Poll {polls}: {state}; next poll in {seconds:.0f}s.")
+
+        if max_polls is None or polls < max_polls:
+            sleep(seconds)
+    return stored
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for the watch daemon.
+
+    :param Sequence argv: Arguments to parse; defaults to ``sys.argv[1:]``.
+    :return: Parsed options.
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="Watch GradCafe for new entries.")
+    parser.add_argument("--min-interval", type=float, default=DEFAULT_MIN_INTERVAL,
+                        help="shortest wait between polls in seconds")
+    parser.add_argument("--max-interval", type=float, default=DEFAULT_MAX_INTERVAL,
+                        help="longest wait between polls in seconds")
+    parser.add_argument("--target-entries", type=float, default=DEFAULT_TARGET_ENTRIES,
+                        help="new entries each poll should find on average")
+    parser.add_argument("--max-entries", type=int, default=30000,
+                        help="maximum number of new records per incremental scrape")
+    parser.add_argument("--max-polls", type=int, default=None,
+                        help="exit after this many polls (default: run until interrupted)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the watch daemon against the configured ``DATABASE_URL``.
+
+    The ``applicants`` table is created or migrated before the first poll.
+
+    :param Sequence argv: Command-line arguments; defaults to ``sys.argv[1:]``.
+    :return: Total number of entries stored before the daemon stopped.
+    :rtype: int
+    """
+
+    options = _parse_args(argv)
+    database_url = DEFAULT_DB_CONFIG["database_url"]
+    interval = AdaptiveInterval(
+        options.min_interval,
+        options.max_interval,
+        target_entries=options.target_entries,
+    )
+    # Inserts need the current schema, e.g. the duplicate_cluster column.
+    setup_table(database_url)
+    scraper = Scraper(max_entries=0, cache=ResponseCache(pipeline.CACHE_FILE))
+
+    def probe() -> Optional[int]:
+        # The pipeline rewrites the watermark file, so reload it on every poll.
+        return count_new_entries(scraper, ResultWatermark(pipeline.WATERMARK_FILE))
+
+    try:
+        return watch(
+            probe,
+            lambda: run_pipeline(database_url, options.max_entries),
+            interval,
+            max_polls=options.max_polls,
+        )
+    except KeyboardInterrupt:
+        print("Watch stopped.")
+        return 0
+    finally:
+        scraper.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Tests for the local replay server and the scraper throughput benchmark."""
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import urllib3
+
+from tests.import_utils import import_module
+
+replay_server = import_module("benchmarks.replay_server")
+scraper_throughput = import_module("benchmarks.scraper_throughput")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+
+ReplayServer = replay_server.ReplayServer
+Scraper = scrape_module.Scraper
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+
+@pytest.mark.integration
+def test_synthetic_pages_parse_into_full_entries():
+    html = replay_server.render_page(2, rows=5, seed=3)
+
+    entries = Scraper(max_entries=0)._extract_raw_data(html)  # pylint: disable=protected-access
+
+    assert len(entries) == 5
+    assert entries[0]["url_raw"] == "https://www.thegradcafe.com/result/989995"
+    assert all(entry["university_raw"] and entry["meta_raw"] for entry in entries)
+    assert html == replay_server.render_page(2, rows=5, seed=3)
+
+
+@pytest.mark.integration
+def test_server_serves_pages_errors_and_end_of_results():
+    http = urllib3.PoolManager(retries=False)
+    with ReplayServer(pages=2, rows_per_page=3, error_rate=1.0) as failing:
+        assert http.request("GET", failing.url + "?page=1").status == 503
+        assert (failing.requests, failing.errors) == (1, 1)
+
+    with ReplayServer(pages=2, rows_per_page=3) as server:
+        page = http.request("GET", server.url + "?page=2")
+        past_end = http.request("GET", server.url + "?page=3")
+        other = http.request("GET", server.url.replace("/survey/", "/result/1"))
+
+    assert page.status == 200
+    assert page.data.decode("utf-8").count('href="/result/') == 3
+    assert "<tr>" not in past_end.data.decode("utf-8").split("<tbody", 1)[1]
+    assert other.status == 404
+
+
+@pytest.mark.integration
+def test_benchmark_scrapes_every_replayed_page(capsys):
+    with ReplayServer(pages=4, rows_per_page=5) as server:
+        result = scraper_throughput.run_benchmark(server.url, prefetch=3)
+
+    assert result.entries == 20
+    assert result.pages >= 5  # four result pages, the empty final page, maybe prefetched extras
+    assert result.fetch_seconds > 0
+    assert result.parse_seconds > 0
+    assert result.pages_per_second > 0
+    assert 0 < result.wire_bytes < result.decoded_bytes
+    assert result.connections + result.reused_connections >= result.pages
+    assert "Scraping page 5" in capsys.readouterr().out
+
+
+@pytest.mark.integration
+def test_benchmark_cli_replays_recorded_pages_with_errors(capsys):
+    result = scraper_throughput.main(
+        [
+            "--recorded", str(DATA_DIR),
+            "--pages", "3",
+            "--error-rate", "0.3",
+            "--seed", "1",
+            "--retry-delay", "0",
+            "--quiet",
+        ]
+    )
+
+    recorded = replay_server.load_recorded_pages(DATA_DIR)
+    expected = sum(len(Scraper(max_entries=0)._extract_raw_data(html))  # pylint: disable=protected-access
+                   for html in recorded)
+    assert result.entries == expected
+    assert result.retries > 0
+
+    output = capsys.readouterr().out
+    assert "Scraping page" not in output
+    assert "entries/s" in output
+
+
+@pytest.mark.integration
+def test_recorded_pages_require_html_files(tmp_path):
+    with pytest.raises(ValueError):
+        replay_server.load_recorded_pages(tmp_path)
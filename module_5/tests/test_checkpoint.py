@@ -0,0 +1,130 @@
+"""Tests for scrape checkpoints and the ``--resume`` path."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from __future__ import annotations
+
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_scrape_clean_main import main_environment  # pylint: disable=unused-import
+from tests.test_scrape_pipeline import FakeSite, make_page, result_url
+
+checkpoint_module = import_module("homework_sample_code.course_app.checkpoint")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+main_module = import_module("homework_sample_code.course_app.main")
+
+ScrapeCheckpoint = checkpoint_module.ScrapeCheckpoint
+Scraper = scrape_module.Scraper
+
+
+class CrashingSite(FakeSite):
+    """Fake site whose connection dies when ``crash_at`` is requested."""
+
+    def __init__(self, pages, crash_at):
+        super().__init__(pages)
+        self.crash_at = crash_at
+
+    def __call__(self, url):
+        if self.crash_at and url.endswith(f"page={self.crash_at}"):
+            raise ConnectionError("connection reset")
+        return super().__call__(url)
+
+
+@pytest.mark.integration
+def test_checkpoint_buffers_pages_and_loads_them_back(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "checkpoint.jsonl", every=2)
+
+    checkpoint.record_page(1, [{"url_raw": "a"}])
+    assert not checkpoint.path.exists()
+
+    checkpoint.record_page(2, [{"url_raw": "b"}, {"url_raw": "c"}])
+    assert checkpoint.load() == (2, [{"url_raw": "a"}, {"url_raw": "b"}, {"url_raw": "c"}])
+
+    checkpoint.clear()
+    assert checkpoint.load() == (0, [])
+
+
+@pytest.mark.integration
+def test_checkpoint_ignores_truncated_trailing_line(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    checkpoint = ScrapeCheckpoint(path, every=1)
+    checkpoint.record_page(1, [{"url_raw": "a"}])
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"page": 2, "entries": [{"url_')
+
+    assert checkpoint.load() == (1, [{"url_raw": "a"}])
+
+
+@pytest.mark.integration
+def test_resume_continues_after_crash_without_refetching(monkeypatch, tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    crashing = CrashingSite(pages=6, crash_at=4).install(monkeypatch)
+
+    with pytest.raises(ConnectionError):
+        Scraper(max_entries=100, checkpoint=ScrapeCheckpoint(path, every=5)).scrape_data()
+    assert crashing.requested == [1, 2, 3]
+    assert ScrapeCheckpoint(path).load()[0] == 3
+
+    healthy = FakeSite(pages=6).install(monkeypatch)
+    resumed = Scraper(max_entries=100, checkpoint=ScrapeCheckpoint(path)).scrape_data(resume=True)
+
+    assert healthy.requested == [4, 5, 6, 7]
+    assert [entry["url_raw"] for entry in resumed] == [
+        result_url(page, offset) for page in range(1, 7) for offset in range(2)
+    ]
+
+
+@pytest.mark.integration
+def test_resume_skips_replayed_entries_shifted_onto_later_pages(monkeypatch, tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "checkpoint.jsonl", every=1)
+    for page in range(1, 4):
+        checkpoint.record_page(page, [{"url_raw": result_url(page, offset)} for offset in range(2)])
+
+    def shifted(url):
+        # One page of new submissions arrived, pushing every result down a page.
+        page = int(url.rsplit("page=", 1)[1]) - 1
+        return make_page(page) if page <= 5 else ""
+
+    FakeSite(render=shifted).install(monkeypatch)
+
+    resumed = Scraper(max_entries=100, checkpoint=checkpoint).scrape_data(resume=True)
+
+    urls = [entry["url_raw"] for entry in resumed]
+    assert len(urls) == len(set(urls)) == 10
+    assert urls[6:] == [result_url(page, offset) for page in (4, 5) for offset in range(2)]
+
+
+@pytest.mark.integration
+def test_resume_honours_max_entries_already_checkpointed(monkeypatch, tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "checkpoint.jsonl", every=1)
+    checkpoint.record_page(1, [{"url_raw": "a"}, {"url_raw": "b"}, {"url_raw": "c"}])
+    site = FakeSite(pages=3).install(monkeypatch)
+
+    resumed = Scraper(max_entries=2, checkpoint=checkpoint).scrape_data(resume=True)
+
+    assert [entry["url_raw"] for entry in resumed] == ["a", "b"]
+    assert not site.requested
+
+
+@pytest.mark.integration
+def test_checkpoint_is_cleared_once_entries_are_stored(main_environment):
+    def fail(entries):
+        raise ConnectionError(f"lost the database with {len(list(entries))} entries")
+
+    checkpoint = ScrapeCheckpoint(main_module.CHECKPOINT_FILE, every=1)
+    checkpoint.record_page(1, [{"url_raw": "https://www.thegradcafe.com/result/12345"}])
+
+    with pytest.raises(ConnectionError):
+        main_module.main(resume=True, on_appended=fail)
+
+    assert main_environment.saved["data"][-1]["url"].endswith("/result/12345")
+    assert ScrapeCheckpoint(main_module.CHECKPOINT_FILE).load() == (0, [])
+
+
+@pytest.mark.integration
+def test_main_cli_parses_resume_flag():
+    options = main_module._parse_args(["--resume", "--max-entries", "50"])  # pylint: disable=protected-access
+
+    assert options.resume is True
+    assert options.max_entries == 50
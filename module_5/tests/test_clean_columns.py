@@ -0,0 +1,62 @@
+"""Tests for the columnar output mode of ``Cleaner``."""
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from tests.import_utils import import_module
+
+clean_module = import_module("homework_sample_code.course_app.clean")
+clean_entries = import_module("benchmarks.clean_entries")
+
+Cleaner = clean_module.Cleaner
+
+
+@pytest.mark.integration
+def test_clean_columns_matches_clean_data():
+    cleaner = Cleaner(clean_entries.generate_raw_entries(300, seed=4))
+    records = cleaner.clean_data()
+
+    columns = cleaner.clean_columns()
+
+    assert tuple(columns) == clean_module.CLEANED_FIELDS == tuple(records[0])
+    for field in clean_module.NUMERIC_FIELDS:
+        assert columns[field].dtype == np.float64
+        for value, record in zip(columns[field], records):
+            assert math.isnan(value) if not record[field] else value == float(record[field])
+    for field in set(clean_module.CLEANED_FIELDS) - set(clean_module.NUMERIC_FIELDS):
+        assert columns[field] == [record[field] for record in records]
+
+
+@pytest.mark.integration
+def test_categorical_columns_share_interned_strings():
+    columns = Cleaner(
+        [{"status_raw": f"Accepted on {day} Mar", "meta_raw": "Fall 2025"} for day in (1, 2)]
+    ).clean_columns()
+
+    first, second = columns["term"]
+    assert first == second == "Fall 2025"
+    assert first is second
+    assert columns["status"][0] is columns["status"][1]
+
+
+@pytest.mark.integration
+def test_to_columns_tolerates_stored_records():
+    columns = clean_module.to_columns(
+        [
+            {"GPA": 3.9, "GRE": "N/A", "GRE AW": None, "term": None, "url": "https://a"},
+            {"GPA": "", "GRE": "320", "GRE V": "160"},
+        ]
+    )
+
+    np.testing.assert_array_equal(columns["GPA"], [3.9, np.nan])
+    np.testing.assert_array_equal(columns["GRE"], [np.nan, 320.0])
+    np.testing.assert_array_equal(columns["GRE AW"], [np.nan, np.nan])
+    assert columns["term"] == ["", ""]
+    assert columns["url"] == ["https://a", ""]
+    assert clean_module.to_columns([])["GPA"].shape == (0,)
@@ -0,0 +1,108 @@
+"""Tests for the compiled field patterns used by ``Cleaner`` and their benchmark."""
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tests.import_utils import import_module
+
+clean_module = import_module("homework_sample_code.course_app.clean")
+clean_entries = import_module("benchmarks.clean_entries")
+
+Cleaner = clean_module.Cleaner
+
+EDGE_TEXTS = [
+    ("", ""),
+    ("", "   "),
+    ("GRE 320 V", ""),
+    ("", "GPA 3.80 V"),
+    ("GPA: 3.9 overall, GRE V 165", "Spring2026 | american"),
+    ("GPA 3.90", "GPA 3.50 | Fall 2025"),
+    ("Fall 2024 was my first try. International", "American | Fall 2025"),
+    ("Verbal: 158, analytical writing 5", "Winter 2026 | International"),
+    ("AWA 4.5 and GRE:331", "Nov 12 | Summer 2025"),
+    ("Applied with 160 v", "Other"),
+]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("comments, meta", EDGE_TEXTS)
+def test_extractors_agree_on_edge_cases(comments, meta):
+    expected = clean_entries.fields_with_string_patterns(comments, meta)
+
+    assert clean_entries.fields_with_compiled_patterns(comments, meta) == expected
+    assert clean_entries.fields_with_one_alternation(comments, meta) == expected
+
+
+@pytest.mark.integration
+def test_extractors_agree_on_synthetic_corpus():
+    for entry in clean_entries.generate_raw_entries(2000, seed=7):
+        comments, meta = clean_entries._entry_text(entry)  # pylint: disable=protected-access
+        expected = clean_entries.fields_with_string_patterns(comments, meta)
+
+        assert clean_entries.fields_with_compiled_patterns(comments, meta) == expected
+        assert clean_entries.fields_with_one_alternation(comments, meta) == expected
+
+
+@pytest.mark.integration
+def test_cleaner_reads_fields_from_meta_before_comments():
+    entry = Cleaner.normalise_entry(
+        {
+            "program_raw": "Data Science MS",
+            "comments_raw": "  GPA 3.90,\n  GRE 331 (160 V) AWA 5.0  ",
+            "status_raw": "Wait listed on 14 Feb",
+            "meta_raw": "Spring2026 | American | GPA: 3.50",
+        }
+    )
+
+    assert entry["comments"] == "GPA 3.90, GRE 331 (160 V) AWA 5.0"
+    assert (entry["status"], entry["status_date"]) == ("Waitlisted", "14 Feb")
+    assert (entry["term"], entry["US/International"]) == ("Spring 2026", "American")
+    scores = (entry["GPA"], entry["GRE"], entry["GRE V"], entry["GRE AW"])
+    assert scores == ("3.50", "331", "160", "5.0")
+    assert entry["Degree"] == "Ms"
+
+
+@pytest.mark.integration
+def test_clean_benchmark_reports_every_strategy(capsys):
+    timings = clean_entries.main(["--entries", "200", "--repeat", "1"])
+
+    assert [timing.strategy for timing in timings] == [
+        "_parse_status",
+        "_extract_term",
+        "_extract_origin",
+        "_extract_gpa",
+        "_extract_gre",
+        "_extract_gre_aw",
+        "_normalise_degree",
+        "string patterns",
+        "compiled patterns",
+        "one alternation",
+        "Cleaner.clean_data",
+    ]
+    assert all(timing.entries == 200 and timing.entries_per_second > 0 for timing in timings)
+    assert "Cleaned 200 entries" in capsys.readouterr().out
+
+
+@pytest.mark.integration
+def test_clean_benchmark_writes_json_per_size(tmp_path, capsys):
+    output = tmp_path / "clean.json"
+
+    timings = clean_entries.main(["--entries", "20", "40", "--repeat", "1", "--json", str(output)])
+
+    document = json.loads(output.read_text(encoding="utf-8"))
+    assert document["benchmark"] == "clean_entries"
+    assert document["repeat"] == 1
+    assert len(document["results"]) == len(timings) == 22
+    assert {result["entries"] for result in document["results"]} == {20, 40}
+    assert document["results"][-1]["strategy"] == "Cleaner.clean_data"
+    assert "Cleaned 40 entries" in capsys.readouterr().out
+
+    clean_entries.main(["--entries", "10", "--repeat", "1", "--json", "-"])
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)["results"][0]["entries"] == 10
+    assert "Cleaned 10 entries" in captured.err
@@ -0,0 +1,143 @@
+"""Tests for completing survey entries from their result detail pages."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from __future__ import annotations
+
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_scrape_clean_main import main_environment  # pylint: disable=unused-import
+from tests.test_scrape_pipeline import FakeSite
+
+enrich_module = import_module("homework_sample_code.course_app.enrich")
+records_module = import_module("homework_sample_code.course_app.records")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+cache_module = import_module("homework_sample_code.course_app.cache")
+clean_module = import_module("homework_sample_code.course_app.clean")
+main_module = import_module("homework_sample_code.course_app.main")
+
+DetailEnricher = enrich_module.DetailEnricher
+RawEntry = records_module.RawEntry
+Scraper = scrape_module.Scraper
+
+DETAIL_HTML = """
+<dl>
+  <div><dt>Institution</dt><dd>Example University</dd></div>
+  <div><dt>Degree's Country of Origin</dt><dd>International</dd></div>
+  <div><dt>Season</dt><dd>Fall 2025</dd></div>
+  <div><dt>Undergrad GPA</dt><dd>3.85</dd></div>
+  <div><dt>GRE General:</dt><dd>328</dd></div>
+  <div><dt>GRE Verbal:</dt><dd>162</dd></div>
+  <div><dt>Analytical Writing:</dt><dd>0.00</dd></div>
+  <div><dt>Notes</dt><dd>Funded offer.</dd></div>
+</dl>
+"""
+
+
+def detail_url(result_id: int) -> str:
+    return f"https://www.thegradcafe.com/result/{result_id}"
+
+
+def entry(result_id: int, meta: str = "") -> RawEntry:
+    return RawEntry(university_raw="Example University", url_raw=detail_url(result_id),
+                    meta_raw=meta)
+
+
+def detail_site(monkeypatch):
+    return FakeSite(delay=0.01, render=lambda _url: DETAIL_HTML).install(monkeypatch, "fetch_html")
+
+
+@pytest.mark.integration
+def test_detail_page_fields_feed_the_cleaner():
+    meta, notes = enrich_module.parse_detail_page(DETAIL_HTML)
+
+    assert meta == "International | Fall 2025 | GPA 3.85 | GRE 328 | Verbal 162"
+    assert notes == "Funded offer."
+
+    cleaned = clean_module.Cleaner.normalise_entry(
+        RawEntry(meta_raw=meta, comments_raw=notes, url_raw=detail_url(1))
+    )
+    assert (cleaned["term"], cleaned["US/International"], cleaned["GPA"]) == (
+        "Fall 2025", "International", "3.85"
+    )
+    assert (cleaned["GRE"], cleaned["GRE V"], cleaned["GRE AW"]) == ("328", "162", "")
+
+
+@pytest.mark.integration
+def test_only_entries_missing_metadata_are_fetched_in_order(monkeypatch):
+    site = detail_site(monkeypatch)
+    entries = [entry(10), entry(9, meta="Fall 2024 | GPA 3.50"), entry(8), entry(10),
+               RawEntry(university_raw="No link")]
+
+    enricher = DetailEnricher(Scraper(max_entries=0), max_workers=2, window=2)
+    results = list(enricher.iter_enriched(iter(entries)))
+
+    assert results == entries
+    assert set(site.requested) == {detail_url(8), detail_url(10)}
+    assert results[0]["meta_raw"].startswith("International")
+    assert results[0]["comments_raw"] == "Funded offer."
+    assert results[1]["meta_raw"] == "Fall 2024 | GPA 3.50"
+    assert results[3]["meta_raw"] == ""  # the duplicate URL is not fetched twice
+    assert (enricher.fetched, enricher.enriched) == (2, 2)
+
+
+@pytest.mark.integration
+def test_fetches_are_bounded_and_budgeted(monkeypatch):
+    site = detail_site(monkeypatch)
+    scraper = Scraper(max_entries=0)
+
+    enricher = DetailEnricher(scraper, max_workers=3, budget=7)
+    results = list(enricher.iter_enriched(entry(result_id) for result_id in range(20)))
+
+    assert len(results) == 20
+    assert len(site.requested) == 7
+    assert site.max_in_flight == 3
+    assert scraper.http.max_connections == 4
+    assert sum(1 for result in results if result["meta_raw"]) == 7
+    assert enricher.summary() == (
+        "Detail pages: enriched 7 entries (7 fetched, 0 cached, 13 over the budget of 7)."
+    )
+
+
+@pytest.mark.integration
+def test_cached_detail_pages_skip_the_network_and_the_budget(monkeypatch, tmp_path):
+    site = detail_site(monkeypatch)
+    cache = cache_module.ResponseCache(tmp_path / "cache.sqlite3")
+    cache.store(detail_url(1), DETAIL_HTML, etag='"v1"')
+
+    enricher = DetailEnricher(Scraper(max_entries=0, cache=cache), budget=0)
+    results = list(enricher.iter_enriched([entry(1), entry(2)]))
+    cache.close()
+
+    assert not site.requested
+    assert results[0]["meta_raw"] and not results[1]["meta_raw"]
+    assert (enricher.cached, enricher.skipped) == (1, 1)
+
+
+@pytest.mark.integration
+def test_detail_pages_fetched_by_an_earlier_run_are_not_fetched_again(monkeypatch, tmp_path):
+    site = detail_site(monkeypatch)
+    path = tmp_path / "cache.sqlite3"
+    first_cache = cache_module.ResponseCache(path)
+    list(DetailEnricher(Scraper(max_entries=0, cache=first_cache)).iter_enriched([entry(1)]))
+    first_cache.close()
+    assert site.requested == [detail_url(1)]
+    assert first_cache.get(detail_url(1)) is None
+
+    cache = cache_module.ResponseCache(path)
+    enricher = DetailEnricher(Scraper(max_entries=0, cache=cache), budget=1)
+    results = list(enricher.iter_enriched([entry(1), entry(2)]))
+    cache.close()
+
+    assert site.requested == [detail_url(1), detail_url(2)]
+    assert results[0]["meta_raw"].startswith("International")
+    assert (enricher.cached, enricher.fetched, enricher.skipped) == (1, 1, 0)
+
+
+@pytest.mark.integration
+def test_main_reports_detail_enrichment(main_environment, capsys):  # pylint: disable=unused-argument
+    main_module.main(detail_budget=0)
+
+    assert "over the budget of 0" in capsys.readouterr().out
+    assert main_module._parse_args(["--detail-budget", "5"]).detail_budget == 5  # pylint: disable=protected-access
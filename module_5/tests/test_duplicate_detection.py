@@ -0,0 +1,158 @@
+"""Tests for MinHash/LSH near-duplicate detection."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_scrape_clean_main import main_environment  # pylint: disable=unused-import
+
+dedup_module = import_module("homework_sample_code.course_app.dedup")
+clean_module = import_module("homework_sample_code.course_app.clean")
+main_module = import_module("homework_sample_code.course_app.main")
+load_data = import_module("load_data")
+
+DuplicateDetector = dedup_module.DuplicateDetector
+
+SPAM = "This is an automated message, visit example dot com for admissions help!!"
+
+
+def record(index: int, comments: str, **fields) -> dict:
+    return {
+        "url": f"https://www.thegradcafe.com/result/{index}",
+        "university": f"University {index % 7}",
+        "program": "Computer Science",
+        "status": "Accepted",
+        "term": "Fall 2025",
+        "comments": comments,
+        **fields,
+    }
+
+
+def distinct_records(count: int) -> list:
+    rng = np.random.default_rng(3)
+    words = "funded offer interview professor email lab research stipend visit".split()
+    return [record(index, " ".join(rng.choice(words, size=12))) for index in range(count)]
+
+
+@pytest.mark.integration
+def test_batch_features_groups_shingles_and_key_fields_by_record():
+    features, offsets = dedup_module.batch_features(
+        [record(0, "Got in!"), record(1, ""), record(2, "  GOT   in! ")]
+    )
+
+    key_fields = len(dedup_module.KEY_FIELDS)
+    assert offsets.tolist() == [0, key_fields + 3, 2 * key_fields + 3]
+    first, third = features[: offsets[1]], features[offsets[2] :]
+    assert sorted(first[key_fields:].tolist()) == sorted(third[key_fields:].tolist())
+    assert len(set(first[key_fields:].tolist())) == 3
+    assert first[:key_fields].tolist() != features[offsets[1] : offsets[2]].tolist()
+
+
+@pytest.mark.integration
+def test_spam_and_repeat_submissions_form_clusters():
+    records = distinct_records(200)
+    for index in (30, 90, 150):
+        records[index] = record(index, SPAM, university="University 2")
+    records[40]["comments"] = "Got in with full funding, super excited to join the lab this fall"
+    records[170] = dict(records[40], url="repost", comments=records[40]["comments"] + " !!")
+    records[80] = dict(records[40], url="reposted", status="Rejected", term="Spring 2026")
+
+    detector = DuplicateDetector()
+    clusters = detector.find_clusters(records)
+
+    assert clusters == [[30, 90, 150], [40, 80, 170]]
+    assert detector.signed == 200
+    assert detector.compared > 0
+    assert detector.summary() == (
+        f"Duplicates: 6 records in 2 clusters (200 signed, {detector.compared} "
+        "candidate pairs compared)."
+    )
+
+
+@pytest.mark.integration
+def test_small_batches_and_hash_chunks_give_the_same_signatures(monkeypatch):
+    records = distinct_records(30) + [record(30, SPAM * 40)]
+    indexes, expected = DuplicateDetector().signatures(records)
+
+    monkeypatch.setattr(dedup_module, "FEATURE_BATCH", 100)
+    monkeypatch.setattr(dedup_module, "HASH_BATCH_BYTES", 7 * 128 * 8)
+    batched_indexes, batched = DuplicateDetector().signatures(records)
+
+    np.testing.assert_array_equal(batched_indexes, indexes)
+    np.testing.assert_array_equal(batched, expected)
+    batches = list(dedup_module._record_batches(records, indexes))  # pylint: disable=protected-access
+    assert batches[-1] == [30] and len(batches) > 2
+
+
+@pytest.mark.integration
+def test_short_comments_are_never_clustered():
+    records = [record(index, "Accepted!", university="MIT") for index in range(3)]
+
+    detector = DuplicateDetector()
+    assert detector.find_clusters(records) == []
+    assert detector.find_clusters([]) == []
+    assert detector.signed == 0
+    assert DuplicateDetector(min_comment_chars=5).find_clusters(records) == [[0, 1, 2]]
+
+
+@pytest.mark.integration
+def test_bands_must_divide_the_signature():
+    with pytest.raises(ValueError, match="multiple of bands"):
+        DuplicateDetector(num_hashes=100, bands=32)
+
+
+@pytest.mark.integration
+def test_label_records_marks_clusters_with_their_first_url():
+    records = distinct_records(20) + [record(20, SPAM), record(21, SPAM), record(22, SPAM)]
+    records[20]["url"] = ""
+    records[0][dedup_module.CLUSTER_FIELD] = "stale"
+
+    assert DuplicateDetector().label_records(records) == 23
+    assert [item["duplicate_cluster"] for item in records[20:]] == [
+        "", records[21]["url"], records[21]["url"],
+    ]
+    assert {item["duplicate_cluster"] for item in records[:20]} == {""}
+    assert DuplicateDetector().label_records(records) == 0
+
+
+@pytest.mark.integration
+def test_cleaned_entries_start_unlabelled():
+    cleaned = clean_module.Cleaner([{"comments_raw": SPAM}]).clean_data()
+
+    assert cleaned[0]["duplicate_cluster"] == ""
+    assert clean_module.CLEANED_FIELDS[-1] == "duplicate_cluster"
+
+
+@pytest.mark.integration
+def test_dedup_command_labels_and_saves_the_dataset(main_environment, capsys):
+    with open(main_environment.data_file, "w", encoding="utf-8") as handle:
+        json.dump([record(1, SPAM), record(2, "Rejected after the interview."), record(8, SPAM)],
+                  handle)
+
+    assert main_module.dedup() == 3
+    assert [item["duplicate_cluster"] for item in main_environment.saved["data"]] == [
+        "https://www.thegradcafe.com/result/1", "", "https://www.thegradcafe.com/result/1",
+    ]
+    assert "Duplicates: 2 records in 1 clusters" in capsys.readouterr().out
+
+
+@pytest.mark.db
+def test_loaded_rows_carry_the_cluster_label(mock_db, tmp_path):
+    data_path = tmp_path / "applicants.json"
+    data_path.write_text(json.dumps([
+        {"program": "CS", "duplicate_cluster": "https://www.thegradcafe.com/result/1"},
+        {"program": "CS", "duplicate_cluster": ""},
+    ]))
+
+    load_data.load_json_to_db(str(data_path), load_data.DEFAULT_DB_CONFIG["database_url"])
+
+    column = load_data.INSERT_COLUMNS.index("duplicate_cluster")
+    assert [row[column] for row in mock_db.inserted_rows] == [
+        "https://www.thegradcafe.com/result/1", None,
+    ]
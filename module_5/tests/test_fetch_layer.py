@@ -0,0 +1,240 @@
+"""Tests for retry/backoff handling and adaptive concurrency in the fetch layer."""
+
+# pylint: disable=missing-function-docstring,too-few-public-methods,protected-access,redefined-outer-name
+
+from __future__ import annotations
+
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import urllib3
+
+from tests.import_utils import import_module
+from tests.test_scrape_pipeline import FakeSite, result_url
+
+fetch_module = import_module("homework_sample_code.course_app.fetch")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+replay_server = import_module("benchmarks.replay_server")
+
+AimdController = fetch_module.AimdController
+RetryPolicy = fetch_module.RetryPolicy
+HttpSession = fetch_module.HttpSession
+Scraper = scrape_module.Scraper
+
+
+class ScriptedHttp:
+    """PoolManager double that replays a list of responses or exceptions."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def request(self, _method, _url, headers=None):  # pylint: disable=unused-argument
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, retry_after = outcome
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        return SimpleNamespace(status=status, data=b"<html>ok</html>", headers=headers)
+
+    def clear(self):
+        pass
+
+
+class RedirectingHandler(BaseHTTPRequestHandler):
+    """Redirects ``/moved``, answers ``/page`` and drops every other request."""
+
+    hits = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.hits.append(self.path)
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/page":
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+        else:
+            self.close_connection = True
+
+    def log_message(self, *_args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(scrape_module.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.mark.integration
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert fetch_module.parse_retry_after("7") == 7.0
+    assert fetch_module.parse_retry_after(
+        "Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0
+    ) == pytest.approx(10.0)
+    assert fetch_module.parse_retry_after("soon") is None
+    assert fetch_module.parse_retry_after(None) is None
+
+
+@pytest.mark.integration
+def test_retry_policy_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, rng=random.Random(3))
+
+    delays = [policy.delay(attempt) for attempt in range(6)]
+
+    assert all(0 <= delay <= min(5.0, 2 ** attempt) for attempt, delay in enumerate(delays))
+    assert policy.delay(0, retry_after=2.5) == 2.5
+    assert policy.delay(0, retry_after=120) == 5.0
+
+
+@pytest.mark.integration
+def test_transient_errors_are_retried(sleeps):
+    scraper = Scraper(retry=RetryPolicy(rng=random.Random(0)))
+    scraper.http = ScriptedHttp(
+        urllib3.exceptions.ProtocolError("connection reset"),
+        (503, None),
+        (429, "4"),
+        (200, None),
+    )
+
+    assert scraper._get_html("https://example.test/survey/?page=1") == "<html>ok</html>"
+    assert scraper.retries == 3
+    assert len(sleeps) == 3
+    assert sleeps[-1] == 4.0
+
+
+@pytest.mark.integration
+def test_retries_give_up_after_max_attempts(sleeps):
+    scraper = Scraper(retry=RetryPolicy(max_attempts=3))
+    scraper.http = ScriptedHttp((502, None))
+
+    assert scraper._get_html("https://example.test/survey/?page=1") is None
+    assert scraper.http.calls == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.integration
+def test_non_retryable_status_is_not_retried(sleeps):
+    scraper = Scraper()
+    scraper.http = ScriptedHttp((404, None))
+
+    assert scraper._get_html("https://example.test/survey/?page=1") is None
+    assert scraper.http.calls == 1
+    assert not sleeps
+
+
+@pytest.mark.integration
+def test_aimd_widens_while_healthy_and_backs_off_on_throttle():
+    now = [0.0]
+    controller = AimdController(initial=2, minimum=1, maximum=4, cooldown=1.0, clock=lambda: now[0])
+
+    for _ in range(2):
+        controller.record_success(0.1)
+    assert controller.limit == 3
+
+    controller.record_success(5.0)  # slow responses hold the limit
+    for _ in range(2):
+        controller.record_success(0.1)
+    assert controller.limit == 3
+
+    for _ in range(10):
+        controller.record_success(0.1)
+    assert controller.limit == 4
+
+    controller.record_throttle()
+    controller.record_throttle()  # same burst, inside the cooldown
+    assert controller.limit == 2
+
+    now[0] = 5.0
+    controller.record_throttle()
+    controller.record_throttle()
+    assert controller.limit == 1
+
+
+@pytest.mark.integration
+def test_throttling_feeds_the_concurrency_controller(sleeps):
+    controller = AimdController(initial=8, maximum=8)
+    scraper = Scraper(concurrency=controller, retry=RetryPolicy(rng=random.Random(0)))
+    scraper.http = ScriptedHttp((429, None), (200, None))
+
+    assert scraper._get_html("https://example.test/survey/?page=1") == "<html>ok</html>"
+    assert controller.limit == 4
+    assert len(sleeps) == 1
+
+
+@pytest.mark.integration
+def test_adaptive_pipeline_keeps_page_order(monkeypatch):
+    FakeSite(pages=8, delay=0.001).install(monkeypatch)
+    controller = AimdController(initial=1, maximum=4, latency_target=10.0)
+
+    results = Scraper(max_entries=100, concurrency=controller).scrape_data()
+
+    assert [entry["url_raw"] for entry in results] == [
+        result_url(page, offset) for page in range(1, 9) for offset in range(2)
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("compress", [True, False])
+def test_session_negotiates_compression_and_counts_bytes(compress):
+    session = HttpSession(max_connections=2, compress=compress)
+    with replay_server.ReplayServer(pages=3, rows_per_page=10) as server:
+        bodies = [
+            session.request("GET", f"{server.url}?page={page}").data for page in (1, 2, 3)
+        ]
+    session.clear()
+    connections, reused = session.connection_counts()
+
+    assert all(b"/result/" in body for body in bodies)
+    assert session.stats.decoded_bytes == sum(len(body) for body in bodies)
+    if compress:
+        assert session.stats.wire_bytes * 4 < session.stats.decoded_bytes
+    else:
+        assert session.stats.wire_bytes == session.stats.decoded_bytes
+    assert (connections, reused) == (1, 2)
+    assert "3 requests over 1 connections (2 reused)" in session.summary()
+
+
+@pytest.mark.integration
+def test_session_follows_redirects_but_leaves_retries_to_the_policy():
+    RedirectingHandler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RedirectingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    session = HttpSession()
+    try:
+        assert session.request("GET", f"{base}/moved").data == b"ok"
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            session.request("GET", f"{base}/dropped")
+    finally:
+        session.clear()
+        server.shutdown()
+        server.server_close()
+
+    assert RedirectingHandler.hits == ["/moved", "/page", "/dropped"]
+
+
+@pytest.mark.integration
+def test_scraper_pool_matches_pages_in_flight_and_reports_transfer(capsys):
+    scraper = Scraper(max_entries=100, prefetch=3)
+    assert scraper.http.pool.connection_pool_kw["maxsize"] == 3
+    assert scraper.http.headers["Accept-Encoding"] == "gzip, deflate"
+
+    with replay_server.ReplayServer(pages=2, rows_per_page=4) as server:
+        scraper.base = server.url
+        assert len(scraper.scrape_data()) == 8
+    scraper.close()
+
+    output = capsys.readouterr().out
+    assert "on the wire" in output
+    assert "saved by compression" in output
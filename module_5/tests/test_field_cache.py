@@ -0,0 +1,55 @@
+"""Tests for memoizing Cleaner's low-cardinality field parsers."""
+
+# pylint: disable=missing-function-docstring,protected-access
+
+from __future__ import annotations
+
+import pytest
+
+from tests.import_utils import import_module
+
+clean_module = import_module("homework_sample_code.course_app.clean")
+
+Cleaner = clean_module.Cleaner
+
+
+@pytest.fixture(autouse=True)
+def default_field_cache():
+    clean_module.configure_field_cache()
+    yield
+    clean_module.configure_field_cache()
+
+
+def raw_entry(status: str, meta: str = "Fall 2025 | International") -> dict:
+    return {"status_raw": status, "meta_raw": meta, "program_raw": "Physics PhD"}
+
+
+@pytest.mark.integration
+def test_repeated_inputs_hit_the_cache():
+    Cleaner([raw_entry("Accepted on 12 Mar")] * 3 + [raw_entry("Rejected on 1 Feb")]).clean_data()
+
+    info = clean_module.field_cache_info()
+    assert info["_parse_status"].hits == 2
+    assert info["_parse_status"].misses == 2
+    assert (info["_normalise_degree"].hits, info["_extract_term"].hits) == (3, 3)
+    assert clean_module.field_cache_summary() == (
+        "Field cache: 8 hits, 4 misses (66.7% hit rate)."
+    )
+
+    clean_module.clear_field_cache()
+    assert clean_module.field_cache_summary() == "Field cache: 0 hits, 0 misses (0.0% hit rate)."
+
+
+@pytest.mark.integration
+def test_cache_size_bounds_and_evicts():
+    clean_module.configure_field_cache(2)
+    for status in ("Accepted", "Rejected", "Interview", "Accepted"):
+        clean_module._parse_status(status)
+
+    info = clean_module.field_cache_info()["_parse_status"]
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (0, 4, 2, 2)
+
+    clean_module.configure_field_cache(0)
+    assert clean_module._parse_status("Wait listed on 14 Feb") == ("Waitlisted", "14 Feb")
+    assert clean_module._extract_term("spring2026") == "Spring 2026"
+    assert clean_module.field_cache_info()["_extract_term"].currsize == 0
@@ -0,0 +1,143 @@
+"""Tests for the Postgres-backed distributed page queue."""
+
+# pylint: disable=missing-function-docstring,too-few-public-methods
+
+from __future__ import annotations
+
+import pytest
+
+from tests.conftest import MockDatabase, normalize_sql
+from tests.import_utils import import_module
+
+page_queue = import_module("page_queue")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+
+RAW_ENTRY_FIELDS = scrape_module.RAW_ENTRY_FIELDS
+
+
+def raw_entry(url: str) -> dict:
+    entry = {field: "" for field in RAW_ENTRY_FIELDS}
+    entry["url_raw"] = url
+    return entry
+
+
+class FakeScraper:
+    """Scraper double that fails for pages listed in ``failing``."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.pages = []
+
+    def scrape_page(self, page):
+        self.pages.append(page)
+        if page in self.failing:
+            return None
+        return [raw_entry(f"https://example.test/result/{page}{index}") for index in range(2)]
+
+
+def queue_script(db: MockDatabase, batches, lost_pages=()):
+    """Script claim results batch by batch and lease checks per page."""
+    remaining = list(batches)
+
+    def claim():
+        return [(page,) for page in remaining.pop(0)] if remaining else []
+
+    def mark_done():
+        _, params = db.queries[-1]
+        return [] if params[0] in lost_pages else [(params[0],)]
+
+    db.set_script(
+        {
+            normalize_sql(page_queue.CLAIM_PAGES): claim,
+            normalize_sql(page_queue.MARK_PAGE_DONE): mark_done,
+        }
+    )
+
+
+def executed(db: MockDatabase, statement) -> list:
+    target = normalize_sql(statement)
+    return [params for query, params in db.queries if query == target]
+
+
+@pytest.mark.db
+def test_claim_query_skips_locked_rows_and_reclaims_expired_leases():
+    claim_sql = normalize_sql(page_queue.CLAIM_PAGES)
+
+    assert "FOR UPDATE SKIP LOCKED" in claim_sql
+    assert "lease_expires_at < now() AND attempts < %s" in claim_sql
+    assert "RETURNING page" in claim_sql
+
+
+@pytest.mark.db
+def test_setup_and_enqueue_issue_idempotent_statements():
+    db = MockDatabase()
+    connection = db.connect()
+
+    page_queue.setup_page_queue(connection)
+    page_queue.enqueue_pages(connection, 1, 500)
+
+    statements = [query for query, _ in db.queries]
+    assert statements[0].startswith("CREATE TABLE IF NOT EXISTS page_queue")
+    assert "CREATE TABLE IF NOT EXISTS raw_entries" in statements[2]
+    assert statements[3].startswith("CREATE UNIQUE INDEX IF NOT EXISTS raw_entries_url_raw_key")
+    assert executed(db, page_queue.ENQUEUE_PAGES) == [(1, 500)]
+    assert "ON CONFLICT (page) DO NOTHING" in statements[-1]
+    assert db.commit_calls == 2
+
+
+@pytest.mark.db
+def test_worker_scrapes_claimed_pages_and_writes_entries():
+    db = MockDatabase()
+    queue_script(db, batches=[[3, 1], [7]])
+    scraper = FakeScraper()
+
+    completed = page_queue.run_worker(db.connect(), scraper, "host:1", batch_size=2)
+
+    assert completed == 3
+    assert scraper.pages == [1, 3, 7]
+    assert executed(db, page_queue.CLAIM_PAGES)[0] == ("host:1", 300, 5, 2)
+    assert executed(db, page_queue.DELETE_PAGE_ENTRIES) == [(1,), (3,), (7,)]
+
+    inserted = executed(db, page_queue.INSERT_RAW_ENTRY)
+    assert len(inserted) == 6
+    assert inserted[0][:2] == (1, 0)
+    assert inserted[1][:2] == (1, 1)
+    assert inserted[1][2 + RAW_ENTRY_FIELDS.index("url_raw")] == "https://example.test/result/11"
+    assert "ON CONFLICT (url_raw) WHERE url_raw <> '' DO NOTHING" in normalize_sql(
+        page_queue.INSERT_RAW_ENTRY
+    )
+
+
+@pytest.mark.db
+def test_worker_releases_failed_pages_and_skips_lost_leases():
+    db = MockDatabase()
+    queue_script(db, batches=[[1, 2, 3]], lost_pages={3})
+
+    completed = page_queue.run_worker(
+        db.connect(), FakeScraper(failing={2}), "host:1", max_attempts=4
+    )
+
+    assert completed == 1
+    assert executed(db, page_queue.RELEASE_PAGE) == [(4, 2, "host:1")]
+    assert executed(db, page_queue.FAIL_EXPIRED_PAGES) == [(4,), (4,)]
+    assert executed(db, page_queue.CLAIM_PAGES)[0] == ("host:1", 300, 4, 5)
+    assert executed(db, page_queue.DELETE_PAGE_ENTRIES) == [(1,)]
+
+
+@pytest.mark.db
+def test_default_worker_id_includes_pid():
+    assert page_queue.default_worker_id().endswith(f":{page_queue.os.getpid()}")
+
+
+@pytest.mark.db
+def test_cli_dispatches_commands(monkeypatch):
+    db = MockDatabase()
+    queue_script(db, batches=[])
+    monkeypatch.setattr(page_queue, "connect", lambda **_kwargs: db.connect())
+
+    page_queue.main(["setup"])
+    page_queue.main(["enqueue", "10", "20"])
+    page_queue.main(["work", "--worker-id", "w1", "--batch-size", "3"])
+
+    assert executed(db, page_queue.ENQUEUE_PAGES) == [(10, 20)]
+    assert executed(db, page_queue.CLAIM_PAGES) == [("w1", 300, 5, 3)]
@@ -0,0 +1,46 @@
+"""Tests for cleaning raw entries on a process pool."""
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import annotations
+
+import pytest
+
+from tests.import_utils import import_module
+
+clean_module = import_module("homework_sample_code.course_app.clean")
+clean_entries = import_module("benchmarks.clean_entries")
+
+Cleaner = clean_module.Cleaner
+
+
+@pytest.mark.integration
+def test_parallel_cleaning_keeps_input_order():
+    entries = clean_entries.generate_raw_entries(50, seed=2)
+    cleaner = Cleaner(entries)
+
+    parallel = cleaner.clean_data(workers=2, chunk_size=7, min_parallel_entries=1)
+
+    assert parallel == cleaner.clean_data()
+    assert [entry["url"] for entry in parallel] == [entry["url_raw"] for entry in entries]
+
+
+@pytest.mark.integration
+def test_small_inputs_are_cleaned_without_a_pool(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(clean_module, "ProcessPoolExecutor", no_pool)
+    cleaner = Cleaner(clean_entries.generate_raw_entries(20))
+
+    assert len(cleaner.clean_data(workers=4)) == 20
+    assert len(cleaner.clean_data(workers=1, min_parallel_entries=1)) == 20
+    assert Cleaner([]).clean_data(workers=4, min_parallel_entries=0) == []
+
+
+@pytest.mark.integration
+def test_clean_benchmark_times_worker_pool():
+    timings = clean_entries.main(["--entries", "30", "--repeat", "1", "--workers", "2"])
+
+    assert timings[-1].strategy == "Cleaner.clean_data x2"
+    assert timings[-1].entries == 30
@@ -0,0 +1,96 @@
+"""Tests for reusing stored parses of survey pages whose table is unchanged."""
+
+# pylint: disable=missing-function-docstring,protected-access,too-few-public-methods
+
+from __future__ import annotations
+
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_scrape_pipeline import make_page, result_url
+
+cache_module = import_module("homework_sample_code.course_app.cache")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+
+ResponseCache = cache_module.ResponseCache
+Scraper = scrape_module.Scraper
+page_fingerprint = cache_module.page_fingerprint
+
+
+def wrap(table: str, footer: str = "") -> str:
+    return f"<html><body>{table}<footer>{footer}</footer></body></html>"
+
+
+class CountingScraper(Scraper):
+    """Scraper that serves fixed pages and counts how often it parses them."""
+
+    def __init__(self, pages, **kwargs):
+        super().__init__(max_entries=100, **kwargs)
+        self.pages = pages
+        self.parsed = 0
+
+    def _get_html(self, url):
+        return self.pages.get(int(url.rsplit("page=", 1)[1]), "")
+
+    def _extract_raw_data(self, html):
+        self.parsed += 1
+        return super()._extract_raw_data(html)
+
+
+@pytest.mark.integration
+def test_fingerprint_covers_only_the_results_table():
+    page = wrap(make_page(1), footer="rendered at 10:00")
+
+    assert page_fingerprint(page) == page_fingerprint(wrap(make_page(1), footer="10:01"))
+    assert page_fingerprint(page) != page_fingerprint(wrap(make_page(2)))
+    assert page_fingerprint("<p>no table</p>") != page_fingerprint("<p>other</p>")
+
+
+@pytest.mark.integration
+def test_unchanged_pages_are_not_parsed_again(tmp_path):
+    cache_path = tmp_path / "cache.sqlite3"
+    pages = {page: wrap(make_page(page), footer="first") for page in (1, 2)}
+
+    first = CountingScraper(pages, cache=ResponseCache(cache_path))
+    expected = first.scrape_data()
+    assert first.parsed == 2
+    first.close()
+
+    pages[1] = wrap(make_page(1), footer="second visit")
+    pages[2] = wrap(make_page(2, rows=3))
+    second = CountingScraper(pages, cache=ResponseCache(cache_path))
+    entries = second.scrape_data()
+
+    assert second.parsed == 1  # only page 2's table changed
+    assert entries[:2] == expected[:2]
+    assert entries[-1]["url_raw"] == result_url(2, 2)
+    assert (second.cache.parse_hits, second.cache.parse_misses) == (1, 1)
+    assert "Parsed pages: 1 reused, 1 parsed." in second.cache.summary()
+    second.close()
+
+
+@pytest.mark.integration
+def test_parser_pool_reuses_stored_parses(tmp_path):
+    cache_path = tmp_path / "cache.sqlite3"
+    pages = {page: make_page(page) for page in (1, 2, 3)}
+
+    first = CountingScraper(pages, cache=ResponseCache(cache_path), parse_workers=1)
+    expected = first.scrape_data()
+    first.close()
+
+    second = CountingScraper(pages, cache=ResponseCache(cache_path), parse_workers=1)
+    entries = second.scrape_data()
+
+    assert entries == expected
+    assert second.cache.parse_hits == 3
+    second.close()
+
+
+@pytest.mark.integration
+def test_without_a_cache_every_page_is_parsed():
+    scraper = CountingScraper({1: make_page(1)})
+
+    scraper.scrape_page(1)
+    scraper.scrape_page(1)
+
+    assert scraper.parsed == 2
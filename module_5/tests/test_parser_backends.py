@@ -0,0 +1,57 @@
+"""Parity tests for the pluggable BeautifulSoup parser backends."""
+
+# pylint: disable=missing-function-docstring,protected-access
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests.import_utils import import_module
+
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+
+Scraper = scrape_module.Scraper
+
+SAVED_PAGES = sorted((Path(__file__).resolve().parent / "data").glob("survey_page_*.html"))
+
+BACKENDS = [
+    pytest.param("html.parser", True, id="html.parser-table-only"),
+    pytest.param("lxml", False, id="lxml"),
+    pytest.param("lxml", True, id="lxml-table-only"),
+]
+
+
+def parse_with(html: str, parser: str = "html.parser", table_only: bool = False):
+    return Scraper(max_entries=0, parser=parser, table_only=table_only)._extract_raw_data(html)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("page_path", SAVED_PAGES, ids=lambda path: path.name)
+@pytest.mark.parametrize("parser, table_only", BACKENDS)
+def test_backends_match_default_parser_on_saved_pages(page_path, parser, table_only):
+    if parser == "lxml":
+        pytest.importorskip("lxml")
+    html = page_path.read_text(encoding="utf-8")
+
+    expected = parse_with(html)
+
+    assert expected
+    assert parse_with(html, parser, table_only) == expected
+
+
+@pytest.mark.integration
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported parser backend"):
+        Scraper(parser="html5lib")
+
+
+@pytest.mark.integration
+def test_parse_workers_use_configured_backend(monkeypatch):
+    html = SAVED_PAGES[0].read_text(encoding="utf-8")
+    monkeypatch.setattr(Scraper, "_get_html", lambda _self, url: html if "page=1" in url else "")
+
+    results = Scraper(parse_workers=1, table_only=True).scrape_data()
+
+    assert results == parse_with(html)
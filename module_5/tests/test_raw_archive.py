@@ -0,0 +1,105 @@
+"""Tests for the compressed raw-entry archive and the reprocess command."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_scrape_clean_main import main_environment  # pylint: disable=unused-import
+
+archive_module = import_module("homework_sample_code.course_app.archive")
+records_module = import_module("homework_sample_code.course_app.records")
+main_module = import_module("homework_sample_code.course_app.main")
+
+RawArchive = archive_module.RawArchive
+RawEntry = records_module.RawEntry
+
+
+def raw_entry(index: int, comments: str = "") -> RawEntry:
+    return RawEntry(
+        university_raw=f"University {index}",
+        program_raw="Computer Science",
+        status_raw="Accepted on 11 Apr",
+        url_raw=f"https://www.thegradcafe.com/result/{index}",
+        meta_raw="Fall 2025 | GPA 3.80",
+        comments_raw=comments,
+    )
+
+
+@pytest.mark.integration
+def test_archive_appends_across_chunks(tmp_path):
+    archive = RawArchive(tmp_path / "archive", chunk_entries=3)
+
+    assert archive.append(raw_entry(index) for index in range(2)) == 2
+    assert archive.append([raw_entry(index) for index in range(2, 7)]) == 5
+    assert not archive.append([])
+
+    reopened = RawArchive(tmp_path / "archive", chunk_entries=3)
+    assert [path.name for path in reopened.chunk_paths()] == [
+        "raw-000001.jsonl.gz",
+        "raw-000002.jsonl.gz",
+        "raw-000003.jsonl.gz",
+    ]
+    assert reopened.entry_count == 7
+    assert list(reopened.iter_entries()) == [raw_entry(index) for index in range(7)]
+
+    with gzip.open(reopened.chunk_paths()[0], "rt", encoding="utf-8") as handle:
+        assert json.loads(handle.readline())[0] == "University 0"
+
+
+@pytest.mark.integration
+def test_archive_rejects_a_different_schema(tmp_path):
+    directory = tmp_path / "archive"
+    directory.mkdir()
+    (directory / archive_module.MANIFEST_NAME).write_text(
+        json.dumps({"fields": ["url_raw"], "chunks": []}), encoding="utf-8"
+    )
+
+    with pytest.raises(ValueError):
+        RawArchive(directory)
+
+
+@pytest.mark.integration
+def test_main_archives_every_raw_entry(main_environment):
+    main_module.main()
+
+    archived = list(RawArchive(main_environment.archive).iter_entries())
+    assert [entry["url_raw"] for entry in archived] == ["https://www.thegradcafe.com/result/12345"]
+    assert archived[0]["comments_raw"] == "GRE: 322 (V: 160) AW 4.5"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("workers", [1, 2])
+def test_reprocess_rewrites_only_changed_records(main_environment, workers):
+    archive = RawArchive(main_environment.archive, chunk_entries=2)
+    archive.append([raw_entry(1, "GRE 321"), raw_entry(2), raw_entry(3, "GRE 330")])
+    archive.append([raw_entry(3, "GRE 331")])
+
+    records = [main_module.Cleaner.normalise_entry(raw_entry(index)) for index in (1, 2, 3)]
+    records[0]["llm-generated-program"] = "Computer Science"
+    records.append({"program": "Existing Program", "url": "https://existing"})
+    with open(main_environment.data_file, "w", encoding="utf-8") as handle:
+        json.dump(records, handle)
+
+    assert main_module.reprocess(workers=workers) == 2
+
+    saved = main_environment.saved["data"]
+    assert [record["GRE"] for record in saved[:3]] == ["321", "", "331"]
+    assert saved[0]["llm-generated-program"] == "Computer Science"
+    assert saved[3] == {"program": "Existing Program", "url": "https://existing"}
+
+
+@pytest.mark.integration
+def test_reprocess_without_changes_does_not_save(main_environment, capsys):
+    assert main_module.reprocess() == 0
+    assert "No raw archive found" in capsys.readouterr().out
+
+    RawArchive(main_environment.archive).append([raw_entry(5)])
+    assert main_module.reprocess(workers=1) == 0
+    assert "data" not in main_environment.saved
+    assert main_module._parse_args(["--reprocess", "--workers", "4"]).reprocess  # pylint: disable=protected-access
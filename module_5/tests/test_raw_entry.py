@@ -0,0 +1,101 @@
+"""Tests for the slotted ``RawEntry`` record."""
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import annotations
+
+import pickle
+import tracemalloc
+
+import pytest
+
+from tests.import_utils import import_module
+
+records = import_module("homework_sample_code.course_app.records")
+clean_module = import_module("homework_sample_code.course_app.clean")
+
+RawEntry = records.RawEntry
+RAW_ENTRY_FIELDS = records.RAW_ENTRY_FIELDS
+
+
+def sample_values(index: int = 0) -> tuple:
+    return (
+        "MIT",
+        "Computer Science",
+        "PhD",
+        "September 01, 2025",
+        "Accepted on 1 Sep",
+        f"https://example.test/result/{index}",
+        "Fall 2026 International GPA 3.90",
+        "Great news",
+    )
+
+
+@pytest.mark.integration
+def test_raw_entry_behaves_like_the_legacy_dict():
+    values = sample_values()
+    legacy = dict(zip(RAW_ENTRY_FIELDS, values))
+    entry = RawEntry(*values)
+
+    assert entry == legacy
+    assert legacy == entry
+    assert dict(entry) == legacy
+    assert list(entry) == list(RAW_ENTRY_FIELDS)
+    assert len(entry) == len(RAW_ENTRY_FIELDS)
+    assert entry["status_raw"] == entry.status_raw
+    assert entry.get("missing", "x") == "x"
+    assert RawEntry.from_mapping({"url_raw": "u"}) == RawEntry(url_raw="u")
+
+    entry["meta_raw"] = ""
+    assert entry.meta_raw == ""
+    with pytest.raises(KeyError):
+        entry["extra"] = "nope"
+    with pytest.raises(KeyError):
+        _ = entry["extra"]
+    with pytest.raises(AttributeError):
+        entry.extra = "nope"  # pylint: disable=attribute-defined-outside-init
+
+    assert "url_raw='https://example.test/result/0'" in repr(entry)
+
+
+@pytest.mark.integration
+def test_raw_entry_round_trips_through_pickle():
+    entry = RawEntry(*sample_values(7))
+
+    restored = pickle.loads(pickle.dumps(entry))
+
+    assert isinstance(restored, RawEntry)
+    assert restored.as_tuple() == entry.as_tuple()
+
+
+@pytest.mark.integration
+def test_cleaner_output_is_identical_for_raw_entry_and_dict():
+    values = sample_values()
+
+    from_record = clean_module.Cleaner.normalise_entry(RawEntry(*values))
+    from_dict = clean_module.Cleaner.normalise_entry(dict(zip(RAW_ENTRY_FIELDS, values)))
+
+    assert from_record == from_dict
+    assert from_record["GPA"] == "3.90"
+
+
+def _allocated(build) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        keep = build()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    assert keep
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+@pytest.mark.integration
+def test_raw_entries_use_less_than_half_the_memory_of_dicts():
+    rows = [sample_values(index) for index in range(5000)]
+
+    dict_bytes = _allocated(lambda: [dict(zip(RAW_ENTRY_FIELDS, row)) for row in rows])
+    record_bytes = _allocated(lambda: [RawEntry(*row) for row in rows])
+
+    assert record_bytes * 2 < dict_bytes
@@ -0,0 +1,158 @@
+"""Tests for the on-disk response cache and conditional GETs in ``Scraper``."""
+
+# pylint: disable=missing-function-docstring,too-few-public-methods,protected-access
+
+from __future__ import annotations
+
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from tests.import_utils import import_module
+
+cache_module = import_module("homework_sample_code.course_app.cache")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+
+ResponseCache = cache_module.ResponseCache
+Scraper = scrape_module.Scraper
+
+
+class FakeHttp:
+    """Minimal PoolManager double that honours ``If-None-Match``."""
+
+    def __init__(self, body="<html>page</html>", etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def request(self, method, url, headers=None):
+        self.requests.append((method, url, dict(headers or {})))
+        if headers and headers.get("If-None-Match") == self.etag:
+            return SimpleNamespace(status=304, data=b"", headers={})
+        return SimpleNamespace(
+            status=200,
+            data=self.body.encode("utf-8"),
+            headers={"ETag": self.etag, "Last-Modified": "Mon, 01 Sep 2025 00:00:00 GMT"},
+        )
+
+    def clear(self):
+        pass
+
+
+@pytest.mark.integration
+def test_conditional_get_serves_304_from_disk(tmp_path, capsys):
+    cache_path = tmp_path / "cache.sqlite3"
+
+    first = Scraper(cache=ResponseCache(cache_path))
+    first.http = FakeHttp()
+    assert first._get_html("https://example.test/survey/?page=1") == "<html>page</html>"
+    assert first.cache.misses == 1
+    first.close()
+
+    second = Scraper(cache=ResponseCache(cache_path))
+    second.http = FakeHttp()
+    assert second._get_html("https://example.test/survey/?page=1") == "<html>page</html>"
+
+    _, _, headers = second.http.requests[0]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Mon, 01 Sep 2025 00:00:00 GMT"
+    assert (second.cache.hits, second.cache.misses) == (1, 0)
+
+    print(second.cache.summary())
+    assert "1 hits, 0 misses" in capsys.readouterr().out
+    second.close()
+
+
+@pytest.mark.integration
+def test_changed_page_is_downloaded_and_replaced(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.store("https://example.test/a", "old", etag='"v1"')
+
+    scraper = Scraper(cache=cache)
+    scraper.http = FakeHttp(body="new", etag='"v2"')
+
+    assert scraper._get_html("https://example.test/a") == "new"
+    assert cache.get("https://example.test/a").etag == '"v2"'
+    assert cache.misses == 1
+    scraper.close()
+
+
+@pytest.mark.integration
+def test_cache_skips_responses_without_validators(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.store("https://example.test/a", "body")
+
+    assert cache.get("https://example.test/a") is None
+    assert not cache.get("https://example.test/missing")
+    cache.close()
+
+
+@pytest.mark.integration
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(cache_module.time, "time", lambda: next(clock))
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_bytes=10)
+
+    cache.store("a", "aaaa", etag="1")
+    cache.store("b", "bbbb", etag="2")
+    assert cache.get("a") is not None  # "a" is now the most recently used entry
+    cache.store("c", "cccc", etag="3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.total_bytes() == 8
+
+    cache.store("huge", "x" * 50, etag="4")
+    assert cache.get("huge") is None
+    cache.close()
+
+
+@pytest.mark.integration
+def test_parsed_entries_share_the_size_budget(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(cache_module.time, "time", lambda: next(clock))
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_bytes=40)
+
+    cache.store("a", "a" * 20, etag="1")
+    cache.store_parsed("p1", "f1", [("x" * 8,)])  # 14 bytes of JSON
+    assert cache.get_parsed("p1", "f1") is not None  # "p1" is now more recent than "a"
+    cache.store_parsed("p2", "f2", [("y" * 8,)])
+
+    assert cache.get("a") is None
+    assert cache.get_parsed("p1", "f1") == [("x" * 8,)]
+    assert cache.get_parsed("p2", "f2") == [("y" * 8,)]
+    assert cache.total_bytes() == 28
+
+    cache.store_parsed("huge", "f3", [("z" * 50,)])
+    assert cache.get_parsed("huge", "f3") is None
+    cache.close()
+
+
+@pytest.mark.integration
+def test_parsed_pages_from_older_caches_are_rebuilt(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE parsed_pages (url TEXT PRIMARY KEY, fingerprint, entries)")
+        db.execute("INSERT INTO parsed_pages VALUES ('p', 'f', '[[\"a\"]]')")
+
+    cache = ResponseCache(path)
+    assert cache.get_parsed("p", "f") is None
+    cache.store_parsed("p", "f", [("a",)])
+    assert cache.get_parsed("p", "f") == [("a",)]
+    cache.close()
+
+
+@pytest.mark.integration
+def test_non_200_response_returns_none_without_caching(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    scraper = Scraper(cache=cache)
+    scraper.http = SimpleNamespace(
+        request=lambda *args, **kwargs: SimpleNamespace(status=404, data=b"", headers={}),
+        clear=lambda: None,
+    )
+
+    assert scraper._get_html("https://example.test/a") is None
+    assert (cache.hits, cache.misses) == (0, 0)
+    scraper.close()
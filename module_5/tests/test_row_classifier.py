@@ -0,0 +1,74 @@
+"""Golden-output tests for the single-pass survey row classifier."""
+
+# pylint: disable=missing-function-docstring,protected-access
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from tests.import_utils import import_module
+
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+parse_pages = import_module("benchmarks.parse_pages")
+
+Scraper = scrape_module.Scraper
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+PARSER_DIR = DATA_DIR / "parser"
+# Expected entries were captured from the row-by-row parser this classifier replaced.
+GOLDEN_CASES = {
+    path.name.replace(".expected.json", ""): path
+    for path in sorted(PARSER_DIR.glob("*.expected.json"))
+}
+
+
+def source_page(name: str) -> str:
+    path = PARSER_DIR / f"{name}.html"
+    if not path.exists():
+        path = DATA_DIR / f"{name}.html"
+    return path.read_text(encoding="utf-8")
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("name", sorted(GOLDEN_CASES))
+@pytest.mark.parametrize("parser, table_only", [("html.parser", False), ("lxml", True)])
+def test_classifier_reproduces_golden_entries(name, parser, table_only):
+    if parser == "lxml":
+        pytest.importorskip("lxml")
+    expected = GOLDEN_CASES[name].read_text(encoding="utf-8")
+
+    entries = Scraper(max_entries=0, parser=parser, table_only=table_only)._extract_raw_data(
+        source_page(name)
+    )
+
+    rendered = json.dumps([dict(entry) for entry in entries], indent=4, ensure_ascii=False)
+    assert rendered + "\n" == expected
+
+
+@pytest.mark.integration
+def test_table_rows_match_css_selection():
+    html = (
+        "<table><tbody><tr><td>a</td></tr>"
+        "<tr><td><table><tbody><tr><td>nested</td></tr></tbody></table></td></tr>"
+        "</tbody></table><tr><td>outside</td></tr><table><tbody><tr><td>b</td></tr></tbody></table>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+
+    assert Scraper._table_rows(soup) == soup.select("tbody tr")
+
+
+@pytest.mark.integration
+def test_parse_benchmark_reports_every_backend(capsys):
+    timings = parse_pages.main(["--recorded", str(DATA_DIR), "--repeat", "1",
+                                "--parser", "html.parser"])
+
+    assert [(timing.parser, timing.table_only) for timing in timings] == [
+        ("html.parser", False),
+        ("html.parser", True),
+    ]
+    assert all(timing.entries == 61 and timing.total_ms > 0 for timing in timings)
+    assert "classify ms" in capsys.readouterr().out
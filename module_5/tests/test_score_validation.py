@@ -0,0 +1,88 @@
+"""Tests for the range checks applied to cleaned GPA and GRE scores."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_raw_archive import raw_entry
+from tests.test_scrape_clean_main import main_environment  # pylint: disable=unused-import
+
+validate_module = import_module("homework_sample_code.course_app.validate")
+main_module = import_module("homework_sample_code.course_app.main")
+archive_module = import_module("homework_sample_code.course_app.archive")
+
+ScoreValidator = validate_module.ScoreValidator
+
+
+@pytest.mark.integration
+def test_find_violations_flags_each_rule_and_ignores_missing():
+    violations = validate_module.find_violations(
+        {
+            "GPA": np.array([3.8, 9.7, np.nan, -0.1]),
+            "GRE": np.array([800.0, 320.0, np.nan, 259.0]),
+            "GRE V": np.array([160.0, 80.0, 170.0, np.nan]),
+            "GRE AW": np.array([4.5, 4.2, 6.5, np.nan]),
+        }
+    )
+
+    assert {name: mask.tolist() for name, mask in violations.items()} == {
+        "gpa_range": [False, True, False, True],
+        "gre_range": [True, False, False, True],
+        "gre_verbal_range": [False, True, False, False],
+        "gre_aw_range": [False, True, True, False],
+    }
+    assert not validate_module.find_violations({"term": np.array([1.0])})
+
+
+@pytest.mark.integration
+def test_validator_nulls_columns_and_counts_per_rule():
+    validator = ScoreValidator()
+    columns = {"GPA": np.array([3.5, 9.7]), "GRE": np.array([800.0, 330.0])}
+
+    validator.validate_columns(columns)
+    validator.validate_columns({"GPA": np.array([5.0])})
+
+    np.testing.assert_array_equal(columns["GPA"], [3.5, np.nan])
+    np.testing.assert_array_equal(columns["GRE"], [np.nan, 330.0])
+    assert validator.violations == {
+        "gpa_range": 2, "gre_range": 1, "gre_verbal_range": 0, "gre_aw_range": 0,
+    }
+    assert validator.checked == 3
+    assert validator.summary() == (
+        "Validation: checked 3 entries, nulled 3 out-of-range values (gpa_range 2, gre_range 1)."
+    )
+
+
+@pytest.mark.integration
+def test_validate_records_blanks_only_invalid_scores():
+    records = [
+        {"url": "a", "GPA": "3.80", "GRE": "800", "GRE V": "80", "GRE AW": "4.5"},
+        {"url": "b", "GPA": 3.2, "GRE": "", "GRE V": None},
+    ]
+
+    assert ScoreValidator().validate_records(records) == 2
+    assert records == [
+        {"url": "a", "GPA": "3.80", "GRE": "", "GRE V": "", "GRE AW": "4.5"},
+        {"url": "b", "GPA": 3.2, "GRE": "", "GRE V": None},
+    ]
+    assert ScoreValidator().validate_records([]) == 0
+
+
+@pytest.mark.integration
+def test_pipeline_and_reprocess_apply_the_checks(main_environment, capsys):
+    main_module.main()
+    assert "Validation: checked 1 entries, nulled 0 out-of-range values." in capsys.readouterr().out
+
+    archive_module.RawArchive(main_environment.archive).append([raw_entry(7, "GRE 800, 90 V")])
+    with open(main_environment.data_file, "w", encoding="utf-8") as handle:
+        json.dump([{"url": "https://www.thegradcafe.com/result/7", "GRE": "800"}], handle)
+
+    assert main_module.reprocess(workers=1) == 1
+    assert main_environment.saved["data"][0]["GRE"] == ""
+    assert "(gre_range 1, gre_verbal_range 1)" in capsys.readouterr().out
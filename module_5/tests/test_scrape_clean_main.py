@@ -119,9 +119,9 @@ def main_environment(monkeypatch, tmp_path):
     class FakeScraper(Scraper):
         """Scraper stub that returns a single canned entry."""
 
-        def scrape_data(self, existing_urls=None):  # pylint: disable=unused-argument
-            """Return canned raw entries regardless of input URLs."""
-            return [
+        def iter_entries(self, existing_urls=None, resume=False):  # pylint: disable=unused-argument
+            """Yield canned raw entries regardless of input URLs."""
+            yield from [
                 {
                     "program_raw": "Computer Science",
                     "university_raw": "Example University",
@@ -134,7 +134,21 @@ def main_environment(monkeypatch, tmp_path):
                 }
             ]
 
+        def fetch_html(self, url):  # pylint: disable=unused-argument
+            """Never download detail pages during tests."""
+            return None
+
     monkeypatch.setattr("homework_sample_code.course_app.main.Scraper", FakeScraper)
+    monkeypatch.setattr(
+        "homework_sample_code.course_app.main.WATERMARK_FILE", tmp_path / "watermark.json"
+    )
+    monkeypatch.setattr("homework_sample_code.course_app.main.ARCHIVE_DIR", tmp_path / "archive")
+    monkeypatch.setattr(
+        "homework_sample_code.course_app.main.CHECKPOINT_FILE", tmp_path / "checkpoint.jsonl"
+    )
+    monkeypatch.setattr(
+        "homework_sample_code.course_app.main.CACHE_FILE", tmp_path / "cache.sqlite3"
+    )
 
     def fake_load(filename=str(data_file)):
         """Load JSON from the temporary fixture file."""
@@ -146,13 +160,28 @@ def main_environment(monkeypatch, tmp_path):
     saved_payload = {}
 
     def fake_save(data, filename=str(data_file)):
-        """Capture saved payloads for assertions."""
+        """Capture saved payloads for assertions and write them like ``save_data``."""
         saved_payload["data"] = data
         saved_payload["filename"] = filename
+        with open(filename, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
 
     monkeypatch.setattr("homework_sample_code.course_app.main.save_data", fake_save)
 
-    yield SimpleNamespace(data_file=str(data_file), saved=saved_payload)
+    def fake_append(entries, filename=str(data_file)):
+        """Capture the merged dataset that appending would produce."""
+        appended = list(entries)
+        fake_save(fake_load(filename) + appended, filename)
+        return len(appended)
+
+    monkeypatch.setattr("homework_sample_code.course_app.main.append_data", fake_append)
+
+    yield SimpleNamespace(
+        data_file=str(data_file),
+        saved=saved_payload,
+        watermark=tmp_path / "watermark.json",
+        archive=tmp_path / "archive",
+    )
 
     if hasattr(load_data, "cache_clear"):
         load_data.cache_clear()
@@ -175,3 +204,45 @@ def test_main_merges_existing_and_new_entries(main_environment):
     assert new_entry["GPA"] == "3.80"
     assert new_entry["term"] == "Fall 2025"
     assert new_entry["US/International"] == "International"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("existing_count", [0, 2])
+def test_append_data_matches_full_rewrite(tmp_path, existing_count):
+    """Appending in place produces the same bytes as saving the merged list."""
+    entries = [
+        {"program": f"Program {index}", "comments": "Café \"quoted\"\nline", "url": str(index)}
+        for index in range(5)
+    ]
+    existing, new = entries[:existing_count], entries[existing_count:]
+
+    appended_path = tmp_path / "appended.json"
+    main_module.save_data(existing, appended_path)
+    assert main_module.append_data(iter(new), appended_path) == len(new)
+
+    rewritten_path = tmp_path / "rewritten.json"
+    main_module.save_data(entries, rewritten_path)
+
+    assert appended_path.read_bytes() == rewritten_path.read_bytes()
+
+
+@pytest.mark.integration
+def test_append_data_creates_missing_file_and_skips_empty_input(tmp_path):
+    """A missing dataset is created, and nothing is written without entries."""
+    path = tmp_path / "data.json"
+
+    assert main_module.append_data([], path) == 0
+    assert not path.exists()
+
+    main_module.append_data([{"url": "a"}], path)
+    assert load_data(path) == [{"url": "a"}]
+
+
+@pytest.mark.integration
+def test_append_data_rejects_non_array_file(tmp_path):
+    """Refuse to append to a file that does not hold a JSON array."""
+    path = tmp_path / "data.json"
+    path.write_text('{"url": "a"}', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        main_module.append_data([{"url": "b"}], path)
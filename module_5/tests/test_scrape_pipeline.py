@@ -0,0 +1,212 @@
+"""Tests for the scraper's page pipeline (prefetching, ordering, stop rules)."""
+
+# pylint: disable=missing-function-docstring,too-few-public-methods
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+import pytest
+
+from tests.import_utils import import_module
+
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+
+Scraper = scrape_module.Scraper
+
+
+def make_page(page: int, rows: int = 2) -> str:
+    """Return survey HTML whose result IDs encode the page number."""
+    body = []
+    for offset in range(rows):
+        result_id = 100000 - page * 10 - offset
+        body.append(
+            f"""
+    <tr>
+      <td><div class="tw-font-medium">University {page}-{offset}</div></td>
+      <td><span>Program</span><span>PhD</span></td>
+      <td>January 10, 2024</td>
+      <td>Accepted on 11 Apr</td>
+      <td><a href="/result/{result_id}">link</a></td>
+    </tr>"""
+        )
+    return f"<table><tbody>{''.join(body)}</tbody></table>"
+
+
+def result_url(page: int, offset: int = 0) -> str:
+    return f"https://www.thegradcafe.com/result/{100000 - page * 10 - offset}"
+
+
+class FakeSite:
+    """Thread-safe stand-in for ``Scraper._get_html`` with a fixed page count.
+
+    By default it serves :func:`make_page` for the ``page=`` parameter and
+    records the page numbers requested. With ``render``, every request is
+    answered by ``render(url)`` after ``delay`` seconds and the URLs are
+    recorded instead. ``max_in_flight`` keeps the most requests served at once.
+    """
+
+    def __init__(
+        self,
+        pages: int = 0,
+        delay: float = 0.0,
+        render: Optional[Callable[[str], str]] = None,
+    ):
+        self.pages = pages
+        self.delay = delay
+        self.render = render
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url):
+        page = 0 if self.render else int(url.rsplit("page=", 1)[1])
+        with self.lock:
+            self.requested.append(url if self.render else page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.render:
+            time.sleep(self.delay)
+        elif self.delay:
+            # Later pages answer first so out-of-order completion is exercised.
+            time.sleep(self.delay * max(0, self.pages - page))
+        with self.lock:
+            self.in_flight -= 1
+        if self.render:
+            return self.render(url)
+        return make_page(page) if page <= self.pages else ""
+
+    def install(self, monkeypatch, method: str = "_get_html"):
+        monkeypatch.setattr(Scraper, method, lambda _scraper, url: self(url))
+        return self
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("prefetch", [0, 4])
+def test_prefetch_keeps_page_order(monkeypatch, prefetch):
+    """Entries come back in page order regardless of the prefetch window."""
+    site = FakeSite(pages=6, delay=0.002)
+    site.install(monkeypatch)
+
+    results = Scraper(max_entries=100, prefetch=prefetch).scrape_data()
+
+    expected = [result_url(page, offset) for page in range(1, 7) for offset in range(2)]
+    assert [entry["url_raw"] for entry in results] == expected
+
+
+@pytest.mark.integration
+def test_prefetch_stops_on_seen_url_and_cancels_remaining(monkeypatch):
+    """A previously-seen URL ends the scrape and bounds extra page requests."""
+    site = FakeSite(pages=50)
+    site.install(monkeypatch)
+
+    scraper = Scraper(max_entries=100, prefetch=3)
+    results = scraper.scrape_data(existing_urls={result_url(3, 1)})
+
+    assert [entry["url_raw"] for entry in results] == [
+        result_url(1, 0),
+        result_url(1, 1),
+        result_url(2, 0),
+        result_url(2, 1),
+        result_url(3, 0),
+    ]
+    # Only the pages inside the window past the stop point may have been requested.
+    assert max(site.requested) <= 3 + scraper.prefetch
+
+
+@pytest.mark.integration
+def test_sequential_mode_fetches_only_needed_pages(monkeypatch):
+    """Without prefetching no page past the stop point is requested."""
+    site = FakeSite(pages=50)
+    site.install(monkeypatch)
+
+    results = Scraper(max_entries=3).scrape_data()
+
+    assert len(results) == 3
+    assert site.requested == [1, 2]
+
+
+@pytest.mark.integration
+def test_zero_max_entries_skips_network(monkeypatch):
+    site = FakeSite(pages=5)
+    site.install(monkeypatch)
+
+    assert not Scraper(max_entries=0, prefetch=2).scrape_data()
+    assert not site.requested
+
+
+@pytest.mark.integration
+def test_parse_workers_match_in_process_parsing(monkeypatch):
+    """Parsing in worker processes yields the same entries in the same order."""
+    FakeSite(pages=5).install(monkeypatch)
+
+    serial = Scraper(max_entries=100).scrape_data()
+    pooled = Scraper(max_entries=100, prefetch=2, parse_workers=2).scrape_data()
+
+    assert pooled == serial
+    assert len(pooled) == 10
+
+
+@pytest.mark.integration
+def test_parse_workers_respect_stop_rules(monkeypatch):
+    FakeSite(pages=50).install(monkeypatch)
+
+    scraper = Scraper(max_entries=100, parse_workers=2)
+    results = scraper.scrape_data(existing_urls={result_url(2, 0)})
+
+    assert [entry["url_raw"] for entry in results] == [result_url(1, 0), result_url(1, 1)]
+
+
+@pytest.mark.integration
+def test_parse_page_returns_plain_tuples():
+    rows = scrape_module.parse_page(make_page(1))
+
+    assert all(isinstance(row, tuple) for row in rows)
+    entries = scrape_module.entries_from_tuples(rows)
+    assert entries == Scraper(max_entries=0)._extract_raw_data(  # pylint: disable=protected-access
+        make_page(1)
+    )
+    assert scrape_module.entries_to_tuples(entries) == rows
+
+
+@pytest.mark.integration
+def test_iter_entries_fetches_lazily(monkeypatch):
+    """Pages are only requested as the consumer reaches them."""
+    site = FakeSite(pages=50).install(monkeypatch)
+
+    entries = Scraper(max_entries=100).iter_entries()
+    first = next(entries)
+    assert first["url_raw"] == result_url(1, 0)
+    assert site.requested == [1]
+
+    assert next(entries)["url_raw"] == result_url(1, 1)
+    assert next(entries)["url_raw"] == result_url(2, 0)
+    assert site.requested == [1, 2]
+    entries.close()
+
+
+@pytest.mark.integration
+def test_iter_entries_matches_scrape_data(monkeypatch):
+    FakeSite(pages=6).install(monkeypatch)
+    seen = {result_url(5, 1)}
+
+    assert list(Scraper(max_entries=7).iter_entries(seen)) == Scraper(
+        max_entries=7
+    ).scrape_data(seen)
+    assert len(list(Scraper(max_entries=100).iter_entries(seen))) == 9
+
+
+@pytest.mark.integration
+def test_scrape_page_fetches_a_single_page(monkeypatch):
+    site = FakeSite(pages=3).install(monkeypatch)
+    scraper = Scraper()
+
+    assert [entry["url_raw"] for entry in scraper.scrape_page(2)] == [
+        result_url(2, 0),
+        result_url(2, 1),
+    ]
+    assert scraper.scrape_page(4) is None
+    assert site.requested == [2, 4]
@@ -0,0 +1,132 @@
+"""Tests for targeted ``?q=`` refreshes of individual universities or programs."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_scrape_clean_main import main_environment  # pylint: disable=unused-import
+from tests.test_scrape_pipeline import FakeSite
+
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+main_module = import_module("homework_sample_code.course_app.main")
+watermark_module = import_module("homework_sample_code.course_app.watermark")
+
+Scraper = scrape_module.Scraper
+
+FEED_IDS = {"Stanford University": 50000, "MIT": 40000}
+
+
+def feed_url(query: str, page: int, offset: int) -> str:
+    return f"https://www.thegradcafe.com/result/{FEED_IDS[query] - page * 10 - offset}"
+
+
+def feed_page(query: str, page: int) -> str:
+    rows = "".join(
+        f"""<tr><td><div class="tw-font-medium">{query}</div></td>
+        <td><span>Program</span><span>PhD</span></td><td>January 10, 2024</td>
+        <td>Accepted on 11 Apr</td>
+        <td><a href="{feed_url(query, page, offset)}">link</a></td></tr>"""
+        for offset in range(2)
+    )
+    return f"<table><tbody>{rows}</tbody></table>"
+
+
+def feed_request(url: str) -> tuple:
+    params = parse_qs(urlsplit(url).query)
+    return params["q"][0], int(params["page"][0])
+
+
+def render_feed(url: str, pages: int = 3) -> str:
+    query, page = feed_request(url)
+    return feed_page(query, page) if page <= pages else ""
+
+
+@pytest.mark.integration
+def test_query_feed_urls_are_encoded():
+    scraper = Scraper(query="University of Southern California")
+
+    assert scraper._page_url(2) == (  # pylint: disable=protected-access
+        "https://www.thegradcafe.com/survey/?q=University+of+Southern+California&page=2"
+    )
+
+
+@pytest.mark.integration
+def test_feeds_are_crawled_concurrently_and_stop_independently(monkeypatch, capsys):
+    site = FakeSite(delay=0.01, render=render_feed).install(monkeypatch)
+    scraper = Scraper(max_entries=100)
+
+    results = scraper.refresh_queries(
+        ["Stanford University", "MIT", "MIT", ""],
+        existing_urls={feed_url("Stanford University", 2, 0)},
+    )
+
+    assert list(results) == ["Stanford University", "MIT"]
+    assert [entry["url_raw"] for entry in results["Stanford University"]] == [
+        feed_url("Stanford University", 1, 0),
+        feed_url("Stanford University", 1, 1),
+    ]
+    assert len(results["MIT"]) == 6
+    requested = [feed_request(url) for url in site.requested]
+    assert ("Stanford University", 3) not in requested
+    assert ("MIT", 4) in requested
+    assert site.max_in_flight == 2
+    assert scraper.http.max_connections == 2
+    assert "Refreshed 'MIT': 6 NEW raw entries." in capsys.readouterr().out
+
+
+@pytest.mark.integration
+def test_feeds_share_the_scrapers_http_session(monkeypatch):
+    FakeSite(render=render_feed).install(monkeypatch)
+    scraper = Scraper(max_entries=100)
+    opened = []
+    monkeypatch.setattr(scrape_module, "HttpSession", lambda *args, **kwargs: opened.append(1))
+
+    scraper.refresh_queries(["Stanford University", "MIT"])
+
+    assert not opened
+    assert scraper._query_feed("MIT").http is scraper.http  # pylint: disable=protected-access
+
+
+@pytest.mark.integration
+def test_refresh_without_queries_returns_nothing():
+    assert not Scraper().refresh_queries([])
+
+
+@pytest.mark.integration
+def test_main_refresh_dedupes_feeds_and_keeps_the_watermark(main_environment, monkeypatch):
+    duplicate = {
+        "program_raw": "Computer Science",
+        "university_raw": "Stanford University",
+        "url_raw": "https://www.thegradcafe.com/result/99999",
+    }
+    requested = []
+
+    def fake_refresh(_scraper, queries, existing_urls=None):
+        requested.append((list(queries), existing_urls))
+        return {query: [dict(duplicate)] for query in queries}
+
+    monkeypatch.setattr(main_module.Scraper, "refresh_queries", fake_refresh)
+
+    main_module.main(queries=["Stanford University", "Computer Science"])
+
+    assert requested[0][0] == ["Stanford University", "Computer Science"]
+    assert len(main_environment.saved["data"]) == 2
+
+    watermark = watermark_module.ResultWatermark(main_environment.watermark)
+    assert watermark.max_id is None
+    assert watermark.has_seen(duplicate["url_raw"])
+    assert watermark.entry_count == 2
+
+
+@pytest.mark.integration
+def test_cli_rejects_resume_with_refresh():
+    options = main_module._parse_args(["--refresh", "MIT", "--refresh", "Yale"])  # pylint: disable=protected-access
+    assert options.refresh == ["MIT", "Yale"]
+
+    with pytest.raises(SystemExit):
+        main_module._parse_args(["--refresh", "MIT", "--resume"])  # pylint: disable=protected-access
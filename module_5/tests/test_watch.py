@@ -0,0 +1,133 @@
+"""Tests for the polling watch daemon and its adaptive interval."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name,unused-argument
+
+from __future__ import annotations
+
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_scrape_clean_main import main_environment  # pylint: disable=unused-import
+from tests.test_scrape_pipeline import FakeSite, result_url
+
+watch_module = import_module("watch")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+watermark_module = import_module("homework_sample_code.course_app.watermark")
+
+AdaptiveInterval = watch_module.AdaptiveInterval
+
+
+@pytest.mark.integration
+def test_interval_tracks_the_arrival_rate():
+    interval = AdaptiveInterval(10, 1000, target_entries=5, smoothing=0.5)
+
+    assert interval.observe(5, 100) == 100  # 0.05 entries/s -> 100s for 5 entries
+    assert interval.observe(50, 100) == pytest.approx(5 / 0.275)
+    assert interval.observe(500, 1) == 10  # bursts are clamped to the minimum
+
+    quiet = [interval.observe(0, interval.seconds) for _ in range(20)]
+    assert quiet == sorted(quiet)
+    assert quiet[-1] == 1000
+
+
+@pytest.mark.integration
+def test_interval_without_history_waits_the_maximum_when_idle():
+    interval = AdaptiveInterval(30, 600)
+
+    assert interval.seconds == 30
+    assert interval.observe(0, 30) == 600
+
+
+@pytest.mark.integration
+def test_count_new_entries_uses_the_watermark(monkeypatch, tmp_path):
+    FakeSite(pages=1).install(monkeypatch)
+    scraper = scrape_module.Scraper(max_entries=0)
+    watermark = watermark_module.ResultWatermark(tmp_path / "watermark.json")
+
+    assert watch_module.count_new_entries(scraper, watermark) == 2
+    watermark.advance([result_url(1, 0)])
+    assert watch_module.count_new_entries(scraper, watermark) == 1
+
+    monkeypatch.setattr(scrape_module.Scraper, "_get_html", lambda _scraper, _url: None)
+    assert watch_module.count_new_entries(scraper, watermark) is None
+
+
+@pytest.mark.integration
+def test_watch_refreshes_only_when_page_one_changes(capsys):
+    probes = iter([0, 3, None, 0])
+    refreshes = []
+    sleeps = []
+    now = [0.0]
+
+    def refresh():
+        refreshes.append(now[0])
+        return 4
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    stored = watch_module.watch(
+        lambda: next(probes),
+        refresh,
+        AdaptiveInterval(10, 100, target_entries=1),
+        max_polls=4,
+        sleep=sleep,
+        clock=lambda: now[0],
+    )
+
+    assert stored == 4
+    assert refreshes == [100.0]
+    assert sleeps[0] == 100 and sleeps[1] < 100
+    assert len(sleeps) == 3
+    output = capsys.readouterr().out
+    assert "Poll 2: 4 new" in output
+    assert "Poll 3: poll failed" in output
+
+
+@pytest.mark.integration
+def test_watch_survives_a_refresh_that_raises(capsys):
+    outcomes = iter([ConnectionError("database went away"), 2])
+    sleeps = []
+
+    def refresh():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    interval = AdaptiveInterval(10, 100, target_entries=1)
+    interval.seconds = 40
+    stored = watch_module.watch(
+        lambda: 2, refresh, interval, max_polls=2, sleep=sleeps.append, clock=lambda: 0.0
+    )
+
+    assert stored == 2
+    assert sleeps == [40]
+    output = capsys.readouterr().out
+    assert "Watch cycle failed: ConnectionError: database went away" in output
+    assert "Poll 1: poll failed; next poll in 40s." in output
+    assert "Poll 2: 2 new" in output
+
+
+@pytest.mark.integration
+def test_run_pipeline_inserts_only_new_rows(main_environment, mock_db):
+    assert watch_module.run_pipeline("postgresql://example/gradcafe") == 1
+
+    assert len(mock_db.inserted_rows) == 1
+    assert mock_db.inserted_rows[0][3] == "https://www.thegradcafe.com/result/12345"
+    assert not any("TRUNCATE" in query for query, _ in mock_db.queries)
+    assert mock_db.commit_calls == 1
+
+
+@pytest.mark.integration
+def test_main_polls_until_the_limit(monkeypatch, tmp_path, mock_db):
+    monkeypatch.setattr(watch_module.pipeline, "CACHE_FILE", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(watch_module.pipeline, "WATERMARK_FILE", tmp_path / "watermark.json")
+    monkeypatch.setattr(watch_module.time, "sleep", lambda _seconds: None)
+    monkeypatch.setattr(watch_module, "run_pipeline", lambda *_args: 2)
+    FakeSite(pages=1).install(monkeypatch)
+
+    assert watch_module.main(["--max-polls", "2", "--min-interval", "0"]) == 4
+    migration = "ADD COLUMN IF NOT EXISTS duplicate_cluster"
+    assert any(migration in query for query, _ in mock_db.queries)
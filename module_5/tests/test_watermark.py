@@ -0,0 +1,83 @@
+"""Tests for the result-ID watermark used by incremental scrapes."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tests.import_utils import import_module
+from tests.test_scrape_clean_main import main_environment  # pylint: disable=unused-import
+from tests.test_scrape_pipeline import FakeSite, result_url
+
+watermark_module = import_module("homework_sample_code.course_app.watermark")
+scrape_module = import_module("homework_sample_code.course_app.scrape")
+main_module = import_module("homework_sample_code.course_app.main")
+
+ResultWatermark = watermark_module.ResultWatermark
+Scraper = scrape_module.Scraper
+
+
+@pytest.mark.integration
+def test_result_id_parses_gradcafe_urls():
+    assert watermark_module.result_id("https://www.thegradcafe.com/result/935454") == 935454
+    assert watermark_module.result_id("https://example.test/about") is None
+    assert watermark_module.result_id("") is None
+
+
+@pytest.mark.integration
+def test_watermark_window_and_persistence(tmp_path):
+    path = tmp_path / "watermark.json"
+    watermark = ResultWatermark(path, tolerance=10)
+    assert not watermark.is_set
+    assert not watermark.has_seen(result_url(1))
+
+    watermark.advance(["/result/100", "/result/95", "/result/80", "https://example.test/x"])
+    watermark.save(entry_count=4)
+
+    reloaded = ResultWatermark(path, tolerance=10)
+    assert (reloaded.max_id, reloaded.floor, reloaded.entry_count) == (100, 90, 4)
+    assert json.loads(path.read_text(encoding="utf-8"))["recent"] == [100, 95]
+    assert reloaded.has_seen("/result/95")
+    assert not reloaded.has_seen("/result/96")  # late insert inside the window
+    assert reloaded.is_below("/result/89")
+    assert not reloaded.is_below("https://example.test/x")
+
+
+@pytest.mark.integration
+def test_scraper_skips_known_ids_and_stops_below_the_window(monkeypatch, tmp_path):
+    site = FakeSite(pages=50).install(monkeypatch)
+    watermark = ResultWatermark(tmp_path / "watermark.json", tolerance=5)
+    watermark.advance([result_url(2, 0)])
+
+    results = Scraper(max_entries=100, watermark=watermark).scrape_data()
+
+    assert [entry["url_raw"] for entry in results] == [
+        result_url(1, 0),
+        result_url(1, 1),
+        result_url(2, 1),
+    ]
+    assert site.requested == [1, 2, 3]
+
+
+@pytest.mark.integration
+def test_main_seeds_watermark_then_skips_the_dataset_load(main_environment, monkeypatch, capsys):
+    main_module.main()
+
+    watermark = ResultWatermark(main_environment.watermark)
+    assert watermark.max_id == 12345
+    assert watermark.entry_count == 2
+    assert "Loaded 1 existing entries." in capsys.readouterr().out
+
+    def fail_load():
+        raise AssertionError("the dataset should not be loaded once a watermark exists")
+
+    monkeypatch.setattr(main_module, "_load_existing_urls", fail_load)
+    main_module.main()
+
+    output = capsys.readouterr().out
+    assert "Resuming after result 12345 (2 existing entries)." in output
+    assert "Total entries after merge: 3" in output
+    assert ResultWatermark(main_environment.watermark).entry_count == 3